@@ -0,0 +1,31 @@
+"""Helpers shared by the bench-* scripts in this directory."""
+
+from typing import Any, Iterator, Union
+
+import pyarrow as pa
+
+import tiledbsoma as soma
+
+
+def check_readable(obj: soma.SOMAObject) -> Union[soma.DataFrame, soma.SparseNDArray]:
+    """Returns the object if it is a DataFrame or SparseNDArray; raises
+    ``TypeError`` otherwise.
+    """
+    if not isinstance(obj, (soma.DataFrame, soma.SparseNDArray)):
+        raise TypeError(
+            f"{obj.uri} is a {obj.soma_type}, not a DataFrame or SparseNDArray"
+        )
+    return obj
+
+
+def read_tables(obj: soma.SOMAObject, *args: Any, **kwargs: Any) -> Iterator[pa.Table]:
+    """Reads a DataFrame or SparseNDArray as Arrow tables, passing the given
+    arguments to its ``read``.
+    """
+    obj = check_readable(obj)
+    tables: Iterator[pa.Table]
+    if isinstance(obj, soma.DataFrame):
+        tables = obj.read(*args, **kwargs)
+    else:
+        tables = obj.read(*args, **kwargs).tables()
+    return tables
@@ -16,7 +16,9 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -462,20 +464,57 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
         except KeyError:
             raise KeyError(err_str) from None
         if entry.soma is None:
-            from . import _factory  # Delayed binding to resolve circular import.
+            self._cache_element(key, self._open_element(key))
+        return cast(CollectionElementType, entry.soma)
 
-            uri = entry.entry.uri
-            mode = self.mode
-            context = self.context
-            timestamp = self.tiledb_timestamp_ms
-            clib_type = entry.entry.wrapper_type.clib_type
+    def prefetch(
+        self, keys: Optional[Iterable[str]] = None, *, recursive: bool = False
+    ) -> Self:
+        """Opens children of this collection concurrently.
 
-            wrapper = _tdb_handles.open(uri, mode, context, timestamp, clib_type)
-            entry.soma = _factory.reify_handle(wrapper)
+        Children are otherwise opened one at a time, as they are accessed.
+        This opens those of the given keys (or all of them) that are not yet
+        open together on the context's thread pool, so that their round trips
+        to storage overlap. If ``recursive``, the descendants of the children
+        are opened too, one level of the tree at a time.
 
-            # Since we just opened this object, we own it and should close it.
-            self._close_stack.enter_context(entry.soma)
-        return cast(CollectionElementType, entry.soma)
+        Args:
+            keys:
+                The keys of the children to open. Defaults to all children.
+            recursive:
+                Whether to also open all the descendants of the children.
+
+        Returns:
+            ``self``, for chaining.
+
+        Raises:
+            KeyError:
+                If a key is not in the collection.
+
+        Lifecycle:
+            Experimental.
+        """
+        if keys is None:
+            keys = list(self._contents)
+        else:
+            keys = list(keys)
+            for key in keys:
+                if key not in self._contents:
+                    raise KeyError(f"{self.__class__.__name__} has no item {key!r}")
+
+        level: List[Tuple[CollectionBase[Any], str]] = [(self, key) for key in keys]
+        while level:
+            self._prefetch_elements(level)
+            if not recursive:
+                break
+            children = (coll._contents[key].soma for coll, key in level)
+            level = [
+                (child, child_key)
+                for child in children
+                if isinstance(child, CollectionBase)
+                for child_key in child._contents
+            ]
+        return self
 
     def set(
         self,
@@ -559,6 +598,76 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
     # PRIVATE METHODS FROM HERE ON DOWN
     # ================================================================
 
+    def _open_element(self, key: str) -> AnySOMAObject:
+        """Opens the child at the given key, without caching it."""
+        from . import _factory  # Delayed binding to resolve circular import.
+
+        entry = self._contents[key].entry
+        wrapper = _tdb_handles.open(
+            entry.uri,
+            self.mode,
+            self.context,
+            self.tiledb_timestamp_ms,
+            entry.wrapper_type.clib_type,
+        )
+        return _factory.reify_handle(wrapper)
+
+    def _cache_element(self, key: str, soma_object: AnySOMAObject) -> None:
+        """Caches a child opened by :meth:`_open_element`."""
+        self._contents[key].soma = soma_object
+        # Since we just opened this object, we own it and should close it.
+        self._close_stack.enter_context(soma_object)
+
+    def _prefetch_structure(self) -> None:
+        """Opens the collections below this one concurrently, one level of
+        the tree at a time. Arrays are left unopened: their URIs and whether
+        they are arrays come from the member listings of their collections,
+        and they are opened as they are accessed.
+        """
+        colls: List[CollectionBase[Any]] = [self]
+        while colls:
+            level = [
+                (coll, key)
+                for coll in colls
+                for key, element in coll._contents.items()
+                if issubclass(element.entry.wrapper_type, _tdb_handles.SOMAGroupWrapper)
+            ]
+            self._prefetch_elements(level)
+            colls = [
+                cast(CollectionBase[Any], coll._contents[key].soma)
+                for coll, key in level
+            ]
+
+    def _prefetch_elements(
+        self, elements: Sequence[Tuple["CollectionBase[Any]", str]]
+    ) -> None:
+        """Opens the given children of collections concurrently.
+
+        All the children are opened, and those that could be opened are
+        cached, before the first error is raised.
+        """
+        unopened = [
+            (coll, key) for coll, key in elements if coll._contents[key].soma is None
+        ]
+        if len(unopened) == 1:
+            coll, key = unopened[0]
+            coll._cache_element(key, coll._open_element(key))
+            return
+
+        pool = self.context.threadpool
+        futures = [
+            (coll, key, pool.submit(coll._open_element, key)) for coll, key in unopened
+        ]
+        error: Optional[BaseException] = None
+        for coll, key, future in futures:
+            try:
+                coll._cache_element(key, future.result())
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
     def _my_repr(self) -> str:
         start = super()._my_repr()
         if self.closed:
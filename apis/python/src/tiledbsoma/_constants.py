@@ -10,3 +10,5 @@ SOMA_JOINID = "soma_joinid"
 SOMA_OBJECT_TYPE_METADATA_KEY = "soma_object_type"
 SOMA_ENCODING_VERSION_METADATA_KEY = "soma_encoding_version"
 SOMA_ENCODING_VERSION = "1"
+SOMA_ID_INDEX_COLUMN_METADATA_KEY = "soma_id_index_column"
+SOMA_ID_INDEX_URI_METADATA_KEY = "soma_id_index_uri"
@@ -9,17 +9,23 @@ Implementation of a SOMA DataFrame
 from typing import Any, List, Optional, Sequence, Tuple, Type, Union, cast
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
+import pyarrow.compute as pacomp
 import somacore
 from somacore import options
 from typing_extensions import Self
 
 from . import _arrow_types, _util
 from . import pytiledbsoma as clib
-from ._constants import SOMA_JOINID
+from ._constants import (
+    SOMA_ID_INDEX_COLUMN_METADATA_KEY,
+    SOMA_ID_INDEX_URI_METADATA_KEY,
+    SOMA_JOINID,
+)
 from ._exception import SOMAError, map_exception_for_create
 from ._query_condition import QueryCondition
-from ._read_iters import TableReadIter
+from ._read_iters import AsyncTableReadIter, TableReadIter, _SplitReader
 from ._soma_array import SOMAArray
 from ._tdb_handles import DataFrameWrapper
 from ._types import NPFloating, NPInteger, OpenTimestamp, Slice, is_slice_of
@@ -348,9 +354,16 @@ class DataFrame(SOMAArray, somacore.DataFrame):
             value_filter:
                 An optional [value filter] to apply to the results.
                 Defaults to no filter.
+            batch_size:
+                An optional :class:`BatchSize` hint limiting the number of
+                rows (``count``) or buffer bytes (``bytes``) returned by each
+                read batch. Defaults to automatic sizing.
             partitions:
                 An optional :class:`ReadPartitions` hint to indicate
-                how results should be organized.
+                how results should be organized. ``IOfN(i, n)`` reads only
+                the ``i``-th of ``n`` disjoint slices of the first index
+                column, taken from ``coords`` or, if that is unconstrained,
+                the non-empty domain.
 
         Returns:
             A :class:`TableReadIter` that can be used to iterate through the result set.
@@ -384,34 +397,92 @@ class DataFrame(SOMAArray, somacore.DataFrame):
         Lifecycle:
             Maturing.
         """
-        del batch_size  # Currently unused.
-        _util.check_unpartitioned(partitions)
-        self._check_open_read()
+        return TableReadIter(
+            self._reader(
+                coords,
+                column_names,
+                result_order=result_order,
+                value_filter=value_filter,
+                batch_size=batch_size,
+                partitions=partitions,
+                platform_config=platform_config,
+            )
+        )
 
-        handle = self._handle._handle
+    def read_async(
+        self,
+        coords: options.SparseDFCoords = (),
+        column_names: Optional[Sequence[str]] = None,
+        *,
+        result_order: options.ResultOrderStr = options.ResultOrder.AUTO,
+        value_filter: Optional[str] = None,
+        batch_size: options.BatchSize = _UNBATCHED,
+        partitions: Optional[options.ReadPartitions] = None,
+        platform_config: Optional[options.PlatformConfig] = None,
+    ) -> AsyncTableReadIter:
+        """Reads like :meth:`read`, but returns the results through an
+        asynchronous iterator, for use on an asyncio event loop.
 
-        context = handle.context()
-        if platform_config is not None:
-            config = context.tiledb_config.copy()
-            config.update(platform_config)
-            context = clib.SOMAContext(config)
-
-        sr = clib.SOMADataFrame.open(
-            uri=handle.uri,
-            mode=clib.OpenMode.read,
-            context=context,
-            column_names=column_names or [],
-            result_order=_util.to_clib_result_order(result_order),
-            timestamp=handle.timestamp and (0, handle.timestamp),
+        The reader is set up before this returns; each batch is then read
+        while the event loop runs other tasks, so that one loop can serve
+        many concurrent reads::
+
+            async for tbl in sdf.read_async(value_filter="tissue == 'lung'"):
+                ...
+            tbl = await sdf.read_async(coords=[slice(0, 99)]).concat()
+
+        The dataframe must stay open until the iterator is exhausted.
+
+        Returns:
+            An :class:`AsyncTableReadIter` of the result set.
+
+        Lifecycle:
+            Experimental.
+        """
+        return AsyncTableReadIter(
+            self._reader(
+                coords,
+                column_names,
+                result_order=result_order,
+                value_filter=value_filter,
+                batch_size=batch_size,
+                partitions=partitions,
+                platform_config=platform_config,
+            )
         )
 
-        if value_filter is not None:
-            sr.set_condition(QueryCondition(value_filter), handle.schema)
+    def _reader(
+        self,
+        coords: options.SparseDFCoords,
+        column_names: Optional[Sequence[str]],
+        *,
+        result_order: options.ResultOrderStr,
+        value_filter: Optional[str],
+        batch_size: options.BatchSize,
+        partitions: Optional[options.ReadPartitions],
+        platform_config: Optional[options.PlatformConfig],
+    ) -> Union[clib.SOMAArray, _SplitReader]:
+        """Returns a reader of the given read, for :meth:`read` and
+        :meth:`read_async`.
+        """
+        self._check_open_read()
+        coords = self._partition_coords(coords, partitions)
 
-        self._set_reader_coords(sr, coords)
+        handle = self._handle._handle
+        clib_batch_size = _util.to_clib_batch_size(batch_size)
+
+        def open_reader() -> clib.SOMAArray:
+            sr = self._open_reader(
+                column_names=column_names or (),
+                result_order=result_order,
+                batch_size=clib_batch_size,
+                platform_config=platform_config,
+            )
+            if value_filter is not None:
+                sr.set_condition(QueryCondition(value_filter), handle.schema)
+            return sr
 
-        # # TODO: batch_size
-        return TableReadIter(sr)
+        return self._split_reader(open_reader(), coords, open_reader)
 
     def write(
         self, values: pa.Table, platform_config: Optional[options.PlatformConfig] = None
@@ -470,6 +541,93 @@ class DataFrame(SOMAArray, somacore.DataFrame):
 
         return self
 
+    def lookup_ids(
+        self,
+        values: Union[Sequence[Any], npt.NDArray[Any], pa.Array, pa.ChunkedArray],
+        *,
+        column_name: Optional[str] = None,
+    ) -> npt.NDArray[np.int64]:
+        """Returns the ``soma_joinid`` of the row holding each of the given IDs.
+
+        If this dataframe has a persisted ID index (as written by
+        ``tiledbsoma.io.from_anndata(..., id_index=True)``), the IDs are
+        resolved with a single point read of the index, rather than a scan of
+        the dataframe. Otherwise, the ``column_name`` column is scanned.
+
+        Args:
+            values:
+                The IDs to look up, e.g., cell barcodes or gene symbols.
+            column_name:
+                The column holding the IDs. Defaults to the indexed column.
+
+        Returns:
+            An int64 array of the ``soma_joinid`` of each value, in the order
+            of ``values``, with ``-1`` for values not found.
+
+        Raises:
+            ValueError:
+                If ``column_name`` is not given and there is no ID index.
+            SOMAError:
+                If the object is not open for reading.
+
+        Examples:
+            >>> with tiledbsoma.Experiment.open("an_experiment") as exp:
+            ...     joinids = exp.obs.lookup_ids(["AAACCTG-1", "AAACGGG-1"])
+            ...     q = exp.axis_query("RNA", obs_query=AxisQuery(coords=(joinids,)))
+
+        Lifecycle:
+            Experimental.
+        """
+        self._check_open_read()
+        index_column_name = self.metadata.get(SOMA_ID_INDEX_COLUMN_METADATA_KEY)
+        if column_name is None:
+            if index_column_name is None:
+                raise ValueError(
+                    f"{self.uri} has no ID index; specify the column_name to scan"
+                )
+            column_name = index_column_name
+
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        elif not isinstance(values, pa.Array):
+            values = pa.array(values)
+        keys = pacomp.unique(values.drop_null())
+        if len(keys) == 0:
+            return np.full(len(values), -1, dtype=np.int64)
+
+        index_uri = self._id_index_uri()
+        if column_name == index_column_name and index_uri is not None:
+            with DataFrame.open(
+                index_uri,
+                context=self.context,
+                tiledb_timestamp=self.tiledb_timestamp_ms,
+            ) as index:
+                keys = keys.cast(index.schema.field(column_name).type)
+                found = index.read(
+                    (keys,), column_names=[column_name, SOMA_JOINID]
+                ).concat()
+        else:
+            found = self.read(column_names=[column_name, SOMA_JOINID]).concat()
+
+        found_ids = found[column_name]
+        if pa.types.is_dictionary(found_ids.type):
+            found_ids = found_ids.cast(found_ids.type.value_type)
+        positions = pacomp.index_in(
+            values.cast(found_ids.type), value_set=found_ids.combine_chunks()
+        )
+        joinids = pacomp.take(found[SOMA_JOINID], positions).fill_null(-1)
+        return cast(npt.NDArray[np.int64], joinids.to_numpy())
+
+    def _id_index_uri(self) -> Optional[str]:
+        """Returns the URI of this dataframe's ID index, if it has one.
+
+        Relative URIs name a sibling of this dataframe.
+        """
+        uri = self.metadata.get(SOMA_ID_INDEX_URI_METADATA_KEY)
+        if uri is None or not _util.is_relative_uri(uri):
+            return uri
+        return _util.uri_joinpath(self.uri.rstrip("/").rsplit("/", 1)[0], uri)
+
     def _set_reader_coord(
         self,
         sr: clib.SOMAArray,
@@ -8,16 +8,19 @@
 import functools
 from typing import Any, Optional
 
-from somacore import experiment, query
-from typing_extensions import Self
+from somacore import experiment, options, query
+from typing_extensions import Literal, Self
 
 from . import _tdb_handles
 from ._collection import Collection, CollectionBase
 from ._dataframe import DataFrame
-from ._indexer import IntIndexer
+from ._indexer import _cached_int_indexer
+from ._joinid_cache import _share_query_joinids
 from ._measurement import Measurement
 from ._soma_object import AnySOMAObject
 from ._tdb_handles import Wrapper
+from ._types import OpenTimestamp
+from .options import SOMATileDBContext
 
 
 class Experiment(  # type: ignore[misc]  # __eq__ false positive
@@ -72,6 +75,58 @@ class Experiment(  # type: ignore[misc]  # __eq__ false positive
         "ms": ("SOMACollection",),
     }
 
+    @classmethod
+    def open(
+        cls,
+        uri: str,
+        mode: options.OpenMode = "r",
+        *,
+        tiledb_timestamp: Optional[OpenTimestamp] = None,
+        context: Optional[SOMATileDBContext] = None,
+        platform_config: Optional[options.PlatformConfig] = None,
+        clib_type: Optional[str] = None,
+        prefetch: Optional[Literal["structure"]] = None,
+    ) -> Self:
+        """Opens an experiment.
+
+        Takes the arguments of :meth:`SOMAObject.open`, and:
+
+        Args:
+            prefetch:
+                With ``"structure"``, every collection in the experiment is
+                opened up front, concurrently and one level of the tree at a
+                time, loading the member URIs and metadata of each. Arrays
+                are not opened: navigating the experiment, as in
+                ``exp.ms["RNA"].X``, is served from the opened collections,
+                and the arrays reached, such as ``exp.ms["RNA"].X["data"]``,
+                are opened as they are accessed. By default, collections are
+                also opened one at a time as they are accessed.
+
+        Raises:
+            ValueError:
+                If ``prefetch`` is not ``None`` or ``"structure"``.
+
+        Lifecycle:
+            Experimental.
+        """
+        if prefetch not in (None, "structure"):
+            raise ValueError(f"prefetch must be None or 'structure', not {prefetch!r}")
+        exp = super().open(
+            uri,
+            mode,
+            tiledb_timestamp=tiledb_timestamp,
+            context=context,
+            platform_config=platform_config,
+            clib_type=clib_type,
+        )
+        if prefetch == "structure":
+            try:
+                exp._prefetch_structure()
+            except BaseException:
+                exp.close()
+                raise
+        return exp
+
     @classmethod
     def _set_create_metadata(cls, handle: Wrapper[Any]) -> None:
         # Root SOMA objects include a `dataset_type` entry to allow the
@@ -89,15 +144,22 @@ class Experiment(  # type: ignore[misc]  # __eq__ false positive
         """Creates an axis query over this experiment.
         Lifecycle: Maturing.
         """
+        scope = (self.uri, self.tiledb_timestamp_ms)
         # mypy doesn't quite understand descriptors so it issues a spurious
         # error here.
-        return query.ExperimentAxisQuery(  # type: ignore
+        axis_query = query.ExperimentAxisQuery(  # type: ignore
             self,
             measurement_name,
             obs_query=obs_query or query.AxisQuery(),
             var_query=var_query or query.AxisQuery(),
             index_factory=functools.partial(
-                IntIndexer,
-                context=self.context,
+                _cached_int_indexer, context=self.context, scope=scope
             ),
         )
+        _share_query_joinids(
+            axis_query,
+            self.context.joinid_cache,
+            scope=scope,
+            measurement_name=measurement_name,
+        )
+        return axis_query
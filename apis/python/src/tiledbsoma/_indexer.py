@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+import collections
+import hashlib
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import numpy.typing as npt
@@ -73,16 +86,134 @@ class IntIndexer:
         )
         self._reindexer.map_locations(data)
 
-    def get_indexer(self, target: IndexerDataType) -> Any:
+    def get_indexer(
+        self,
+        target: IndexerDataType,
+        *,
+        out: Optional[npt.NDArray[np.int64]] = None,
+    ) -> Any:
         """Compute underlying indices of index for target data.
 
         Compatible with Pandas' Index.get_indexer method.
 
+        The lookup does not hold the GIL, so it may run concurrently with other
+        Python threads. Arrow inputs are looked up in place, chunk by chunk,
+        and the result can be wrapped with ``pyarrow.array`` without a copy.
+
         Args:
             target: Data to return re-index data for.
+            out: Optional C-contiguous int64 array, of the same length as
+                ``target``, to write the result into. It is returned.
         """
-        return (
-            self._reindexer.get_indexer_pyarrow(target)
-            if isinstance(target, (pa.Array, pa.ChunkedArray))
-            else self._reindexer.get_indexer_general(target)
-        )
+        if isinstance(target, (pa.Array, pa.ChunkedArray)):
+            if target.type != pa.int64():
+                target = target.cast(pa.int64())
+            return self._reindexer.get_indexer_pyarrow(target, out)
+        return self._reindexer.get_indexer_general(target, out)
+
+
+# Estimated memory use of an indexer per key: the khash table holds a 64-bit
+# key and value per bucket, at a load factor of at most 0.8 rounded up to a
+# power of two buckets.
+_INDEXER_BYTES_PER_KEY = 40
+
+
+class IntIndexerCache:
+    """A least-recently-used cache of :class:`IntIndexer` objects, bounded by
+    their estimated memory use.
+
+    Indexers are keyed by a caller-provided scope, e.g., an array URI and
+    timestamp, and a digest of their keys, so an indexer is only reused for an
+    identical sequence of keys.
+
+    Lifecycle:
+        Experimental.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            Tuple[Hashable, int, bytes], Tuple[IntIndexer, int]
+        ] = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        data: IndexerDataType,
+        *,
+        scope: Hashable,
+        build: Callable[[npt.NDArray[np.int64]], IntIndexer],
+    ) -> IntIndexer:
+        """Returns the cached indexer of ``data`` in ``scope``, calling
+        ``build`` to create (and cache) it if there is none.
+        """
+        keys = _int64_keys(data)
+        nbytes = len(keys) * _INDEXER_BYTES_PER_KEY
+        if self.max_bytes <= 0 or nbytes > self.max_bytes:
+            return build(keys)
+
+        digest = hashlib.blake2b(keys.data, digest_size=16).digest()
+        cache_key = (scope, len(keys), digest)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Build outside of the lock. Concurrent misses on the same keys may
+        # build the indexer more than once, but all get a usable one.
+        indexer = build(keys)
+        with self._lock:
+            if cache_key not in self._entries:
+                self._entries[cache_key] = (indexer, nbytes)
+                self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+        return indexer
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the ``hits`` and ``misses`` of the cache, and the
+        ``entries`` and estimated ``bytes`` it holds.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        """Drops all cached indexers."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _int64_keys(data: IndexerDataType) -> npt.NDArray[np.int64]:
+    """Private. Materializes indexer keys as a contiguous int64 ndarray."""
+    if isinstance(data, (pa.Array, pa.ChunkedArray)):
+        data = data.to_numpy()
+    return np.ascontiguousarray(data, dtype=np.int64)
+
+
+def _cached_int_indexer(
+    data: IndexerDataType, *, context: "SOMATileDBContext", scope: Hashable
+) -> IntIndexer:
+    """Private. Returns an indexer of ``data`` from the context's indexer
+    cache, building it on a miss, or directly if the cache is disabled.
+    """
+    cache = context.indexer_cache
+    if cache.max_bytes <= 0:
+        return IntIndexer(data, context=context)
+    return cache.get(
+        data,
+        scope=scope,
+        build=lambda keys: IntIndexer(keys, context=context),
+    )
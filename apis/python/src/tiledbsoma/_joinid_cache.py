@@ -0,0 +1,236 @@
+# Copyright (c) 2021-2024 The Chan Zuckerberg Initiative Foundation
+# Copyright (c) 2021-2024 TileDB, Inc.
+#
+# Licensed under the MIT License.
+
+"""A cache of the ``soma_joinid`` values resolved by experiment axis queries.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import threading
+import warnings
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import attrs
+import numpy as np
+import pyarrow as pa
+from somacore.query import axis
+from somacore.query import query as somacore_query
+
+
+class JoinIDCache:
+    """A least-recently-used cache of the ``soma_joinid`` arrays selected by
+    axis queries, bounded by their size in bytes.
+
+    Entries are keyed by the experiment URI and timestamp, the axis (and, for
+    ``var``, the measurement) and the value filter and coords of the query, so
+    a query issued again against an experiment opened at the same timestamp
+    does not read the axis dataframe again to resolve its joinids.
+
+    Lifecycle:
+        Experimental.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[Hashable, pa.Array] = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[pa.Array]:
+        """Returns the cached joinids for ``key``, or ``None``."""
+        with self._lock:
+            joinids = self._entries.get(key)
+            if joinids is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return joinids
+
+    def put(self, key: Hashable, joinids: pa.Array) -> None:
+        """Caches the joinids for ``key``, evicting the least recently used
+        entries to stay within ``max_bytes``.
+        """
+        nbytes = joinids.nbytes
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = joinids
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the ``hits`` and ``misses`` of the cache, and the
+        ``entries`` and ``bytes`` it holds.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        """Drops all cached joinids."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+@attrs.define
+class _SharedJoinIDs(somacore_query._JoinIDCache):
+    """Private. The joinids of one query, backed by a shared cache.
+
+    Joinids that the query loads, or reads alongside other columns, are
+    stored in the shared cache under the key of their axis.
+
+    This replaces the private joinid cache of somacore's
+    ``ExperimentAxisQuery``, and relies on its internals: see
+    ``_somacore_supports_sharing``, which is checked before each use.
+    """
+
+    shared: Optional[JoinIDCache] = None
+    keys: Dict[str, Hashable] = attrs.field(factory=dict)
+
+    @property
+    def obs(self) -> pa.Array:
+        if self._cached_obs is None:
+            self._cached_obs = self._load("obs")
+        return self._cached_obs
+
+    @obs.setter
+    def obs(self, val: pa.Array) -> None:
+        self._cached_obs = val
+        self._store("obs", val)
+
+    @property
+    def var(self) -> pa.Array:
+        if self._cached_var is None:
+            self._cached_var = self._load("var")
+        return self._cached_var
+
+    @var.setter
+    def var(self, val: pa.Array) -> None:
+        self._cached_var = val
+        self._store("var", val)
+
+    def _load(self, axis_name: str) -> pa.Array:
+        key = self.keys.get(axis_name)
+        if self.shared is not None and key is not None:
+            joinids = self.shared.get(key)
+            if joinids is not None:
+                return joinids
+        df = self.owner._obs_df if axis_name == "obs" else self.owner._var_df
+        joinids = somacore_query._load_joinids(
+            df, getattr(self.owner._matrix_axis_query, axis_name)
+        )
+        self._store(axis_name, joinids)
+        return joinids
+
+    def _store(self, axis_name: str, joinids: pa.Array) -> None:
+        key = self.keys.get(axis_name)
+        if self.shared is not None and key is not None:
+            self.shared.put(key, joinids)
+
+
+def _share_query_joinids(
+    query: somacore_query.ExperimentAxisQuery[Any],
+    cache: JoinIDCache,
+    *,
+    scope: Hashable,
+    measurement_name: str,
+) -> None:
+    """Private. Backs the joinids of the query with the shared cache.
+
+    Queries with coords that cannot be keyed are not cached.
+    """
+    if cache.max_bytes <= 0:
+        return
+    if not _somacore_supports_sharing(query):
+        warnings.warn(
+            "The joinid cache does not support this version of somacore;"
+            " axis query joinids are not cached.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return
+    axis_queries = query._matrix_axis_query
+    keys: Dict[str, Hashable] = {}
+    obs_key = _axis_query_key(axis_queries.obs)
+    if obs_key is not None:
+        keys["obs"] = (scope, "obs", obs_key)
+    var_key = _axis_query_key(axis_queries.var)
+    if var_key is not None:
+        keys["var"] = (scope, "var", measurement_name, var_key)
+    if keys:
+        query._joinids = _SharedJoinIDs(query, shared=cache, keys=keys)
+
+
+def _somacore_supports_sharing(query: somacore_query.ExperimentAxisQuery[Any]) -> bool:
+    """Private. Returns whether the query has the somacore internals that
+    ``_SharedJoinIDs`` builds on: a ``_joinids`` attribute that is exactly
+    the ``_JoinIDCache`` it subclasses, with its ``owner``, ``_cached_obs``
+    and ``_cached_var`` fields, a ``_matrix_axis_query`` with the ``obs`` and
+    ``var`` axis queries, and the module's ``_load_joinids`` function.
+    """
+    joinids = getattr(query, "_joinids", None)
+    axis_queries = getattr(query, "_matrix_axis_query", None)
+    if type(joinids) is not somacore_query._JoinIDCache:
+        return False
+    fields = {field.name for field in attrs.fields(somacore_query._JoinIDCache)}
+    return (
+        fields == {"owner", "_cached_obs", "_cached_var"}
+        and joinids.owner is query
+        and isinstance(getattr(axis_queries, "obs", None), axis.AxisQuery)
+        and isinstance(getattr(axis_queries, "var", None), axis.AxisQuery)
+        and callable(getattr(somacore_query, "_load_joinids", None))
+    )
+
+
+def _axis_query_key(axq: axis.AxisQuery) -> Optional[Tuple[Hashable, ...]]:
+    """Private. Returns a hashable key for the axis query, or ``None`` if its
+    coords are not of a keyable type.
+    """
+    coords = tuple(_coord_key(coord) for coord in axq.coords)
+    if any(coord is _UNKEYABLE for coord in coords):
+        return None
+    return (axq.value_filter, coords)
+
+
+_UNKEYABLE = object()
+
+
+def _coord_key(coord: object) -> Hashable:
+    """Private. Returns a hashable key for a single coord."""
+    if coord is None or isinstance(coord, (int, float, str, bytes)):
+        return (type(coord).__name__, coord)
+    if isinstance(coord, slice):
+        try:
+            hash((coord.start, coord.stop, coord.step))
+        except TypeError:
+            return _UNKEYABLE
+        return ("slice", coord.start, coord.stop, coord.step)
+    if not isinstance(coord, (pa.Array, pa.ChunkedArray, np.ndarray, Sequence)):
+        return _UNKEYABLE
+    points = np.asarray(coord)
+
+    if points.dtype.hasobject:
+        data = "\0".join(map(repr, points.ravel())).encode()
+    else:
+        data = np.ascontiguousarray(points).tobytes()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return ("points", points.dtype.str, points.shape, digest)
@@ -7,7 +7,20 @@
 filtering query results on attribute values.
 """
 import ast
-from typing import Any, Callable, List, Optional, Tuple, Union
+import collections
+import functools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import attrs
 import numpy as np
@@ -19,6 +32,10 @@ from ._util import pa_types_is_string_or_bytes
 
 QueryConditionNodeElem = Union[ast.Name, ast.Constant, ast.NameConstant, ast.Call]
 
+# Number of parsed expressions, and of compiled conditions, kept for reuse by
+# later reads with the same value filter.
+_COMPILED_CACHE_SIZE = 256
+
 
 @attrs.define
 class QueryCondition:
@@ -104,15 +121,21 @@ class QueryCondition:
             # Note this is equivalent to:
             # "foo == 1 or foo == 2 or foo == 3"
             foo_123 = dataframe.read(value_filter="foo in [1, 2, 3]")
+
+    Equality and membership predicates on enumerated (categorical) columns
+    are rewritten to compare the enumeration codes, so they are resolved
+    against the enumeration once rather than by every query. Set
+    ``enumeration_codes=False`` to compare the values instead.
     """
 
     expression: str
+    enumeration_codes: bool = attrs.field(default=True, kw_only=True)
     tree: ast.Expression = attrs.field(init=False, repr=False)
     c_obj: clib.PyQueryCondition = attrs.field(init=False, repr=False)
 
     def __attrs_post_init__(self):
         try:
-            self.tree = ast.parse(self.expression, mode="eval")
+            self.tree = _parse_expression(self.expression)
         except Exception as pex:
             raise SOMAError(
                 "Could not parse the given QueryCondition statement: "
@@ -129,26 +152,151 @@ class QueryCondition:
         self,
         schema: pa.Schema,
         query_attrs: Optional[List[str]],
+        enumeration_values: Optional[Callable[[str], Optional[Sequence[Any]]]] = None,
+        enumeration_version: Optional[Callable[[str], Optional[Hashable]]] = None,
     ):
+        if not self.enumeration_codes:
+            enumeration_values = None
+        if query_attrs is None:
+            query_attrs = []
+
+        # Conditions compiled for the same expression and schema are reused,
+        # as long as the enumerations they resolved codes from are unchanged.
+        key = (self.expression, enumeration_values is not None, schema)
+        compiled = _compiled_conditions.get(key)
+        if compiled is None or not compiled.is_current(enumeration_version):
+            compiled = self._compile(schema, enumeration_values, enumeration_version)
+            _compiled_conditions.put(key, compiled)
+
+        self.c_obj = compiled.c_obj
+        for att in compiled.query_attrs:
+            if att not in query_attrs:
+                query_attrs.append(att)
+        return query_attrs
+
+    def _compile(
+        self,
+        schema: pa.Schema,
+        enumeration_values: Optional[Callable[[str], Optional[Sequence[Any]]]],
+        enumeration_version: Optional[Callable[[str], Optional[Hashable]]],
+    ) -> "_CompiledCondition":
+        enumerations: Dict[str, Optional[Hashable]] = {}
+        # Without versions to check, conditions resolving codes aren't reused
+        reusable = True
+
+        def recording_enumeration_values(att: str) -> Optional[Sequence[Any]]:
+            nonlocal reusable
+            assert enumeration_values is not None
+            if enumeration_version is None:
+                reusable = False
+            else:
+                enumerations[att] = enumeration_version(att)
+            return enumeration_values(att)
+
+        referenced_attrs: List[str] = []
         try:
-            qctree = QueryConditionTree(schema, query_attrs)
-            self.c_obj = qctree.visit(self.tree.body)
+            qctree = QueryConditionTree(
+                schema,
+                referenced_attrs,
+                None if enumeration_values is None else recording_enumeration_values,
+            )
+            c_obj = qctree.visit(self.tree.body)
         except Exception as pex:
             raise SOMAError(pex)
 
-        if not isinstance(self.c_obj, clib.PyQueryCondition):
+        if not isinstance(c_obj, clib.PyQueryCondition):
             raise SOMAError(
                 "Malformed query condition statement. A query condition must "
                 "be made up of one or more boolean expressions."
             )
 
-        return query_attrs
+        return _CompiledCondition(
+            c_obj, tuple(referenced_attrs), enumerations, reusable
+        )
+
+
+@functools.lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Private. Parses a query condition expression. Parsed trees are only
+    read by ``QueryConditionTree``, so they are shared between conditions.
+    """
+    return ast.parse(expression, mode="eval")
+
+
+@attrs.frozen
+class _CompiledCondition:
+    """Private. A query condition compiled against a schema."""
+
+    c_obj: clib.PyQueryCondition
+    # The attributes referenced by the condition, in order of reference
+    query_attrs: Tuple[str, ...]
+    # The versions of the enumerations that predicates were resolved to codes
+    # against, as returned by ``SOMAArray.enumeration_version``
+    enumerations: Dict[str, Optional[Hashable]]
+    # Whether the enumeration versions are known
+    reusable: bool = True
+
+    def is_current(
+        self,
+        enumeration_version: Optional[Callable[[str], Optional[Hashable]]],
+    ) -> bool:
+        """Returns whether the enumerations of the array being read are those
+        this condition was compiled against. Only their versions are compared,
+        so the enumeration values are not loaded.
+        """
+        if not self.reusable:
+            return False
+        if not self.enumerations:
+            return True
+        if enumeration_version is None:
+            return False
+        return all(
+            enumeration_version(att) == version
+            for att, version in self.enumerations.items()
+        )
+
+
+class _CompiledConditionCache:
+    """Private. A least-recently-used cache of compiled query conditions."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[Hashable, _CompiledCondition] = (
+            collections.OrderedDict()
+        )
+
+    def get(self, key: Hashable) -> Optional[_CompiledCondition]:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+            return compiled
+
+    def put(self, key: Hashable, compiled: _CompiledCondition) -> None:
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_compiled_conditions = _CompiledConditionCache(_COMPILED_CACHE_SIZE)
 
 
 @attrs.define
 class QueryConditionTree(ast.NodeVisitor):
     schema: pa.Schema
     query_attrs: List[str]
+    # Returns the enumeration values of a column, or None if it has none
+    enumeration_values: Optional[Callable[[str], Optional[Sequence[Any]]]] = None
+    _enumeration_positions: Dict[str, Optional[Dict[Any, int]]] = attrs.field(
+        factory=dict, init=False
+    )
 
     def visit_BitOr(self, node):
         return clib.TILEDB_OR
@@ -258,7 +406,13 @@ class QueryConditionTree(ast.NodeVisitor):
                 self.query_attrs.append(att)
 
             op = clib.TILEDB_IN if isinstance(operator, ast.In) else clib.TILEDB_NOT_IN
-            result = self.create_pyqc(dtype)(node.left.id, values, op)
+            codes = self.enumeration_codes(att, values)
+            if codes is None:
+                result = self.create_pyqc(dtype)(node.left.id, values, op)
+            else:
+                index_dtype, indices = codes
+                result = self.create_pyqc(index_dtype)(att, indices, op)
+                result.set_use_enumeration(False)
 
         else:
             raise SOMAError(f"unrecognized operator in <<{ast.dump(node)}>>")
@@ -287,10 +441,50 @@ class QueryConditionTree(ast.NodeVisitor):
         val = self.cast_val_to_dtype(val, dtype)
 
         pyqc = clib.PyQueryCondition()
-        self.init_pyqc(pyqc, dtype)(att, val, op)
+        codes = None
+        if op in (clib.TILEDB_EQ, clib.TILEDB_NE):
+            codes = self.enumeration_codes(att, [val])
+        if codes is None:
+            self.init_pyqc(pyqc, dtype)(att, val, op)
+        else:
+            index_dtype, indices = codes
+            self.init_pyqc(pyqc, index_dtype)(att, indices[0], op)
+            pyqc.set_use_enumeration(False)
 
         return pyqc
 
+    def enumeration_codes(
+        self, att: str, values: Sequence[Any]
+    ) -> Optional[Tuple[str, List[int]]]:
+        """Maps the values compared to an enumerated column to their codes.
+
+        Returns the dtype name of the column's codes and the sorted codes of
+        the values found in its enumeration -- or ``None`` if the column is
+        not enumerated, or none of the values are in the enumeration, in which
+        case the predicate must compare the values.
+        """
+        if self.enumeration_values is None:
+            return None
+        dt = self.schema.field(att).type
+        if not pa.types.is_dictionary(dt):
+            return None
+
+        if att not in self._enumeration_positions:
+            enumeration = self.enumeration_values(att)
+            self._enumeration_positions[att] = (
+                None
+                if enumeration is None
+                else {value: code for code, value in enumerate(enumeration)}
+            )
+        positions = self._enumeration_positions[att]
+        if positions is None:
+            return None
+
+        codes = sorted({positions[value] for value in values if value in positions})
+        if not codes:
+            return None
+        return np.dtype(dt.index_type.to_pandas_dtype()).name, codes
+
     def is_att_node(self, att: QueryConditionNodeElem) -> bool:
         if isinstance(att, ast.Call):
             if not isinstance(att.func, ast.Name):
@@ -8,10 +8,14 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import itertools
+import threading
 from concurrent import futures
 from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
+    AsyncIterator,
     Dict,
     Iterator,
     List,
@@ -26,6 +30,7 @@ from typing import (
 import numpy as np
 import numpy.typing as npt
 import pyarrow as pa
+import pyarrow.compute as pacomp
 import somacore
 from scipy import sparse
 from somacore import options
@@ -36,7 +41,7 @@ import tiledbsoma.pytiledbsoma as clib
 
 from . import _util
 from ._exception import SOMAError
-from ._indexer import IntIndexer
+from ._indexer import IntIndexer, _cached_int_indexer
 from ._types import NTuple
 from .options import SOMATileDBContext
 
@@ -48,6 +53,8 @@ if TYPE_CHECKING:
 _RT = TypeVar("_RT")
 BlockwiseTableReadIterResult = Tuple[pa.Table, Tuple[pa.Array, ...]]
 BlockwiseSingleAxisTableIter = Iterator[BlockwiseTableReadIterResult]
+# A tile's table and joinids, and the indexer of each axis to reindex
+BlockwiseTileReadResult = Tuple[pa.Table, Tuple[pa.Array, ...], Dict[int, IntIndexer]]
 
 BlockwiseScipyReadIterResult = Tuple[
     Union[sparse.csr_matrix, sparse.csc_matrix, sparse.coo_matrix],
@@ -60,10 +67,172 @@ IJDType = Tuple[
 ]
 
 
+class _SplitReader:
+    """Private. Reads the sub-queries of a split read concurrently on a
+    threadpool. Like a ``clib.SOMAArray``, ``read_next`` returns tables until
+    exhausted: those of each sub-query in turn, or, if ``sort_keys`` is
+    given, those of all sub-queries merged in the order of those columns.
+
+    Each sub-query reads at most one table ahead of the caller, so memory use
+    is bounded by a table per sub-query rather than by the whole result.
+    """
+
+    def __init__(
+        self,
+        readers: Sequence[clib.SOMAArray],
+        pool: ThreadPoolExecutor,
+        sort_keys: Optional[Sequence[str]] = None,
+    ):
+        self._readers = readers
+        self._pool = pool
+        self._sort_keys = sort_keys
+        self._tables: Optional[Iterator[pa.Table]] = None
+
+    def read_next(self) -> Optional[pa.Table]:
+        if self._tables is None:
+            self._tables = self._read()
+        return next(self._tables, None)
+
+    def _read(self) -> Iterator[pa.Table]:
+        streams = [
+            self._prefetching(sr, self._pool.submit(sr.read_next))
+            for sr in self._readers
+        ]
+        if self._sort_keys is None:
+            for stream in streams:
+                yield from stream
+            return
+
+        heads = {}
+        for i, stream in enumerate(streams):
+            tbl = next(stream, None)
+            if tbl is not None:
+                heads[i] = tbl
+        empty = True
+        while heads:
+            tbl, drained = _take_sorted(heads, self._sort_keys)
+            for i in drained:
+                tbl_next = next(streams[i], None)
+                if tbl_next is None:
+                    del heads[i]
+                else:
+                    heads[i] = tbl_next
+            # Empty steps are skipped, but an empty result is still a table
+            if len(tbl) or (empty and not heads):
+                empty = False
+                yield tbl
+
+    def _prefetching(
+        self, sr: clib.SOMAArray, read: futures.Future[Optional[pa.Table]]
+    ) -> Iterator[pa.Table]:
+        """Yields the tables of a sub-query, reading the next on the pool
+        while the caller consumes the current one.
+        """
+        while True:
+            # A read still queued is run in this thread, so the read
+            # completes even if every pool thread is waiting on another read.
+            tbl = sr.read_next() if read.cancel() else read.result()
+            if tbl is None:
+                return
+            read = self._pool.submit(sr.read_next)
+            yield tbl
+
+    async def read_async(self) -> AsyncIterator[pa.Table]:
+        """Reads the sub-queries concurrently on the running event loop, and
+        yields their tables as ``read_next`` would.
+        """
+        streams = [
+            _prefetching_async(sr, asyncio.ensure_future(_read_next_async(sr)))
+            for sr in self._readers
+        ]
+        if self._sort_keys is None:
+            for stream in streams:
+                async for tbl in stream:
+                    yield tbl
+            return
+
+        heads = {}
+        for i, stream in enumerate(streams):
+            tbl = await _anext(stream)
+            if tbl is not None:
+                heads[i] = tbl
+        empty = True
+        while heads:
+            tbl, drained = _take_sorted(heads, self._sort_keys)
+            for i in drained:
+                tbl_next = await _anext(streams[i])
+                if tbl_next is None:
+                    del heads[i]
+                else:
+                    heads[i] = tbl_next
+            # Empty steps are skipped, but an empty result is still a table
+            if len(tbl) or (empty and not heads):
+                empty = False
+                yield tbl
+
+
+def _take_sorted(
+    heads: Dict[int, pa.Table], sort_keys: Sequence[str]
+) -> Tuple[pa.Table, List[int]]:
+    """Private. One step of a k-way merge of streams of tables, each sorted
+    by ``sort_keys``.
+
+    ``heads`` holds the current table of each stream. Takes, sorted, the rows
+    of all heads up to the smallest of their last keys: no later table of any
+    stream can sort before those. Returns them and the streams whose head was
+    taken entirely, leaving the rest of each head in ``heads``. While any
+    head is empty, only the empty heads are taken, as the next table of their
+    stream is still unknown.
+    """
+    bound = None
+    if all(len(tbl) for tbl in heads.values()):
+        last = min(
+            heads,
+            key=lambda i: tuple(heads[i][key][-1].as_py() for key in sort_keys),
+        )
+        bound = [heads[last][key][-1] for key in sort_keys]
+
+    parts = []
+    drained = []
+    for i, tbl in heads.items():
+        num_rows = 0
+        if bound is not None:
+            num_rows = _count_sorted_until(tbl, sort_keys, bound)
+        parts.append(tbl.slice(0, num_rows))
+        heads[i] = tbl.slice(num_rows)
+        if num_rows == len(tbl):
+            drained.append(i)
+
+    taken = pa.concat_tables(parts)
+    if len(parts) > 1:
+        taken = taken.sort_by([(key, "ascending") for key in sort_keys])
+    return taken, drained
+
+
+def _count_sorted_until(
+    tbl: pa.Table, sort_keys: Sequence[str], bound: Sequence[pa.Scalar]
+) -> int:
+    """Private. Returns the number of leading rows of ``tbl``, sorted by
+    ``sort_keys``, whose keys sort at or before ``bound``.
+    """
+    # Lexicographic comparison, built from the last key outwards
+    mask = pacomp.less_equal(tbl[sort_keys[-1]], bound[-1])
+    for key, value in zip(sort_keys[-2::-1], bound[-2::-1]):
+        column = tbl[key]
+        mask = pacomp.or_(
+            pacomp.less(column, value),
+            pacomp.and_(pacomp.equal(column, value), mask),
+        )
+    return int(pacomp.sum(mask).as_py() or 0)
+
+
+_Reader = Union[clib.SOMAArray, _SplitReader]
+
+
 class TableReadIter(somacore.ReadIter[pa.Table]):
     """Iterator over `Arrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`_ elements"""
 
-    def __init__(self, sr: clib.SOMAArray):
+    def __init__(self, sr: _Reader):
         self._reader = _arrow_table_reader(sr)
 
     def __next__(self) -> pa.Table:
@@ -74,11 +243,46 @@ class TableReadIter(somacore.ReadIter[pa.Table]):
         return pa.concat_tables(self)
 
 
+class AsyncTableReadIter:
+    """Asynchronous iterator over `Arrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`_
+    elements, for use with ``async for`` on an asyncio event loop.
+
+    Each batch is read natively while the event loop is free to run other
+    tasks, with no thread held per read, so one loop can have many reads in
+    flight.
+
+    Cancelling the task awaiting a batch does not interrupt its native read,
+    which runs to completion in the background; the reader is released once
+    it has, without blocking the event loop.
+
+    Lifecycle:
+        Experimental.
+    """
+
+    def __init__(self, sr: _Reader):
+        self._reader = _arrow_table_reader_async(sr)
+
+    def __aiter__(self) -> AsyncTableReadIter:
+        return self
+
+    async def __anext__(self) -> pa.Table:
+        return await self._reader.__anext__()
+
+    async def concat(self) -> pa.Table:
+        """Concatenate remainder of iterator, and return as a single `Arrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`_"""
+        return pa.concat_tables([tbl async for tbl in self])
+
+
 _EagerRT = TypeVar("_EagerRT")
 
 
 class BlockwiseReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
-    """Private implementation class. Currently implemented as a single-axis blockwise iterator"""
+    """Private implementation class.
+
+    Iterates over blocks of the first of the given axes. If further axes are
+    given, each of those blocks is read as a sequence of tiles, one for each
+    combination of blocks of the other axes.
+    """
 
     _reader: Iterator[_RT]
 
@@ -128,18 +332,34 @@ class BlockwiseReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
                         )
                     )
                 )
-                if d != self.major_axis
+                if d not in self.axis
                 else np.array([], dtype=np.int64)
             )
             for d in range(self.ndim)
         ]
 
-        # build indexers, as needed
+        # build indexers, as needed. They come from the context's indexer
+        # cache, if there is a context, so repeated iteration over the same
+        # coords reuses them.
         self.axes_to_reindex = set(range(self.ndim)) - set(self.reindex_disable_on_axis)
-        assert context is not None
+        self._indexer_scope = (array.uri, array.tiledb_timestamp_ms)
         self.minor_axes_indexer = {
-            d: IntIndexer(self.joinids[d].to_numpy(), context=context)
-            for d in (self.axes_to_reindex - set((self.major_axis,)))
+            d: self._indexer(self.joinids[d].to_numpy())
+            for d in (self.axes_to_reindex - set(self.axis))
+        }
+
+        # The blocks of the other blockwise axes are revisited for every block
+        # of the major axis, so their joinids and indexers are built once and
+        # shared by all tiles.
+        self.blocks: Dict[int, List[Tuple[pa.Array, Optional[IntIndexer]]]] = {
+            d: [
+                (
+                    pa.array(block),
+                    self._indexer(block) if d in self.axes_to_reindex else None,
+                )
+                for block in _coords_strider(self.coords[d], self.sr.shape[d], size)
+            ]
+            for d, size in zip(self.axis[1:], self.size[1:])
         }
 
         # Ask subclass to create the type-specific reader/iterator
@@ -175,11 +395,8 @@ class BlockwiseReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
                 "reindex_disable_on_axis must be None, int or Sequence[int]"
             )
 
-        # Currently, only support blockwise iteration on one dimension.
-        if len(axis) != 1:
-            raise NotImplementedError(
-                "Multi-dimension blockwise iterators not implemented"
-            )
+        if not axis or len(set(axis)) != len(axis):
+            raise ValueError("blockwise `axis` values must be distinct")
         # all dim indices must be in acceptable range
         if not all(0 <= d < ndim for d in axis):
             raise ValueError("blockwise `axis` value must be in range [0, ndim)")
@@ -204,6 +421,14 @@ class BlockwiseReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
 
         return axis, size, reindex_disable_on_axis
 
+    def _indexer(self, joinids: npt.NDArray[np.int64]) -> IntIndexer:
+        """Private. Returns the (cached) indexer of the given joinids."""
+        if self.context is None:
+            return IntIndexer(joinids)
+        return _cached_int_indexer(
+            joinids, context=self.context, scope=self._indexer_scope
+        )
+
     @abc.abstractmethod
     def _create_reader(self) -> Iterator[_RT]:
         """Sub-class responsibility"""
@@ -225,45 +450,71 @@ class BlockwiseReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
         """Private"""
         return EagerIterator(x, pool=_pool) if self.eager else x
 
-    def _table_reader(self) -> Iterator[BlockwiseTableReadIterResult]:
-        """Private. Blockwise table reader. Helper function for sub-class use"""
-        kwargs: Dict[str, object] = {"result_order": self.sr.result_order}
+    def _tile_reader(self, reindex: bool) -> Iterator[BlockwiseTileReadResult]:
+        """Private. Blockwise tile reader. Helper function for sub-class use.
+
+        Yields each tile's table and joinids and, if ``reindex``, the indexer
+        of each axis to reindex. The major-axis indexer of a block is shared
+        by all of its tiles.
+        """
+        kwargs: Dict[str, object] = {
+            "batch_size": self.sr.batch_size,
+            "result_order": self.sr.result_order,
+        }
+        tile_axes = self.axis[1:]
         for coord_chunk in _coords_strider(
             self.coords[self.major_axis],
             self.sr.shape[self.major_axis],
             self.size[0],
         ):
-            self.sr.reset(**kwargs)
-            step_coords = list(self.coords)
-            step_coords[self.major_axis] = coord_chunk
-            self.array._set_reader_coords(self.sr, step_coords)
+            major_joinids = pa.array(coord_chunk)
+            indexers: Dict[int, IntIndexer] = {}
+            if reindex:
+                indexers.update(self.minor_axes_indexer)
+                if self.major_axis in self.axes_to_reindex:
+                    indexers[self.major_axis] = self._indexer(coord_chunk)
+
+            for blocks in itertools.product(*(self.blocks[d] for d in tile_axes)):
+                self.sr.reset(**kwargs)
+                step_coords = list(self.coords)
+                step_coords[self.major_axis] = coord_chunk
+                joinids = list(self.joinids)
+                joinids[self.major_axis] = major_joinids
+                tile_indexers = dict(indexers)
+                for d, (block_joinids, block_indexer) in zip(tile_axes, blocks):
+                    step_coords[d] = block_joinids.to_numpy()
+                    joinids[d] = block_joinids
+                    if reindex and block_indexer is not None:
+                        tile_indexers[d] = block_indexer
+                self.array._set_reader_coords(self.sr, step_coords)
+
+                yield (
+                    pa.concat_tables(_arrow_table_reader(self.sr)),
+                    tuple(joinids),
+                    tile_indexers,
+                )
 
-            joinids = list(self.joinids)
-            joinids[self.major_axis] = pa.array(coord_chunk)
-            yield pa.concat_tables(_arrow_table_reader(self.sr)), tuple(joinids)
+    def _table_reader(self) -> Iterator[BlockwiseTableReadIterResult]:
+        """Private. Blockwise table reader. Helper function for sub-class use"""
+        for tbl, joinids, _ in self._tile_reader(reindex=False):
+            yield tbl, joinids
 
     def _reindexed_table_reader(
         self,
         _pool: Optional[ThreadPoolExecutor] = None,
     ) -> Iterator[BlockwiseTableReadIterResult]:
         """Private. Blockwise table reader w/ reindexing. Helper function for sub-class use"""
-        for tbl, coords in self._maybe_eager_iterator(self._table_reader(), _pool):
+        for tbl, joinids, indexers in self._maybe_eager_iterator(
+            self._tile_reader(reindex=True), _pool
+        ):
             pytbl = {}
             for d in range(self.ndim):
                 col = tbl.column(f"soma_dim_{d}")
-                if d in self.axes_to_reindex:
-                    if d == self.major_axis:
-                        assert self.context is not None
-                        col = IntIndexer(
-                            coords[self.major_axis], context=self.context
-                        ).get_indexer(
-                            col.to_numpy(),
-                        )
-                    else:
-                        col = self.minor_axes_indexer[d].get_indexer(col.to_numpy())
+                if d in indexers:
+                    col = indexers[d].get_indexer(col)
                 pytbl[f"soma_dim_{d}"] = col
             pytbl["soma_data"] = tbl.column("soma_data")
-            yield pa.Table.from_pydict(pytbl), coords
+            yield pa.Table.from_pydict(pytbl), joinids
 
 
 class BlockwiseTableReadIter(BlockwiseReadIterBase[BlockwiseTableReadIterResult]):
@@ -398,27 +649,40 @@ class BlockwiseScipyReadIter(BlockwiseReadIterBase[BlockwiseScipyReadIterResult]
     def _cs_reader(
         self, _pool: Optional[ThreadPoolExecutor] = None
     ) -> Iterator[Tuple[Union[sparse.csr_matrix, sparse.csc_matrix], IndicesType],]:
-        """Private. Compressed sparse variants"""
+        """Private. Compressed sparse variants.
+
+        Each block is reindexed and counting-sorted directly into CSR/CSC
+        buffers by ``clib.compress_coo``, which scipy takes over without
+        copying.
+        """
         assert self.compress
         assert self.major_axis not in self.reindex_disable_on_axis
-        for ((i, j), d), indices in self._maybe_eager_iterator(
-            self._sorted_tbl_reader(_pool), _pool
+        cls = sparse.csr_matrix if self.major_axis == 0 else sparse.csc_matrix
+        for tbl, joinids, indexers in self._maybe_eager_iterator(
+            self._tile_reader(reindex=True), _pool
         ):
+            indices = (joinids[0].to_numpy(), joinids[1].to_numpy())
             major_coords = indices[self.major_axis]
             minor_coords = indices[self.minor_axis]
-            cls = sparse.csr_matrix if self.major_axis == 0 else sparse.csc_matrix
-            sp = cls(
-                sparse.coo_matrix(
-                    (d, (i, j)), shape=self._mk_shape(major_coords, minor_coords)
-                )
+            shape = self._mk_shape(major_coords, minor_coords)
+            minor_indexer = indexers.get(self.minor_axis)
+            indptr, minor, data = clib.compress_coo(
+                indexers[self.major_axis]._reindexer,
+                None if minor_indexer is None else minor_indexer._reindexer,
+                (shape[self.major_axis], shape[self.minor_axis]),
+                tbl.column(f"soma_dim_{self.major_axis}").to_numpy(),
+                tbl.column(f"soma_dim_{self.minor_axis}").to_numpy(),
+                tbl.column("soma_data").to_numpy(),
             )
+            sp = cls((data, minor, indptr), shape=shape, copy=False)
+            sp.has_sorted_indices = True
             yield sp, indices
 
 
 class SparseTensorReadIterBase(somacore.ReadIter[_RT], metaclass=abc.ABCMeta):
     """Private implementation class"""
 
-    def __init__(self, sr: clib.SOMAArray, shape: NTuple):
+    def __init__(self, sr: _Reader, shape: NTuple):
         self.sr = sr
         self.shape = shape
 
@@ -457,7 +721,7 @@ class SparseCOOTensorReadIter(SparseTensorReadIterBase[pa.SparseCOOTensor]):
         return pa.SparseCOOTensor.from_numpy(coo_data, coo_coords, shape=self.shape)
 
 
-def _arrow_table_reader(sr: clib.SOMAArray) -> Iterator[pa.Table]:
+def _arrow_table_reader(sr: _Reader) -> Iterator[pa.Table]:
     """Private. Simple Table iterator on any Array"""
     tbl = sr.read_next()
     while tbl is not None:
@@ -465,6 +729,120 @@ def _arrow_table_reader(sr: clib.SOMAArray) -> Iterator[pa.Table]:
         tbl = sr.read_next()
 
 
+async def _arrow_table_reader_async(sr: _Reader) -> AsyncIterator[pa.Table]:
+    """Private. Asynchronous Table iterator on any Array"""
+    if isinstance(sr, _SplitReader):
+        async for tbl in sr.read_async():
+            yield tbl
+        return
+    tbl = await _read_next_async(sr)
+    while tbl is not None:
+        yield tbl
+        tbl = await _read_next_async(sr)
+
+
+async def _prefetching_async(
+    sr: clib.SOMAArray, read: asyncio.Future[Optional[pa.Table]]
+) -> AsyncIterator[pa.Table]:
+    """Private. Yields the tables of a reader, reading the next while the
+    caller consumes the current one.
+    """
+    try:
+        while True:
+            tbl = await read
+            if tbl is None:
+                return
+            read = asyncio.ensure_future(_read_next_async(sr))
+            yield tbl
+    finally:
+        read.cancel()
+
+
+async def _anext(tables: AsyncIterator[pa.Table]) -> Optional[pa.Table]:
+    """Private. Like ``next(tables, None)`` for an asynchronous iterator."""
+    try:
+        return await tables.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def _read_next_async(sr: clib.SOMAArray) -> Optional[pa.Table]:
+    """Private. Like ``sr.read_next()``, but waits for the read on the running
+    event loop rather than blocking it.
+    """
+    await _read_completions.submit_next(sr)
+    return sr.read_next()
+
+
+class _ReadCompletions:
+    """Private. Resolves the futures of reads submitted by event loops.
+
+    Native reads pass their token to ``clib.wait_read_done`` as they
+    complete. A single daemon thread waits for those tokens and resolves the
+    future of each read on its event loop.
+
+    Each running read also holds its reader until it completes. A reader
+    can't be finalized during a read without waiting for it, so the reader of
+    a read whose waiting task was cancelled is released by the daemon thread
+    rather than by the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reads: Dict[int, Tuple[asyncio.Future[None], clib.SOMAArray]] = {}
+        self._tokens = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    async def submit_next(self, sr: clib.SOMAArray) -> None:
+        """Submits the next read of the reader, if it has one, and waits for
+        it to complete.
+        """
+        future = asyncio.get_running_loop().create_future()
+        token = next(self._tokens)
+        with self._lock:
+            self._reads[token] = (future, sr)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tiledbsoma-read-completions", daemon=True
+                )
+                self._thread.start()
+        submitted = False
+        try:
+            submitted = sr.submit_next(token)
+        finally:
+            if not submitted:
+                # No read is running, so its token will never complete.
+                with self._lock:
+                    del self._reads[token]
+        # If this is cancelled, the read keeps running, and the daemon thread
+        # releases it once it completes.
+        await future
+
+    def _run(self) -> None:
+        while True:
+            token = clib.wait_read_done()
+            with self._lock:
+                future, sr = self._reads.pop(token)
+            # Drop the reader here, so a reader abandoned by a cancelled task
+            # is finalized on this thread once its read is complete.
+            del sr
+            if future.cancelled():
+                continue
+            try:
+                future.get_loop().call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                # The event loop was closed.
+                pass
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_read_completions = _ReadCompletions()
+
+
 def _coords_strider(
     coords: options.SparseNDCoord, length: int, stride: int
 ) -> Iterator[npt.NDArray[np.int64]]:
@@ -483,18 +861,8 @@ def _coords_strider(
     # and the equality check is broadcast to all elements of the array.
     if coords is None or (isinstance(coords, slice) and coords == slice(None)):
         coords = slice(0, length - 1)
-    elif isinstance(coords, int):
-        coords = np.array([coords], dtype=np.int64)
-    elif isinstance(coords, Sequence):
-        coords = np.array(coords, dtype=np.int64)
-    elif isinstance(coords, (pa.Array, pa.ChunkedArray)):
-        coords = coords.to_numpy().astype(np.int64, copy=False)
-    elif isinstance(coords, np.ndarray):
-        coords = coords.astype(np.int64)
-    elif isinstance(coords, slice):
-        pass
-    else:
-        raise TypeError("Unsupported slice coordinate type")
+    elif not isinstance(coords, slice):
+        coords = _coord_points(coords)
 
     if isinstance(coords, slice):
         _util.validate_slice(coords)  # NB: this enforces step == 1, assumed below
@@ -511,6 +879,61 @@ def _coords_strider(
             yield cast(npt.NDArray[np.int64], coords[i : i + stride])
 
 
+def _coord_points(coords: options.SparseNDCoord) -> npt.NDArray[np.int64]:
+    """Private. Materializes a non-slice coordinate as an int64 ndarray of points."""
+    if isinstance(coords, int):
+        return np.array([coords], dtype=np.int64)
+    if isinstance(coords, Sequence):
+        return np.array(coords, dtype=np.int64)
+    if isinstance(coords, (pa.Array, pa.ChunkedArray)):
+        points: npt.NDArray[np.int64] = coords.to_numpy().astype(np.int64, copy=False)
+        return points
+    if isinstance(coords, np.ndarray):
+        return coords.astype(np.int64)
+    raise TypeError("Unsupported slice coordinate type")
+
+
+def _partition_coord(
+    coords: options.SparseNDCoord,
+    non_empty_domain: Optional[Tuple[int, int]],
+    partition: options.IOfN,
+) -> Union[slice, npt.NDArray[np.int64]]:
+    """
+    Private.
+
+    Returns partition ``i`` of ``n`` of a single dimension's coordinates. The
+    partitions are contiguous, disjoint and together cover the original
+    coordinates, so ``n`` independent readers each scan about ``1/n`` of them.
+
+    Slices (and ``None``) are clipped to the non-empty domain and split into
+    closed sub-slices; points are split by position, in the order given.
+    An empty partition is returned as an empty array of points.
+    """
+    i, n = partition.i, partition.n
+
+    if coords is None or isinstance(coords, slice):
+        if coords is None:
+            coords = slice(None)
+        _util.validate_slice(coords)
+        if non_empty_domain is None:
+            # Nothing has been written; every partition is empty.
+            return np.array([], dtype=np.int64)
+        lo, hi = non_empty_domain
+        if coords.start is not None:
+            lo = max(lo, coords.start)
+        if coords.stop is not None:
+            hi = min(hi, coords.stop)
+        count = max(hi - lo + 1, 0)
+        start = lo + count * i // n
+        stop = lo + count * (i + 1) // n - 1
+        if stop < start:
+            return np.array([], dtype=np.int64)
+        return slice(start, stop)
+
+    points = _coord_points(coords)
+    return points[len(points) * i // n : len(points) * (i + 1) // n]
+
+
 _ElemT = TypeVar("_ElemT")
 
 
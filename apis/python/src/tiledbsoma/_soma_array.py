@@ -3,8 +3,9 @@
 #
 # Licensed under the MIT License.
 
-from typing import Any, Optional, Sequence, Tuple
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pyarrow as pa
 from somacore import options
 from typing_extensions import Self
@@ -13,10 +14,16 @@ from . import _tdb_handles, _util
 
 # This package's pybind11 code
 from . import pytiledbsoma as clib  # noqa: E402
+from ._read_iters import _coord_points, _partition_coord, _SplitReader
 from ._soma_object import SOMAObject
 from ._types import OpenTimestamp, is_nonstringy_sequence
 from .options._soma_tiledb_context import SOMATileDBContext
 
+# Reads of points coalescing into more than this many ranges are split into
+# concurrent sub-queries of about this many ranges each.
+_SPLIT_READ_RANGES = 8192
+_SPLIT_READ_MAX_QUERIES = 8
+
 
 class SOMAArray(SOMAObject[_tdb_handles.SOMAArrayWrapper[Any]]):
     """Base class for all SOMAArrays: DataFrame and NDarray.
@@ -86,6 +93,193 @@ class SOMAArray(SOMAObject[_tdb_handles.SOMAArrayWrapper[Any]]):
     def _tiledb_domain(self) -> Tuple[Tuple[Any, Any], ...]:
         return self._handle.domain
 
+    def _open_reader(
+        self,
+        *,
+        column_names: Sequence[str] = (),
+        result_order: options.ResultOrderStr = options.ResultOrder.AUTO,
+        batch_size: str = "auto",
+        platform_config: Optional[options.PlatformConfig] = None,
+    ) -> clib.SOMAArray:
+        """Returns a new reader of this array.
+
+        Readers normally open the array again. If reads are opted into handle
+        reuse (``soma.read_reuse_handle`` in the TileDB config), and
+        ``platform_config`` does not call for a different context, readers
+        are instead cloned from this object's handle: they share its opened
+        array, so no schema or fragment metadata is loaded. Such readers must
+        be consumed before this object is closed.
+        """
+        handle = self._handle._handle
+        clib_result_order = _util.to_clib_result_order(result_order)
+
+        if platform_config is None and self._handle.reuse_handle:
+            sr = handle.clone()
+            sr.reset(
+                column_names=list(column_names),
+                batch_size=batch_size,
+                result_order=clib_result_order,
+            )
+            return sr
+
+        context = handle.context()
+        if platform_config is not None:
+            config = context.config()
+            config.update(platform_config)
+            context = clib.SOMAContext(config)
+
+        sr = type(handle).open(
+            uri=handle.uri,
+            mode=clib.OpenMode.read,
+            context=context,
+            column_names=list(column_names),
+            result_order=clib_result_order,
+            timestamp=handle.timestamp and (0, handle.timestamp),
+        )
+        if batch_size != "auto":
+            sr.reset(
+                column_names=list(column_names),
+                batch_size=batch_size,
+                result_order=sr.result_order,
+            )
+        return sr
+
+    def _partition_coords(
+        self,
+        coords: Sequence[object],
+        partitions: Optional[options.ReadPartitions],
+    ) -> Sequence[object]:
+        """Restricts the given coords to the requested read partition.
+
+        Partitions split the first dimension -- the requested coords, or the
+        non-empty domain when it is unconstrained -- into disjoint pieces, so
+        independent readers can each scan one of them without coordination.
+        """
+        if partitions is None:
+            return coords
+        if not isinstance(partitions, options.IOfN):
+            raise ValueError(f"Unsupported read partitions {partitions!r}")
+        if partitions.n == 1:
+            return coords
+        if not is_nonstringy_sequence(coords):
+            raise TypeError(
+                f"coords type {type(coords)} must be a regular sequence,"
+                " not str or bytes"
+            )
+
+        dim = self.schema.field(0)
+        if not pa.types.is_integer(dim.type):
+            raise ValueError(
+                f"Partitioned reads require an integer first dimension;"
+                f" {dim.name} is {dim.type}"
+            )
+
+        ned = self.non_empty_domain()
+        dim_ned = (int(ned[0][0]), int(ned[0][1])) if ned else None
+        coord = _partition_coord(coords[0] if coords else None, dim_ned, partitions)
+        if not isinstance(coord, slice):
+            coord = coord.astype(dim.type.to_pandas_dtype(), copy=False)
+
+        return (coord, *coords[1:])
+
+    def _split_reader(
+        self,
+        sr: clib.SOMAArray,
+        coords: Sequence[object],
+        open_reader: Callable[[], clib.SOMAArray],
+    ) -> Union[clib.SOMAArray, _SplitReader]:
+        """Sets the coords on the given reader and returns it.
+
+        Reads of many scattered integer points are dominated by TileDB's
+        per-range cost rather than by I/O. They are instead split into
+        concurrent sub-queries, on ``sr`` and on readers made by
+        ``open_reader``, each selecting a disjoint part of the points.
+        """
+        split = self._split_point_coords(sr, coords)
+        if split is None:
+            self._set_reader_coords(sr, coords)
+            return sr
+
+        split_coords, sort_keys = split
+        if len(split_coords) == 1:
+            self._set_reader_coords(sr, split_coords[0])
+            return sr
+        readers = [sr] + [open_reader() for _ in split_coords[1:]]
+        for reader, reader_coords in zip(readers, split_coords):
+            self._set_reader_coords(reader, reader_coords)
+        return _SplitReader(readers, self.context.threadpool, sort_keys)
+
+    def _split_point_coords(
+        self, sr: clib.SOMAArray, coords: Sequence[object]
+    ) -> Optional[Tuple[List[Sequence[object]], Optional[List[str]]]]:
+        """Splits the points of the dimension with the most points.
+
+        Returns the coords of each sub-query, and the columns to sort the
+        concatenated results by to restore the reader's result order -- or
+        ``None`` if the coords are to be read as given. The split points are
+        sorted and unique, which spares the reader from sorting them again;
+        a read with enough points to consider splitting that is not split
+        is returned as a single sub-query of such points.
+        """
+        if not is_nonstringy_sequence(coords) or len(coords) > self._handle.ndim:
+            return None
+
+        # Fewer points than a sub-query's ranges can't be worth splitting, so
+        # only the dimension with the most points is sorted to count ranges.
+        best: Optional[Tuple[int, int]] = None
+        for dim_idx, coord in enumerate(coords):
+            if coord is None or isinstance(coord, (int, slice, str, bytes)):
+                continue
+            if not pa.types.is_integer(self.schema.field(dim_idx).type):
+                continue
+            if isinstance(coord, np.ndarray) and coord.ndim != 1:
+                continue
+            try:
+                num_points = len(coord)
+            except TypeError:
+                continue
+            if num_points <= _SPLIT_READ_RANGES:
+                continue
+            if best is None or num_points > best[0]:
+                best = (num_points, dim_idx)
+
+        if best is None:
+            return None
+        _, dim_idx = best
+        try:
+            points = np.unique(_coord_points(coords[dim_idx]))
+        except (TypeError, ValueError):
+            return None
+        dtype = self.schema.field(dim_idx).type.to_pandas_dtype()
+        num_ranges = int(np.count_nonzero(np.diff(points) != 1)) + 1
+        n = min(-(-num_ranges // _SPLIT_READ_RANGES), _SPLIT_READ_MAX_QUERIES)
+        if n < 2:
+            sorted_coords = list(coords)
+            sorted_coords[dim_idx] = points.astype(dtype, copy=False)
+            return [sorted_coords], None
+
+        # Each sub-query returns its results in the reader's order, so their
+        # concatenation is ordered if the split dimension sorts first.
+        dim_names = list(self._tiledb_dim_names())
+        sort_keys: Optional[List[str]] = None
+        if sr.result_order == clib.ResultOrder.rowmajor and dim_idx != 0:
+            sort_keys = dim_names
+        elif (
+            sr.result_order == clib.ResultOrder.colmajor
+            and dim_idx != len(dim_names) - 1
+        ):
+            sort_keys = dim_names[::-1]
+        if sort_keys and sr.column_names:
+            if not set(sort_keys).issubset(sr.column_names):
+                return None
+
+        split_coords: List[Sequence[object]] = []
+        for chunk in np.array_split(points, n):
+            split_coord = list(coords)
+            split_coord[dim_idx] = chunk.astype(dtype, copy=False)
+            split_coords.append(split_coord)
+        return split_coords, sort_keys
+
     def _set_reader_coords(self, sr: clib.SOMAArray, coords: Sequence[object]) -> None:
         """Parses the given coords and sets them on the SOMA Reader."""
         if not is_nonstringy_sequence(coords):
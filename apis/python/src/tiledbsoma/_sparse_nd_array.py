@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import itertools
 from typing import (
+    Callable,
     Dict,
     Optional,
     Sequence,
@@ -34,10 +35,12 @@ from ._arrow_types import pyarrow_to_carrow_type
 from ._common_nd_array import NDArray
 from ._exception import SOMAError, map_exception_for_create
 from ._read_iters import (
+    AsyncTableReadIter,
     BlockwiseScipyReadIter,
     BlockwiseTableReadIter,
     SparseCOOTensorReadIter,
     TableReadIter,
+    _SplitReader,
 )
 from ._tdb_handles import SparseNDArrayWrapper
 from ._types import NTuple, OpenTimestamp
@@ -187,6 +190,15 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
                 A per-dimension ``Sequence`` of scalar, slice, sequence of scalar or
                 `Arrow IntegerArray <https://arrow.apache.org/docs/python/generated/pyarrow.IntegerArray.html>` values
                 defining the region to read.
+            batch_size:
+                An optional :class:`BatchSize` hint limiting the number of
+                cells (``count``) or buffer bytes (``bytes``) returned by each
+                read batch. Defaults to automatic sizing.
+            partitions:
+                An optional :class:`ReadPartitions` hint. ``IOfN(i, n)`` reads
+                only the ``i``-th of ``n`` disjoint slices of the first
+                dimension, taken from ``coords`` or, if that is unconstrained,
+                the non-empty domain.
 
         Returns:
             A :class:`SparseNDArrayRead` to access result iterators in various formats.
@@ -214,28 +226,55 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
               ``slice(2,None)`` or ``slice(None,4)``.
             * Negative indexing is unsupported.
         """
-        del batch_size  # Currently unused.
-        handle: clib.SOMASparseNDArray = self._handle._handle
-
         self._check_open_read()
-        _util.check_unpartitioned(partitions)
-
-        context = handle.context()
-        if platform_config is not None:
-            config = context.tiledb_config.copy()
-            config.update(platform_config)
-            context = clib.SOMAContext(config)
-
-        sr = clib.SOMASparseNDArray.open(
-            uri=handle.uri,
-            mode=clib.OpenMode.read,
-            context=context,
-            column_names=[],
-            result_order=_util.to_clib_result_order(result_order),
-            timestamp=handle.timestamp and (0, handle.timestamp),
-        )
+        coords = self._partition_coords(coords, partitions)
+
+        clib_batch_size = _util.to_clib_batch_size(batch_size)
+
+        def open_reader() -> clib.SOMAArray:
+            return self._open_reader(
+                result_order=result_order,
+                batch_size=clib_batch_size,
+                platform_config=platform_config,
+            )
+
+        return SparseNDArrayRead(open_reader(), self, coords, open_reader)
+
+    def read_async(
+        self,
+        coords: options.SparseNDCoords = (),
+        *,
+        result_order: options.ResultOrderStr = options.ResultOrder.AUTO,
+        batch_size: options.BatchSize = _UNBATCHED,
+        partitions: Optional[options.ReadPartitions] = None,
+        platform_config: Optional[PlatformConfig] = None,
+    ) -> AsyncTableReadIter:
+        """Reads like ``read(...).tables()``, but returns the tables through
+        an asynchronous iterator, for use on an asyncio event loop.
+
+        The reader is set up before this returns; each batch is then read
+        while the event loop runs other tasks, so that one loop can serve
+        many concurrent reads::
+
+            tbl = await X.read_async((slice(0, 99),)).concat()
+
+        The array must stay open until the iterator is exhausted.
+
+        Returns:
+            An :class:`AsyncTableReadIter` of the COO tables of the result set.
 
-        return SparseNDArrayRead(sr, self, coords)
+        Lifecycle:
+            Experimental.
+        """
+        return AsyncTableReadIter(
+            self.read(
+                coords,
+                result_order=result_order,
+                batch_size=batch_size,
+                partitions=partitions,
+                platform_config=platform_config,
+            )._reader()
+        )
 
     def write(
         self,
@@ -504,6 +543,7 @@ class _SparseNDArrayReadBase(somacore.SparseRead):
         sr: clib.SOMAArray,
         array: SparseNDArray,
         coords: options.SparseNDCoords,
+        open_reader: Optional[Callable[[], clib.SOMAArray]] = None,
     ):
         """
         Lifecycle:
@@ -513,6 +553,15 @@ class _SparseNDArrayReadBase(somacore.SparseRead):
         self.shape = tuple(sr.shape)
         self.array = array
         self.coords = coords
+        self._open_reader = open_reader
+
+    def _reader(self) -> Union[clib.SOMAArray, _SplitReader]:
+        """Sets the coords on the reader, splitting reads of many points into
+        concurrent sub-queries if another reader can be opened."""
+        if self._open_reader is None:
+            self.array._set_reader_coords(self.sr, self.coords)
+            return self.sr
+        return self.array._split_reader(self.sr, self.coords, self._open_reader)
 
 
 class SparseNDArrayRead(_SparseNDArrayReadBase):
@@ -546,8 +595,7 @@ class SparseNDArrayRead(_SparseNDArrayReadBase):
         """
         if shape is not None and (len(shape) != len(self.shape)):
             raise ValueError(f"shape must be a tuple of size {len(self.shape)}")
-        self.array._set_reader_coords(self.sr, self.coords)
-        return SparseCOOTensorReadIter(self.sr, shape or self.shape)
+        return SparseCOOTensorReadIter(self._reader(), shape or self.shape)
 
     def tables(self) -> TableReadIter:
         """
@@ -557,8 +605,7 @@ class SparseNDArrayRead(_SparseNDArrayReadBase):
         Lifecycle:
             Maturing.
         """
-        self.array._set_reader_coords(self.sr, self.coords)
-        return TableReadIter(self.sr)
+        return TableReadIter(self._reader())
 
     def blockwise(
         self,
@@ -578,20 +625,28 @@ class SparseNDArrayRead(_SparseNDArrayReadBase):
         Blockwise iterators yield an array "block" in some user-specified format, as well as a
         list of coordinates contained in the individual block.
 
+        If `axis` is a sequence of axes, each block of the first axis is further split into
+        tiles, one for each combination of blocks of the other axes, so that no tile spans more
+        than `size` coordinates on any of those axes. For example, `axis=(0, 1)` yields
+        obs-block by var-block tiles, row by row.
+
         All blockwise iterators will reindex coordinates (i.e., map them from soma_joinid to an integer
         in the range [0, N)), unless reindexing is specifically disabled for that axis, using the
         `reindex_disable_on_axis` argument. When reindexing:
         * the primary iterator axis coordinates, as indicated by the `axis` argument, will be reindexed into the range
           `[0, N)`, where `N` is the number of coordinates read for the block (controlled with the `size` argument).
+          The same holds for the coordinates of any further axes given in `axis`, per tile.
         * all other axes will be reindexed to `[0, M)`, where `M` is the number of points read
           on that axis across all blocks.
 
         Args:
             axis:
                 Required. The axis across which to yield blocks, indicated as the dimension number, e.g.,
-                `axis=0` will step across `soma_dim_0` (the first dimension).
+                `axis=0` will step across `soma_dim_0` (the first dimension). A sequence of distinct axes
+                yields tiles, stepping across the first axis, then across the others in turn.
             size:
-                Optional. Number of coordinates in each block yielded by the iterator. A reasonable default will
+                Optional. Number of coordinates in each block yielded by the iterator, or a sequence
+                of sizes, one per axis in `axis`. A reasonable default will
                 be provided if the argument is omitted. Current defaults are 2^16 for dimension 0 and 2^8 for
                 all other dimensions. Defaults are subject to change and will likely remain relatively small.
             reindex_disable_on_axis:
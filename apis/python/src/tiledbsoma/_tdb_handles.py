@@ -16,7 +16,7 @@ from typing import (
     Dict,
     Generic,
     Iterator,
-    Mapping,
+    List,
     MutableMapping,
     Optional,
     Tuple,
@@ -28,6 +28,7 @@ from typing import (
 
 import attrs
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 from numpy.typing import DTypeLike
 from somacore import options
@@ -51,6 +52,9 @@ RawHandle = Union[
 _RawHdl_co = TypeVar("_RawHdl_co", bound=RawHandle, covariant=True)
 """A raw TileDB object. Covariant because Handles are immutable enough."""
 
+READ_REUSE_HANDLE = "soma.read_reuse_handle"
+"""Config key opting reads into sharing the array handle of their object."""
+
 
 def open(
     uri: str,
@@ -122,11 +126,7 @@ class Wrapper(Generic[_RawHdl_co], metaclass=abc.ABCMeta):
         try:
             tdb = cls._opener(uri, mode, context, timestamp_ms)
             handle = cls(uri, mode, context, timestamp_ms, tdb)
-            if mode == "w":
-                with cls._opener(uri, "r", context, timestamp_ms) as auxiliary_reader:
-                    handle._do_initial_reads(auxiliary_reader)
-            else:
-                handle._do_initial_reads(tdb)
+            handle._do_initial_reads(tdb)
 
         except RuntimeError as tdbe:
             if is_does_not_exist_error(tdbe):
@@ -143,11 +143,7 @@ class Wrapper(Generic[_RawHdl_co], metaclass=abc.ABCMeta):
         timestamp = context._open_timestamp_ms(soma_object.timestamp)
         try:
             handle = cls(uri, mode, context, timestamp, soma_object)
-            if handle.mode == "w":
-                with cls._opener(uri, mode, context, timestamp) as auxiliary_reader:
-                    handle._do_initial_reads(auxiliary_reader)
-            else:
-                handle._do_initial_reads(soma_object)
+            handle._do_initial_reads(soma_object)
 
         except RuntimeError as tdbe:
             if is_does_not_exist_error(tdbe):
@@ -184,11 +180,12 @@ class Wrapper(Generic[_RawHdl_co], metaclass=abc.ABCMeta):
     def _do_initial_reads(self, reader: _RawHdl_co) -> None:  # type: ignore[misc]
         """Final setup step before returning the Handle.
 
-        This is passed a raw TileDB object opened in read mode, since writers
-        will need to retrieve data from the backing store on setup.
+        This is passed the handle's own raw TileDB object. Those opened for
+        writing serve the metadata (and group members) from a read view they
+        keep of the backing store, so no separate reader is needed.
         """
         # non–attrs-managed field
-        self.metadata = MetadataWrapper(self, dict(reader.meta))
+        self.metadata = MetadataWrapper(self)
 
     @property
     def reader(self) -> _RawHdl_co:
@@ -216,9 +213,10 @@ class Wrapper(Generic[_RawHdl_co], metaclass=abc.ABCMeta):
         self.closed = True
 
     def _flush_hack(self) -> None:
-        """On write handles, flushes pending writes. Does nothing to reads."""
-        if self.mode == "w":
-            self.metadata._write()
+        """On write handles, flushes pending metadata writes, reopening the
+        handle to do so. Does nothing to reads, or if nothing was changed.
+        """
+        if self.mode == "w" and self.metadata._write():
             self._handle.close()
             self._handle = self._opener(self.uri, "w", self.context, self.timestamp_ms)
 
@@ -351,11 +349,13 @@ class SOMAArrayWrapper(Wrapper[_ArrType]):
     def _do_initial_reads(self, reader: RawHandle) -> None:
         """Final setup step before returning the Handle.
 
-        This is passed a raw TileDB object opened in read mode, since writers
-        will need to retrieve data from the backing store on setup.
+        This is passed the handle's own raw TileDB object; see
+        :meth:`Wrapper._do_initial_reads`.
         """
-        # non–attrs-managed field
-        self.metadata = MetadataWrapper(self, dict(reader.meta))
+        # non–attrs-managed fields
+        self.metadata = MetadataWrapper(self)
+        reuse = self.context.tiledb_config.get(READ_REUSE_HANDLE, "false")
+        self.reuse_handle = str(reuse).lower() == "true"
 
     @property
     def schema(self) -> pa.Schema:
@@ -473,11 +473,6 @@ class _DictMod(enum.Enum):
     DELETED = enum.auto()
     """The key was originally PRESENT but has been deleted."""
 
-    @classmethod
-    def start_state(cls, dct: Mapping[Any, Any], key: Any) -> "_DictMod":
-        """Returns the starting state for a DictMod given the key of dct."""
-        return cls.PRESENT if key in dct else cls.ABSENT
-
     def next_state(self, action: Literal["set", "del"]) -> "_DictMod":
         """Determines the next state of an entry given the action."""
         return {
@@ -506,27 +501,58 @@ class _DictMod(enum.Enum):
 class MetadataWrapper(MutableMapping[str, Any]):
     """A wrapper storing the metadata of some TileDB object.
 
-    Because the view of metadata does not change after open time, we immediately
-    cache all of it and use that to handle all reads. Writes are then proxied
-    through to the backing store and the cache is updated to match.
+    Because the view of metadata does not change after open time, values are
+    read from the handle only as they are first accessed, and then cached.
+    Writes update the cache, and are written to the backing store on close.
     """
 
     owner: Wrapper[RawHandle]
-    cache: Dict[str, Any]
+    cache: Dict[str, Any] = attrs.field(factory=dict)
+    """The values read so far, and those written."""
     _mods: Dict[str, "_DictMod"] = attrs.field(init=False, factory=dict)
     """Tracks the modifications we have made to cache entries."""
 
     def __len__(self) -> int:
         self.owner._check_open()
-        return len(self.cache)
+        num = int(self.owner._handle.metadata_num())
+        for mod in self._mods.values():
+            if mod is _DictMod.ADDED:
+                num += 1
+            elif mod is _DictMod.DELETED:
+                num -= 1
+        return num
 
     def __iter__(self) -> Iterator[str]:
         self.owner._check_open()
-        return iter(self.cache)
+        for key in self.owner._handle.metadata_keys:
+            if self._mods.get(key) is not _DictMod.DELETED:
+                yield key
+        for key, mod in list(self._mods.items()):
+            if mod is _DictMod.ADDED:
+                yield key
+
+    def __contains__(self, key: object) -> bool:
+        self.owner._check_open()
+        if not isinstance(key, str):
+            return False
+        return self._current_state(key) in (
+            _DictMod.PRESENT,
+            _DictMod.ADDED,
+            _DictMod.UPDATED,
+        )
 
     def __getitem__(self, key: str) -> Any:
         self.owner._check_open()
-        return self.cache[key]
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+        if key in self._mods:
+            # Added then deleted, or deleted.
+            raise KeyError(key)
+        value = self.owner._handle.get_metadata_value(key)
+        self.cache[key] = value
+        return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.owner.writer  # Ensures we're open in write mode.
@@ -538,38 +564,75 @@ class MetadataWrapper(MutableMapping[str, Any]):
     def __delitem__(self, key: str) -> None:
         self.owner.writer  # Ensures we're open in write mode.
         state = self._current_state(key)
-        del self.cache[key]
+        if state in (_DictMod.ABSENT, _DictMod.DELETED):
+            raise KeyError(key)
+        self.cache.pop(key, None)
         self._mods[key] = state.next_state("del")
 
+    def _is_stored(self, key: str) -> bool:
+        """Returns whether the cached value of the key is already stored."""
+        handle = self.owner._handle
+        return bool(handle.has_metadata(key)) and _same_metadatum(
+            handle.get_metadata_value(key), self.cache[key]
+        )
+
     def _current_state(self, key: str) -> _DictMod:
-        return self._mods.get(key, _DictMod.start_state(self.cache, key))
+        mod = self._mods.get(key)
+        if mod is not None:
+            return mod
+        if key in self.cache or self.owner._handle.has_metadata(key):
+            return _DictMod.PRESENT
+        return _DictMod.ABSENT
+
+    def _write(self) -> bool:
+        """Writes out metadata changes, if there were any, as one batch.
+
+        Keys set to the value they already had are not written again.
 
-    def _write(self) -> None:
-        """Writes out metadata changes, if there were any."""
+        Returns:
+            Whether anything was written.
+        """
         if not self._mods:
             # There were no changes (e.g., it's a read handle).  Do nothing.
-            return
+            return False
         # Only try to get the writer if there are changes to be made.
+        handle = self.owner._handle
+        values: Dict[str, npt.NDArray[Any]] = {}
+        deleted_keys: List[str] = []
         for key, mod in self._mods.items():
-            if mod in (_DictMod.ADDED, _DictMod.UPDATED):
-                set_metadata = self.owner._handle.set_metadata
-                val = self.cache[key]
-                if isinstance(val, str):
-                    set_metadata(key, np.array([val], "S"))
-                else:
-                    set_metadata(key, np.array([val]))
             if mod is _DictMod.DELETED:
-                self.owner._handle.delete_metadata(key)
+                deleted_keys.append(key)
+            elif mod is _DictMod.ADDED or (
+                mod is _DictMod.UPDATED and not self._is_stored(key)
+            ):
+                val = self.cache[key]
+                values[key] = (
+                    np.array([val], "S") if isinstance(val, str) else np.array([val])
+                )
+        if values or deleted_keys:
+            handle.update_metadata(values, deleted_keys)
 
         # Temporary hack: When we flush writes, note that the cache
         # is back in sync with disk.
         self._mods.clear()
+        return bool(values or deleted_keys)
 
     def __repr__(self) -> str:
         prefix = f"{type(self).__name__}({self.owner})"
         if self.owner.closed:
             return f"<{prefix}>"
-        return f"<{prefix} {self.cache}>"
+        return f"<{prefix} {dict(self)}>"
+
+
+def _same_metadatum(stored: Any, value: Any) -> bool:
+    """Returns whether writing ``value`` over ``stored`` would change nothing."""
+    if isinstance(value, str) or isinstance(stored, str):
+        return type(value) is type(stored) and value == stored
+    try:
+        same_type = np.array([value]).dtype == np.array([stored]).dtype
+        return bool(same_type and value == stored)
+    except (TypeError, ValueError):
+        return False
 
 
 def _check_metadata_type(key: str, obj: Metadatum) -> None:
@@ -231,18 +231,6 @@ def check_type(
         )
 
 
-def check_unpartitioned(partitions: Optional[options.ReadPartitions]) -> None:
-    """Ensures that we're not being asked for a partitioned read.
-
-    Because we currently don't support partitioned reads, we should reject all
-    reads that request partitions to avoid giving the user duplicate data across
-    sharded tasks.
-    """
-    if not partitions or partitions == options.IOfN(0, 1):
-        return
-    raise ValueError("Paritioned reads are not currently supported")
-
-
 _ETERNITY_MS = 2**64 - 1
 
 
@@ -288,6 +276,20 @@ def to_clib_result_order(result_order: options.ResultOrderStr) -> clib.ResultOrd
         raise ValueError(f"Invalid result_order: {result_order}") from ke
 
 
+def to_clib_batch_size(batch_size: options.BatchSize) -> str:
+    """Converts a :class:`BatchSize` into the string understood by the C++ reader:
+    ``"auto"``, ``"count=N"`` or ``"bytes=N"``."""
+    if batch_size.count is not None:
+        if batch_size.count <= 0:
+            raise ValueError(f"Invalid batch_size count: {batch_size.count}")
+        return f"count={batch_size.count}"
+    if batch_size.bytes is not None:
+        if batch_size.bytes <= 0:
+            raise ValueError(f"Invalid batch_size bytes: {batch_size.bytes}")
+        return f"bytes={batch_size.bytes}"
+    return "auto"
+
+
 def pa_types_is_string_or_bytes(dtype: pa.DataType) -> bool:
     return bool(
         pa.types.is_large_string(dtype)
@@ -189,25 +189,43 @@ std::optional<py::object> to_table(
     return std::nullopt;
 }
 
+py::object meta_value(const MetadataValue& metadata_value) {
+    auto [tdb_type, value_num, value] = metadata_value;
+
+    if (tdb_type == TILEDB_STRING_UTF8 || tdb_type == TILEDB_STRING_ASCII) {
+        auto py_buf = py::array(py::dtype("|S1"), value_num, value);
+        return py_buf.attr("tobytes")().attr("decode")("UTF-8");
+    }
+    py::dtype value_type = tdb_to_np_dtype(tdb_type, 1);
+    return py::array(value_type, value_num, value).attr("item")(0);
+}
+
 py::dict meta(std::map<std::string, MetadataValue> metadata_mapping) {
     py::dict results;
 
     for (auto [key, val] : metadata_mapping) {
-        auto [tdb_type, value_num, value] = val;
-
-        if (tdb_type == TILEDB_STRING_UTF8 || tdb_type == TILEDB_STRING_ASCII) {
-            auto py_buf = py::array(py::dtype("|S1"), value_num, value);
-            auto res = py_buf.attr("tobytes")().attr("decode")("UTF-8");
-            results[py::str(key)] = res;
-        } else {
-            py::dtype value_type = tdb_to_np_dtype(tdb_type, 1);
-            auto res = py::array(value_type, value_num, value).attr("item")(0);
-            results[py::str(key)] = res;
-        }
+        results[py::str(key)] = meta_value(val);
     }
     return results;
 }
 
+py::object get_metadata_value(
+    SOMAObject& soma_object, const std::string& key) {
+    auto value = soma_object.get_metadata(key);
+    if (!value.has_value()) {
+        throw py::key_error(key);
+    }
+    return meta_value(*value);
+}
+
+std::vector<std::string> metadata_keys(SOMAObject& soma_object) {
+    std::vector<std::string> keys;
+    for (const auto& [key, _] : soma_object.get_metadata()) {
+        keys.push_back(key);
+    }
+    return keys;
+}
+
 void set_metadata(
     SOMAObject& soma_object, const std::string& key, py::array value) {
     tiledb_datatype_t value_type = np_to_tdb_dtype(value.dtype());
@@ -224,4 +242,19 @@ void set_metadata(
         key, value_type, value_num, value_num > 0 ? value.data() : nullptr);
 }
 
+// Applies all of a handle's pending metadata changes in one call. TileDB
+// writes them as a single metadata fragment when the handle is closed.
+void update_metadata(
+    SOMAObject& soma_object,
+    py::dict values,
+    const std::vector<std::string>& deleted_keys) {
+    for (const auto& key : deleted_keys) {
+        soma_object.delete_metadata(key);
+    }
+    for (auto [key, value] : values) {
+        set_metadata(
+            soma_object, key.cast<std::string>(), value.cast<py::array>());
+    }
+}
+
 }  // namespace tiledbsoma
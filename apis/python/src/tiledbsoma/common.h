@@ -41,9 +41,17 @@ bool is_tdb_str(tiledb_datatype_t type);
 std::optional<py::object> to_table(
     std::optional<std::shared_ptr<ArrayBuffers>> buffers);
 
+py::object meta_value(const MetadataValue& metadata_value);
 py::dict meta(std::map<std::string, MetadataValue> metadata_mapping);
+py::object get_metadata_value(
+    SOMAObject& soma_object, const std::string& key);
+std::vector<std::string> metadata_keys(SOMAObject& soma_object);
 void set_metadata(
     SOMAObject& soma_object, const std::string& key, py::array value);
+void update_metadata(
+    SOMAObject& soma_object,
+    py::dict values,
+    const std::vector<std::string>& deleted_keys);
 
 class PyQueryCondition {
    private:
@@ -98,6 +106,15 @@ class PyQueryCondition {
         }
     }
 
+    void set_use_enumeration(bool use_enumeration) {
+        try {
+            QueryConditionExperimental::set_use_enumeration(
+                ctx_, *qc_, use_enumeration);
+        } catch (TileDBError& e) {
+            TPY_ERROR_LOC(e.what());
+        }
+    }
+
     shared_ptr<QueryCondition> ptr() {
         return qc_;
     }
@@ -0,0 +1,213 @@
+/**
+ * @file   fastercsx.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file defines the bindings for building compressed sparse matrices.
+ */
+
+#include <algorithm>
+#include <limits>
+
+#include <tiledbsoma/reindexer/reindexer.h>
+#include <tiledbsoma/utils/fastercsx.h>
+#include "common.h"
+
+namespace libtiledbsomacpp {
+
+namespace py = pybind11;
+using namespace py::literals;
+using namespace tiledbsoma;
+
+using CoordArray =
+    py::array_t<int64_t, py::array::c_style | py::array::forcecast>;
+
+/***
+ * Reindex and compress one block of COO data. The output arrays are
+ * allocated here and filled in place, so they can be handed to scipy as-is.
+ * @param major_indexer indexer of the major-axis coordinates
+ * @param minor_indexer indexer of the minor-axis coordinates, or nullptr to
+ * use them as-is
+ * @param n_major size of the major axis
+ * @param n_minor size of the minor axis
+ * @param major_coords major-axis coordinates
+ * @param minor_coords minor-axis coordinates
+ * @param data values
+ * @return tuple of (indptr, indices, data)
+ */
+template <typename VALUE, typename CSX_INDEX>
+py::tuple compress_coo_typed(
+    IntIndexer& major_indexer,
+    IntIndexer* minor_indexer,
+    size_t n_major,
+    size_t n_minor,
+    const CoordArray& major_coords,
+    const CoordArray& minor_coords,
+    const py::array_t<VALUE, py::array::c_style>& data) {
+    const size_t nnz = data.size();
+    auto indptr = py::array_t<CSX_INDEX>(n_major + 1);
+    auto indices = py::array_t<CSX_INDEX>(nnz);
+    auto values = py::array_t<VALUE>(nnz);
+
+    const int64_t* Ai = major_coords.data();
+    const int64_t* Aj = minor_coords.data();
+    const VALUE* Ad = data.data();
+    CSX_INDEX* Bp = indptr.mutable_data();
+    CSX_INDEX* Bj = indices.mutable_data();
+    VALUE* Bd = values.mutable_data();
+
+    {
+        py::gil_scoped_release release;
+        std::vector<int64_t> major(nnz);
+        major_indexer.lookup(Ai, major.data(), nnz);
+        std::vector<int64_t> minor;
+        if (minor_indexer != nullptr) {
+            minor.resize(nnz);
+            minor_indexer->lookup(Aj, minor.data(), nnz);
+            Aj = minor.data();
+        }
+        fastercsx::compress_coo(
+            n_major, n_minor, nnz, major.data(), Aj, Ad, Bp, Bj, Bd);
+    }
+    return py::make_tuple(indptr, indices, values);
+}
+
+template <typename VALUE>
+py::tuple compress_coo_value(
+    IntIndexer& major_indexer,
+    IntIndexer* minor_indexer,
+    size_t n_major,
+    size_t n_minor,
+    const CoordArray& major_coords,
+    const CoordArray& minor_coords,
+    py::array data) {
+    auto values = py::array_t<VALUE, py::array::c_style>::ensure(data);
+    // scipy narrows int64 indices that fit in int32, which would copy them
+    const size_t int32_max = std::numeric_limits<int32_t>::max();
+    if (std::max({n_major, n_minor, static_cast<size_t>(data.size())}) <=
+        int32_max) {
+        return compress_coo_typed<VALUE, int32_t>(
+            major_indexer,
+            minor_indexer,
+            n_major,
+            n_minor,
+            major_coords,
+            minor_coords,
+            values);
+    }
+    return compress_coo_typed<VALUE, int64_t>(
+        major_indexer,
+        minor_indexer,
+        n_major,
+        n_minor,
+        major_coords,
+        minor_coords,
+        values);
+}
+
+py::tuple compress_coo(
+    IntIndexer& major_indexer,
+    IntIndexer* minor_indexer,
+    std::pair<size_t, size_t> shape,
+    const CoordArray& major_coords,
+    const CoordArray& minor_coords,
+    py::array data) {
+    if (major_coords.ndim() != 1 || minor_coords.ndim() != 1 ||
+        data.ndim() != 1 || major_coords.size() != data.size() ||
+        minor_coords.size() != data.size())
+        throw TileDBSOMAError(
+            "[compress_coo] coordinates and data must be 1-D arrays of the "
+            "same length");
+
+    auto [n_major, n_minor] = shape;
+    auto compress = [&](auto value) {
+        return compress_coo_value<decltype(value)>(
+            major_indexer,
+            minor_indexer,
+            n_major,
+            n_minor,
+            major_coords,
+            minor_coords,
+            data);
+    };
+
+    switch (data.dtype().kind()) {
+        case 'b':
+            return compress(bool{});
+        case 'f':
+            switch (data.itemsize()) {
+                case 4:
+                    return compress(float{});
+                case 8:
+                    return compress(double{});
+            }
+            break;
+        case 'i':
+            switch (data.itemsize()) {
+                case 1:
+                    return compress(int8_t{});
+                case 2:
+                    return compress(int16_t{});
+                case 4:
+                    return compress(int32_t{});
+                case 8:
+                    return compress(int64_t{});
+            }
+            break;
+        case 'u':
+            switch (data.itemsize()) {
+                case 1:
+                    return compress(uint8_t{});
+                case 2:
+                    return compress(uint16_t{});
+                case 4:
+                    return compress(uint32_t{});
+                case 8:
+                    return compress(uint64_t{});
+            }
+            break;
+    }
+    throw TileDBSOMAError(
+        "[compress_coo] unsupported data type " +
+        std::string(py::str(data.dtype())));
+}
+
+void load_fastercsx(py::module& m) {
+    // Reindexes a block of COO coordinates and counting-sorts them directly
+    // into CSR/CSC buffers.
+    m.def(
+        "compress_coo",
+        compress_coo,
+        "major_indexer"_a,
+        "minor_indexer"_a,
+        "shape"_a,
+        "major_coords"_a,
+        "minor_coords"_a,
+        "data"_a);
+}
+
+}  // namespace libtiledbsomacpp
@@ -287,6 +287,13 @@ class Signature:
         """
 
         with tiledbsoma.Experiment.open(uri, context=context) as exp:
+            # Open everything read below concurrently, rather than one at a time
+            exp.prefetch(["obs", "ms"])
+            exp.ms.prefetch(
+                [name for name in (measurement_name, "raw") if name in exp.ms],
+                recursive=True,
+            )
+
             obs_schema = _string_dict_from_arrow_schema(exp.obs.schema)
 
             var_schema = _string_dict_from_arrow_schema(
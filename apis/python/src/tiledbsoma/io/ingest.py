@@ -56,7 +56,11 @@ from .. import pytiledbsoma as clib
 from .._arrow_types import df_to_arrow
 from .._collection import AnyTileDBCollection, CollectionBase
 from .._common_nd_array import NDArray
-from .._constants import SOMA_JOINID
+from .._constants import (
+    SOMA_ID_INDEX_COLUMN_METADATA_KEY,
+    SOMA_ID_INDEX_URI_METADATA_KEY,
+    SOMA_JOINID,
+)
 from .._exception import (
     AlreadyExistsError,
     DoesNotExistError,
@@ -243,6 +247,7 @@ def from_h5ad(
     registration_mapping: Optional[ExperimentAmbientLabelMapping] = None,
     uns_keys: Optional[Sequence[str]] = None,
     additional_metadata: AdditionalMetadata = None,
+    id_index: bool = False,
 ) -> str:
     """Reads an ``.h5ad`` file and writes it to an :class:`Experiment`.
 
@@ -338,6 +343,12 @@ def from_h5ad(
                   exp.metadata.update({"aaa": "BBB"})
                   exp.obs.metadata.update({"ccc": 123})
 
+        id_index: Also write persistent indexes from the ``obs_id_name`` and
+          ``var_id_name`` values to ``soma_joinid``, as the ``obs_id_index``
+          and ``var_id_index`` dataframes stored next to ``obs`` and ``var``.
+          They serve :meth:`DataFrame.lookup_ids`, and are kept up to date by
+          later appends to ``obs`` and ``var``.
+
     Returns:
         The URI of the newly created experiment.
 
@@ -378,6 +389,7 @@ def from_h5ad(
             registration_mapping=registration_mapping,
             uns_keys=uns_keys,
             additional_metadata=additional_metadata,
+            id_index=id_index,
         )
 
     logging.log_io(
@@ -420,6 +432,7 @@ def from_anndata(
     registration_mapping: Optional[ExperimentAmbientLabelMapping] = None,
     uns_keys: Optional[Sequence[str]] = None,
     additional_metadata: AdditionalMetadata = None,
+    id_index: bool = False,
 ) -> str:
     """Writes an `AnnData <https://anndata.readthedocs.io/>`_ object to an :class:`Experiment`.
 
@@ -512,9 +525,11 @@ def from_anndata(
         conversions.decategoricalize_obs_or_var(anndata.obs),
         id_column_name=obs_id_name,
         axis_mapping=jidmaps.obs_axis,
+        id_index=id_index or None,
         **ingest_platform_ctx,
     ) as obs:
         _maybe_set(experiment, "obs", obs, use_relative_uri=use_relative_uri)
+        _maybe_set_id_index(experiment, obs, use_relative_uri=use_relative_uri)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
     # MS
@@ -563,9 +578,11 @@ def from_anndata(
                 id_column_name=var_id_name,
                 # Layer existence is pre-checked in the registration phase
                 axis_mapping=jidmaps.var_axes[measurement_name],
+                id_index=id_index or None,
                 **ingest_platform_ctx,
             ) as var:
                 _maybe_set(measurement, "var", var, use_relative_uri=use_relative_uri)
+                _maybe_set_id_index(measurement, var, use_relative_uri=use_relative_uri)
 
             # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
             # MS/meas/X/DATA
@@ -1143,6 +1160,7 @@ def _write_dataframe(
     platform_config: Optional[PlatformConfig] = None,
     context: Optional[SOMATileDBContext] = None,
     axis_mapping: AxisIDMapping,
+    id_index: Optional[bool] = None,
 ) -> DataFrame:
     """
     The id_column_name is for disambiguating rows in append mode;
@@ -1150,6 +1168,10 @@ def _write_dataframe(
 
     The original_index_name is the index name in the AnnData obs/var.
 
+    With ``id_index`` true, an ID index of the id_column_name values is also
+    written; with ``None``, an ID index the dataframe already has is kept up
+    to date; with false, any ID index is left as is.
+
     This helper mutates the input dataframe, for parsimony of memory usage.
     The caller should have copied anything pointing to a user-provided
     adata.obs, adata.var, etc.
@@ -1167,6 +1189,7 @@ def _write_dataframe(
         original_index_metadata=original_index_metadata,
         platform_config=platform_config,
         context=context,
+        id_index=id_index,
     )
 
 
@@ -1180,6 +1203,7 @@ def _write_dataframe_impl(
     original_index_metadata: OriginalIndexMetadata = None,
     platform_config: Optional[PlatformConfig] = None,
     context: Optional[SOMATileDBContext] = None,
+    id_index: Optional[bool] = False,
 ) -> DataFrame:
     s = _util.get_start_stamp()
     logging.log_io(None, f"START  WRITING {df_uri}")
@@ -1219,7 +1243,22 @@ def _write_dataframe_impl(
                 )
                 return soma_df
 
+    id_index_column: Optional[str] = None
+    if id_index is not False:
+        id_index_column = soma_df.metadata.get(SOMA_ID_INDEX_COLUMN_METADATA_KEY)
+        if id_index and id_index_column is None:
+            id_index_column = id_column_name
+        if (
+            id_index_column is not None
+            and id_index_column not in arrow_table.column_names
+        ):
+            raise SOMAError(
+                f"{df_uri}: ID index column {id_index_column!r} is not in the data"
+            )
+
     if ingestion_params.write_schema_no_data:
+        if id_index_column is not None:
+            _write_id_index(soma_df, df_uri, id_index_column, None, context=context)
         logging.log_io(
             f"Wrote schema {df_uri}",
             _util.format_elapsed(s, f"FINISH WRITING SCHEMA {df_uri}"),
@@ -1234,6 +1273,8 @@ def _write_dataframe_impl(
         _write_arrow_table(
             arrow_table, soma_df, tiledb_create_options, tiledb_write_options
         )
+    if id_index_column is not None:
+        _write_id_index(soma_df, df_uri, id_index_column, arrow_table, context=context)
 
     # Save the original index name for outgest. We use JSON for elegant indication of index name
     # being None (in Python anyway).
@@ -1249,6 +1290,72 @@ def _write_dataframe_impl(
     return soma_df
 
 
+def _write_id_index(
+    soma_df: DataFrame,
+    df_uri: str,
+    column_name: str,
+    arrow_table: Optional[pa.Table],
+    *,
+    context: Optional[SOMATileDBContext],
+) -> None:
+    """Creates the ID index of a dataframe, or adds rows to it.
+
+    The index is a dataframe whose index column holds the ``column_name``
+    values, each with its ``soma_joinid``, so that IDs can be resolved by
+    point reads. It is stored next to the dataframe, which links to it by
+    metadata.
+    """
+    index_uri = soma_df._id_index_uri() or f"{df_uri.rstrip('/')}_id_index"
+    id_type = soma_df.schema.field(column_name).type
+    if pa.types.is_dictionary(id_type):
+        id_type = id_type.value_type
+
+    try:
+        index = DataFrame.create(
+            index_uri,
+            schema=pa.schema([(SOMA_JOINID, pa.int64()), (column_name, id_type)]),
+            index_column_names=(column_name,),
+            context=context,
+        )
+    except (AlreadyExistsError, NotCreateableError):
+        index = DataFrame.open(index_uri, "w", context=context)
+
+    with index:
+        if arrow_table:
+            ids = arrow_table[column_name]
+            if pa.types.is_dictionary(ids.type):
+                ids = ids.cast(ids.type.value_type)
+            rows = pa.table(
+                {SOMA_JOINID: arrow_table[SOMA_JOINID], column_name: ids}
+            ).filter(ids.is_valid())
+            index.write(rows.select(index.schema.names).cast(index.schema))
+
+    if SOMA_ID_INDEX_URI_METADATA_KEY not in soma_df.metadata:
+        soma_df.metadata[SOMA_ID_INDEX_COLUMN_METADATA_KEY] = column_name
+        # Siblings are linked by relative URI, so that local experiments
+        # can be moved.
+        soma_df.metadata[SOMA_ID_INDEX_URI_METADATA_KEY] = (
+            index_uri.rstrip("/").rsplit("/", 1)[-1]
+            if _util.is_local_path(df_uri)
+            else index_uri
+        )
+
+
+def _maybe_set_id_index(
+    coll: AnyTileDBCollection,
+    sdf: DataFrame,
+    *,
+    use_relative_uri: Optional[bool],
+) -> None:
+    """Adds the ID index of the dataframe, if it has one, to its collection."""
+    index_uri = sdf._id_index_uri()
+    if index_uri is None:
+        return
+    with DataFrame.open(index_uri, context=sdf.context) as index:
+        key = index_uri.rstrip("/").rsplit("/", 1)[-1]
+        _maybe_set(coll, key, index, use_relative_uri=use_relative_uri)
+
+
 def create_from_matrix(
     cls: Type[_NDArr],
     uri: str,
@@ -1496,10 +1603,14 @@ def _update_dataframe(
     ) as sdf_r:
         # Until we someday support deletes, this is the correct check on the existing,
         # contiguous soma join IDs compared to the new contiguous ones about to be created.
+        id_index_column = sdf_r.metadata.get(SOMA_ID_INDEX_COLUMN_METADATA_KEY)
         old_jids = sorted(
             e.as_py()
             for e in sdf_r.read(column_names=["soma_joinid"]).concat()["soma_joinid"]
         )
+        old_ids = (
+            None if id_index_column is None else _read_id_column(sdf_r, id_index_column)
+        )
         num_old_data = len(old_jids)
         num_new_data = len(new_data)
         if num_old_data != num_new_data:
@@ -1570,8 +1681,26 @@ def _update_dataframe(
         context=context,
         platform_config=platform_config,
         axis_mapping=AxisIDMapping.identity(new_data.shape[0]),
+        id_index=False,
     )
 
+    # The ID index can have entries added but not removed, so it is dropped
+    # if the update changed the IDs.
+    if id_index_column is not None:
+        with DataFrame.open(sdf.uri, mode="r", context=context) as sdf_r:
+            if id_index_column not in sdf_r.keys() or not _read_id_column(
+                sdf_r, id_index_column
+            ).equals(old_ids):
+                logging.log_io_same(f"Dropping the ID index of {sdf.uri}")
+                del sdf.metadata[SOMA_ID_INDEX_COLUMN_METADATA_KEY]
+                del sdf.metadata[SOMA_ID_INDEX_URI_METADATA_KEY]
+
+
+def _read_id_column(sdf: DataFrame, column_name: str) -> pa.Array:
+    """Reads a column of the dataframe, ordered by ``soma_joinid``."""
+    table = sdf.read(column_names=[SOMA_JOINID, column_name]).concat()
+    return table.sort_by(SOMA_JOINID)[column_name].combine_chunks()
+
 
 def update_matrix(
     soma_ndarray: Union[SparseNDArray, DenseNDArray],
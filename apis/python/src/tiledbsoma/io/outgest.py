@@ -249,6 +249,12 @@ def to_anndata(
             f"requested measurement name {measurement_name} not found in input: {experiment.ms.keys()}"
         )
     measurement = experiment.ms[measurement_name]
+    # Open the arrays to outgest concurrently rather than one at a time; X
+    # layers are opened below, once the requested ones are known, and uns
+    # elements by _extract_uns, which knows which are requested.
+    measurement.prefetch(
+        [key for key in measurement if key not in ("X", "uns")], recursive=True
+    )
 
     # How to choose index name for AnnData obs and var dataframes:
     # * If the desired names are passed in, use them.
@@ -278,6 +284,12 @@ def to_anndata(
             "If X_layer_name is None, extra_X_layer_names must not be provided"
         )
 
+    if X_layer_name is not None and "X" in measurement:
+        X_layer_names = {X_layer_name, *(extra_X_layer_names or ())}
+        measurement.X.prefetch(
+            [name for name in measurement.X if name in X_layer_names]
+        )
+
     if X_layer_name is not None:
         anndata_X = _extract_X_key(measurement, X_layer_name, nobs, nvar)
         anndata_X_dtype = anndata_X.dtype
@@ -435,6 +447,12 @@ def _extract_uns(
     This is a helper function for ``to_anndata`` of ``uns`` elements.
     """
 
+    if level == 0:
+        collection.prefetch(
+            None if uns_keys is None else [k for k in uns_keys if k in collection],
+            recursive=True,
+        )
+
     extracted: Dict[str, Any] = {}
     for key, element in collection.items():
         if level == 0 and uns_keys is not None and key not in uns_keys:
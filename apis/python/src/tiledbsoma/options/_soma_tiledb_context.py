@@ -20,9 +20,18 @@ import tiledb
 
 from .. import pytiledbsoma as clib
 from .._general_utilities import assert_version_before
+from .._indexer import IntIndexerCache
+from .._joinid_cache import JoinIDCache
 from .._types import OpenTimestamp
 from .._util import ms_to_datetime, to_timestamp_ms
 
+INDEXER_CACHE_BYTES = "soma.indexer_cache_bytes"
+"""Config key bounding the memory of the context's indexer cache."""
+_DEFAULT_INDEXER_CACHE_BYTES = 0
+JOINID_CACHE_BYTES = "soma.joinid_cache_bytes"
+"""Config key bounding the memory of the context's joinid cache."""
+_DEFAULT_JOINID_CACHE_BYTES = 0
+
 
 def _warn_ctx_deprecation() -> None:
     assert_version_before(1, 14)
@@ -161,6 +170,10 @@ class SOMATileDBContext(ContextBase):
         """User specified threadpool. If None, we'll instantiate one ourselves."""
         self._native_context: Optional[clib.SOMAContext] = None
         """Lazily construct clib.SOMAContext."""
+        self._indexer_cache: Optional[IntIndexerCache] = None
+        """Lazily construct the IntIndexerCache."""
+        self._joinid_cache: Optional[JoinIDCache] = None
+        """Lazily construct the JoinIDCache."""
 
     @property
     def timestamp_ms(self) -> Optional[int]:
@@ -219,6 +232,85 @@ class SOMATileDBContext(ContextBase):
         with self._lock:
             return self._internal_tiledb_config()
 
+    def buffer_pool_stats(self) -> Dict[str, int]:
+        """Returns counters for the pool of read buffers shared by all arrays
+        opened with this context.
+
+        Reads allocate their buffers from the pool, which keeps the buffers of
+        finished reads (up to ``soma.buffer_pool_bytes`` bytes in the TileDB
+        config) for reuse instead of freeing them. The counters are ``hits``
+        and ``misses`` for pooled allocations, and the ``buffers_held`` and
+        ``bytes_held`` by the pool.
+
+        Lifecycle:
+            Experimental.
+        """
+        return dict(self.native_context.buffer_pool_stats())
+
+    def array_cache_stats(self) -> Dict[str, int]:
+        """Returns counters for the cache of arrays opened for reading with
+        this context.
+
+        Arrays opened for reading again at the same ``tiledb_timestamp``
+        share the array opened first, with its schema, enumerations and
+        fragment metadata already loaded, rather than loading them again.
+        The cache is opt-in: it holds up to ``soma.array_cache_entries``
+        arrays (in the TileDB config), evicting the least recently used ones,
+        and is disabled by the default of ``0``. Closing an array written
+        with this context drops its cached arrays. The counters are ``hits``
+        and ``misses`` for cacheable opens, ``invalidations`` by writes, and
+        the ``entries`` held by the cache.
+
+        Lifecycle:
+            Experimental.
+        """
+        return dict(self.native_context.array_cache_stats())
+
+    @property
+    def indexer_cache(self) -> IntIndexerCache:
+        """The cache of re-indexers shared by the queries and blockwise
+        iterators that use this context.
+
+        Repeated reads over the same coordinates reuse the indexers built for
+        them, rather than building identical hash tables again. The cache is
+        opt-in: it holds up to ``soma.indexer_cache_bytes`` bytes (in the
+        TileDB config) of estimated memory, evicting the least recently used
+        indexers, and is disabled by the default of ``0``.
+
+        Lifecycle:
+            Experimental.
+        """
+        with self._lock:
+            if self._indexer_cache is None:
+                max_bytes = self._internal_tiledb_config().get(
+                    INDEXER_CACHE_BYTES, _DEFAULT_INDEXER_CACHE_BYTES
+                )
+                self._indexer_cache = IntIndexerCache(int(max_bytes))
+            return self._indexer_cache
+
+    @property
+    def joinid_cache(self) -> JoinIDCache:
+        """The cache of the ``obs`` and ``var`` joinids selected by the
+        experiment axis queries that use this context.
+
+        A query issued again, with the same value filter and coords, against
+        an experiment opened at the same timestamp reuses the joinids resolved
+        by the first one, instead of reading the axis dataframe again. The
+        cache is opt-in: it holds up to ``soma.joinid_cache_bytes`` bytes (in
+        the TileDB config) of joinids, evicting the least recently used ones,
+        and is disabled by the default of ``0``.
+
+        Lifecycle:
+            Experimental.
+        """
+        with self._lock:
+            if self._joinid_cache is None:
+                max_bytes = self._internal_tiledb_config().get(
+                    JOINID_CACHE_BYTES, _DEFAULT_JOINID_CACHE_BYTES
+                )
+                self._joinid_cache = JoinIDCache(int(max_bytes))
+            return self._joinid_cache
+
     def _internal_tiledb_config(self) -> Dict[str, Union[str, float]]:
         """Internal function for getting the TileDB Config.
 
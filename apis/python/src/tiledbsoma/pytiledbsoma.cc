@@ -26,6 +26,7 @@ void load_soma_group(py::module&);
 void load_soma_collection(py::module&);
 void load_query_condition(py::module&);
 void load_reindexer(py::module&);
+void load_fastercsx(py::module&);
 
 PYBIND11_MODULE(pytiledbsoma, m) {
     py::register_exception<TileDBSOMAError>(m, "SOMAError");
@@ -201,6 +202,7 @@ PYBIND11_MODULE(pytiledbsoma, m) {
     load_soma_collection(m);
     load_query_condition(m);
     load_reindexer(m);
+    load_fastercsx(m);
 }
 
 };  // namespace libtiledbsomacpp
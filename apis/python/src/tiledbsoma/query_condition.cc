@@ -116,6 +116,7 @@ void load_query_condition(py::module& m) {
                 &PyQueryCondition::init))
 
         .def("combine", &PyQueryCondition::combine)
+        .def("set_use_enumeration", &PyQueryCondition::set_use_enumeration)
 
         .def_static(
             "create_string",
@@ -160,16 +161,16 @@ void load_query_condition(py::module& m) {
                 const std::vector<int8_t>&,
                 tiledb_query_condition_op_t)>(&PyQueryCondition::create))
         .def_static(
-            "create_uint16",
+            "create_int16",
             static_cast<PyQueryCondition (*)(
                 const std::string&,
-                const std::vector<uint16_t>&,
+                const std::vector<int16_t>&,
                 tiledb_query_condition_op_t)>(&PyQueryCondition::create))
         .def_static(
-            "create_int8",
+            "create_uint8",
             static_cast<PyQueryCondition (*)(
                 const std::string&,
-                const std::vector<int8_t>&,
+                const std::vector<uint8_t>&,
                 tiledb_query_condition_op_t)>(&PyQueryCondition::create))
         .def_static(
             "create_float32",
@@ -41,21 +41,47 @@ namespace py = pybind11;
 using namespace py::literals;
 using namespace tiledbsoma;
 
+using OutputArray = py::array_t<int64_t, py::array::c_style>;
+
+/***
+ * Return the output array of a lookup: the given one, if any, after checking
+ * its size, or a newly allocated one
+ * @param out optional output array
+ * @param size number of looked up values
+ * @return output array
+ */
+OutputArray lookup_output(
+    std::optional<OutputArray> out, size_t size) {
+    if (!out.has_value()) {
+        return OutputArray(size);
+    }
+    if (out->ndim() != 1 || static_cast<size_t>(out->size()) != size) {
+        throw TileDBSOMAError(
+            "[get_indexer] out must be a 1-D array of the same length as "
+            "the lookups");
+    }
+    return *out;
+}
+
 /***
  * Handle general lookup for Re-indexer
  * @param indexer reference to the indexer
  * @param lookups input values to be looked up
+ * @param out optional contiguous int64 array for the results
  * @return looked up values
  */
-py::array_t<int64_t> get_indexer_general(
-    IntIndexer& indexer, py::array_t<int64_t> lookups) {
-    auto input_buffer = lookups.request();
-    int64_t* input_ptr = static_cast<int64_t*>(input_buffer.ptr);
-    size_t size = input_buffer.shape[0];
-    auto results = py::array_t<int64_t>(size);
-    auto results_buffer = results.request();
-    int64_t* results_ptr = static_cast<int64_t*>(results_buffer.ptr);
-    indexer.lookup(input_ptr, results_ptr, size);
+OutputArray get_indexer_general(
+    IntIndexer& indexer,
+    py::array_t<int64_t, py::array::c_style | py::array::forcecast> lookups,
+    std::optional<OutputArray> out) {
+    const int64_t* input_ptr = lookups.data();
+    size_t size = lookups.size();
+    auto results = lookup_output(out, size);
+    int64_t* results_ptr = results.mutable_data();
+    {
+        py::gil_scoped_release release;
+        indexer.lookup(input_ptr, results_ptr, size);
+    }
     return results;
 }
 
@@ -78,19 +104,23 @@ void extract_py_array_schema(
 }
 
 /***
- * Handle pyarrow-based lookup for Re-indexer
+ * Handle pyarrow-based lookup for Re-indexer. The chunks of a chunked array
+ * are looked up in place, in parallel, and without holding the GIL.
  * @param indexer reference to the indexer
  * @py_arrow_array pyarrow inputs to be looked up
+ * @param out optional contiguous int64 array for the results
  * @return looked up values
  */
-py::array_t<int64_t> get_indexer_py_arrow(
-    IntIndexer& indexer, py::object py_arrow_array) {
+OutputArray get_indexer_py_arrow(
+    IntIndexer& indexer,
+    py::object py_arrow_array,
+    std::optional<OutputArray> out) {
     // Check if it is not a pyarrow array or pyarrow chunked array
     if (!py::hasattr(py_arrow_array, "_export_to_c") &&
         !py::hasattr(py_arrow_array, "chunks") &&
         !py::hasattr(py_arrow_array, "combine_chunks")) {
         // Handle the general case (no py arrow objects)
-        return get_indexer_general(indexer, py_arrow_array);
+        return get_indexer_general(indexer, py_arrow_array, out);
     }
 
     py::list array_chunks;
@@ -100,38 +130,54 @@ py::array_t<int64_t> get_indexer_py_arrow(
         array_chunks.append(py_arrow_array);
     }
 
-    // Calculate the total size of the input chunked array.
-    int total_size = 0;
-    for (const pybind11::handle array : array_chunks) {
-        ArrowSchema arrow_schema;
-        ArrowArray arrow_array;
-        extract_py_array_schema(array, arrow_array, arrow_schema);
-        total_size += arrow_array.length;
-
-        arrow_schema.release(&arrow_schema);
-        arrow_array.release(&arrow_array);
-    }
-
-    // Allocate the output
-    auto results = py::array_t<int64_t>(total_size);
-    auto results_buffer = results.request();
-    int64_t* results_ptr = static_cast<int64_t*>(results_buffer.ptr);
+    // Export all chunks, keeping them alive until the lookup is done
+    std::vector<ArrowSchema> arrow_schemas(array_chunks.size());
+    std::vector<ArrowArray> arrow_arrays(array_chunks.size());
+    size_t num_exported = 0;
+    auto release_chunks = [&]() {
+        for (size_t i = 0; i < num_exported; i++) {
+            arrow_schemas[i].release(&arrow_schemas[i]);
+            arrow_arrays[i].release(&arrow_arrays[i]);
+        }
+    };
 
-    // Write output (one chunk at a time)
-    int write_offset = 0;
-    for (const pybind11::handle array : array_chunks) {
-        ArrowSchema arrow_schema;
-        ArrowArray arrow_array;
-        extract_py_array_schema(array, arrow_array, arrow_schema);
-        auto input_ptr = (int64_t*)arrow_array.buffers[1];
-        indexer.lookup(
-            input_ptr, results_ptr + write_offset, arrow_array.length);
-        write_offset += arrow_array.length;
+    std::vector<IntIndexer::LookupSpan> spans;
+    try {
+        size_t total_size = 0;
+        for (const pybind11::handle array : array_chunks) {
+            ArrowSchema& arrow_schema = arrow_schemas[num_exported];
+            ArrowArray& arrow_array = arrow_arrays[num_exported];
+            extract_py_array_schema(array, arrow_array, arrow_schema);
+            num_exported++;
+            if (std::string(arrow_schema.format) != "l") {
+                throw TileDBSOMAError(
+                    "[get_indexer] pyarrow lookups must be int64, not " +
+                    std::string(arrow_schema.format));
+            }
+            spans.push_back(
+                {static_cast<const int64_t*>(arrow_array.buffers[1]) +
+                     arrow_array.offset,
+                 nullptr,
+                 static_cast<size_t>(arrow_array.length)});
+            total_size += arrow_array.length;
+        }
 
-        arrow_schema.release(&arrow_schema);
-        arrow_array.release(&arrow_array);
+        auto results = lookup_output(out, total_size);
+        int64_t* results_ptr = results.mutable_data();
+        for (auto& span : spans) {
+            span.results = results_ptr;
+            results_ptr += span.size;
+        }
+        {
+            py::gil_scoped_release release;
+            indexer.lookup(spans);
+        }
+        release_chunks();
+        return results;
+    } catch (...) {
+        release_chunks();
+        throw;
     }
-    return results;
 }
 
 void load_reindexer(py::module& m) {
@@ -148,10 +194,18 @@ void load_reindexer(py::module& m) {
         // Perform lookup for a large input array of keys and writes the
         // looked up values into previously allocated array (works for the
         // cases in which python and R pre-allocate the array)
-        .def("get_indexer_general", get_indexer_general)
+        .def(
+            "get_indexer_general",
+            get_indexer_general,
+            "lookups"_a,
+            "out"_a.noconvert() = py::none())
         // If the input is not arrow (does not have _export_to_c attribute),
         // it will be handled using a general input method.
-        .def("get_indexer_pyarrow", get_indexer_py_arrow);
+        .def(
+            "get_indexer_pyarrow",
+            get_indexer_py_arrow,
+            "lookups"_a,
+            "out"_a.noconvert() = py::none());
 }
 
 }  // namespace libtiledbsomacpp
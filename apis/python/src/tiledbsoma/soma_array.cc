@@ -30,6 +30,9 @@
  * This file defines the SOMAArray bindings.
  */
 
+#include <condition_variable>
+#include <deque>
+
 #include "common.h"
 
 #define DENUM(x) .value(#x, TILEDB_##x)
@@ -82,7 +85,123 @@ void write_coords(
     }
 }
 
+/**
+ * @brief Returns the values of the enumeration of a column as a list, or None
+ * if the column has no enumeration, or one of a type without list support.
+ */
+py::object enumeration_values(
+    SOMAArray& array, const std::string& column_name) {
+    if (!array.tiledb_schema()->has_attribute(column_name)) {
+        return py::none();
+    }
+    auto enmr = array.get_enumeration_on_attr(column_name);
+    if (!enmr.has_value()) {
+        return py::none();
+    }
+    switch (enmr->type()) {
+        case TILEDB_STRING_ASCII:
+        case TILEDB_STRING_UTF8:
+        case TILEDB_CHAR:
+            return py::cast(enmr->as_vector<std::string>());
+        case TILEDB_INT8:
+            return py::cast(enmr->as_vector<int8_t>());
+        case TILEDB_UINT8:
+            return py::cast(enmr->as_vector<uint8_t>());
+        case TILEDB_INT16:
+            return py::cast(enmr->as_vector<int16_t>());
+        case TILEDB_UINT16:
+            return py::cast(enmr->as_vector<uint16_t>());
+        case TILEDB_INT32:
+            return py::cast(enmr->as_vector<int32_t>());
+        case TILEDB_UINT32:
+            return py::cast(enmr->as_vector<uint32_t>());
+        case TILEDB_INT64:
+            return py::cast(enmr->as_vector<int64_t>());
+        case TILEDB_UINT64:
+            return py::cast(enmr->as_vector<uint64_t>());
+        case TILEDB_FLOAT32:
+            return py::cast(enmr->as_vector<float>());
+        case TILEDB_FLOAT64:
+            return py::cast(enmr->as_vector<double>());
+        default:
+            return py::none();
+    }
+}
+
+/**
+ * @brief Returns an identifier of the values of the enumeration of a column,
+ * or None if the column has no enumeration. Enumerations are only extended,
+ * so their name and number of values identify them within an array. This
+ * does not copy the values.
+ */
+py::object enumeration_version(
+    SOMAArray& array, const std::string& column_name) {
+    if (!array.tiledb_schema()->has_attribute(column_name)) {
+        return py::none();
+    }
+    auto enmr = array.get_enumeration_on_attr(column_name);
+    if (!enmr.has_value()) {
+        return py::none();
+    }
+    auto ctx = array.ctx()->tiledb_ctx();
+    const void* buffer;
+    uint64_t offsets_size;
+    ctx->handle_error(tiledb_enumeration_get_offsets(
+        ctx->ptr().get(), enmr->ptr().get(), &buffer, &offsets_size));
+    size_t num_values;
+    if (offsets_size > 0) {
+        num_values = offsets_size / sizeof(uint64_t);
+    } else {
+        uint64_t data_size;
+        ctx->handle_error(tiledb_enumeration_get_data(
+            ctx->ptr().get(), enmr->ptr().get(), &buffer, &data_size));
+        num_values = data_size / (tiledb_datatype_size(enmr->type()) *
+                                  enmr->cell_val_num());
+    }
+    return py::make_tuple(array.uri(), enmr->name(), num_values);
+}
+
+/**
+ * @brief A queue of the tokens of reads submitted by `submit_next` that have
+ * completed. Reads push their token from the thread that ran them, without
+ * taking the GIL, and Python waits for them with `wait_read_done`.
+ */
+class ReadCompletions {
+   public:
+    void push(uint64_t token) {
+        {
+            const std::lock_guard<std::mutex> lock(mutex_);
+            tokens_.push_back(token);
+        }
+        cv_.notify_one();
+    }
+
+    uint64_t pop() {
+        std::unique_lock<std::mutex> lock(mutex_);
+        cv_.wait(lock, [this] { return !tokens_.empty(); });
+        auto token = tokens_.front();
+        tokens_.pop_front();
+        return token;
+    }
+
+   private:
+    std::mutex mutex_;
+    std::condition_variable cv_;
+    std::deque<uint64_t> tokens_;
+};
+
+ReadCompletions& read_completions() {
+    // Never destroyed, as reads may complete during interpreter shutdown
+    static auto completions = new ReadCompletions();
+    return *completions;
+}
+
 void load_soma_array(py::module& m) {
+    m.def("wait_read_done", []() {
+        py::gil_scoped_release release;
+        return read_completions().pop();
+    });
+
     py::class_<SOMAArray, SOMAObject>(m, "SOMAArray")
         .def(
             py::init(
@@ -140,9 +259,23 @@ void load_soma_array(py::module& m) {
                         "init_query_condition");
                     try {
                         // Column names will be updated with columns present
-                        // in the query condition
+                        // in the query condition. Predicates on enumerated
+                        // columns look up the enumeration values to compare
+                        // codes instead.
                         auto new_column_names =
-                            init_pyqc(py_schema, column_names)
+                            init_pyqc(
+                                py_schema,
+                                column_names,
+                                py::cpp_function(
+                                    [&array](const std::string& column_name) {
+                                        return enumeration_values(
+                                            array, column_name);
+                                    }),
+                                py::cpp_function(
+                                    [&array](const std::string& column_name) {
+                                        return enumeration_version(
+                                            array, column_name);
+                                    }))
                                 .cast<std::vector<std::string>>();
                         // Update the column_names list if it was not empty,
                         // otherwise continue selecting all columns with an
@@ -158,7 +291,8 @@ void load_soma_array(py::module& m) {
                              .ptr()
                              .get();
                 }
-                array.reset(column_names);
+                array.reset(
+                    column_names, array.batch_size(), array.result_order());
 
                 // Release python GIL after we're done accessing python
                 // objects
@@ -212,6 +346,11 @@ void load_soma_array(py::module& m) {
             })
         .def("context", &SOMAArray::ctx)
 
+        // A new reader sharing this array's opened TileDB array
+        .def(
+            "clone",
+            [](SOMAArray& array) { return std::make_unique<SOMAArray>(array); })
+
         // After this are short functions expected to be invoked when the coords
         // are Python list/tuple, or NumPy arrays.  Arrow arrays are in this
         // long if-else-if function.
@@ -491,6 +630,9 @@ void load_soma_array(py::module& m) {
                 const std::vector<std::pair<float, float>>&)>(
                 &SOMAArray::set_dim_ranges))
 
+        .def("enumeration_values", enumeration_values, "column_name"_a)
+        .def("enumeration_version", enumeration_version, "column_name"_a)
+
         .def("results_complete", &SOMAArray::results_complete)
 
         .def(
@@ -514,6 +656,22 @@ void load_soma_array(py::module& m) {
                 return std::nullopt;
             })
 
+        // Submits the next read without waiting for it. Unless this returns
+        // false, the token is passed to `wait_read_done` once the read has
+        // completed, and `read_next` then returns its results.
+        .def(
+            "submit_next",
+            [](SOMAArray& array, uint64_t token) {
+                py::gil_scoped_release release;
+                if (!array.submit_next()) {
+                    return false;
+                }
+                array.on_read_done(
+                    [token]() { read_completions().push(token); });
+                return true;
+            },
+            "token"_a)
+
         .def("write", write)
 
         .def("write_coords", write_coords)
@@ -528,6 +686,8 @@ void load_soma_array(py::module& m) {
 
         .def_property_readonly("result_order", &SOMAArray::result_order)
 
+        .def_property_readonly("batch_size", &SOMAArray::batch_size)
+
         .def_property_readonly(
             "timestamp",
             [](SOMAArray& array) -> py::object {
@@ -644,10 +804,26 @@ void load_soma_array(py::module& m) {
 
         .def("delete_metadata", &SOMAArray::delete_metadata)
 
+        .def(
+            "update_metadata",
+            update_metadata,
+            "values"_a,
+            "deleted_keys"_a = std::vector<std::string>())
+
         .def(
             "get_metadata",
             py::overload_cast<const std::string&>(&SOMAArray::get_metadata))
 
+        .def(
+            "get_metadata_value",
+            [](SOMAArray& array, const std::string& key) {
+                return get_metadata_value(array, key);
+            })
+
+        .def_property_readonly(
+            "metadata_keys",
+            [](SOMAArray& array) { return metadata_keys(array); })
+
         .def("has_metadata", &SOMAArray::has_metadata)
 
         .def("metadata_num", &SOMAArray::metadata_num);
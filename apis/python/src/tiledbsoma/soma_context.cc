@@ -51,6 +51,22 @@ void load_soma_context(py::module& m) {
     py::class_<SOMAContext, std::shared_ptr<SOMAContext>>(m, "SOMAContext")
         .def(py::init<>())
         .def(py::init<std::map<std::string, std::string>>())
-        .def("config", &SOMAContext::tiledb_config);
+        .def("config", &SOMAContext::tiledb_config)
+        .def("buffer_pool_stats", [](SOMAContext& ctx) {
+            auto stats = ctx.buffer_pool()->stats();
+            return py::dict(
+                "hits"_a = stats.hits,
+                "misses"_a = stats.misses,
+                "buffers_held"_a = stats.buffers_held,
+                "bytes_held"_a = stats.bytes_held);
+        })
+        .def("array_cache_stats", [](SOMAContext& ctx) {
+            auto stats = ctx.array_cache()->stats();
+            return py::dict(
+                "hits"_a = stats.hits,
+                "misses"_a = stats.misses,
+                "invalidations"_a = stats.invalidations,
+                "entries"_a = stats.entries);
+        });
 };
 }  // namespace libtiledbsomacpp
@@ -105,6 +105,19 @@ void load_soma_group(py::module& m) {
                 set_metadata(group, key, value);
             })
         .def("delete_metadata", &SOMAGroup::delete_metadata)
+        .def(
+            "update_metadata",
+            update_metadata,
+            "values"_a,
+            "deleted_keys"_a = std::vector<std::string>())
+        .def(
+            "get_metadata_value",
+            [](SOMAGroup& group, const std::string& key) {
+                return get_metadata_value(group, key);
+            })
+        .def_property_readonly(
+            "metadata_keys",
+            [](SOMAGroup& group) { return metadata_keys(group); })
         .def("has_metadata", &SOMAGroup::has_metadata)
         .def("metadata_num", &SOMAGroup::metadata_num);
 }
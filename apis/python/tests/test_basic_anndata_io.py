@@ -7,6 +7,7 @@ from typing import Optional
 import anndata
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 import scipy
 import somacore
@@ -1349,3 +1350,58 @@ def test_nan_append(conftest_pbmc_small, dtype, nans, new_obs_ids):
         measurement_name="RNA",
         registration_mapping=rd,
     )
+
+
+def test_id_index(conftest_pbmc_small, tmp_path):
+    adata = conftest_pbmc_small
+    adata.uns = dict()
+    uri = tiledbsoma.io.from_anndata(
+        tmp_path.as_posix(), adata, measurement_name="RNA", id_index=True
+    )
+
+    obs_ids = adata.obs_names.to_numpy()
+    lookups = np.concatenate([obs_ids[::-3], ["not-a-cell"]])
+    expected = np.concatenate([np.arange(len(obs_ids))[::-3], [-1]])
+    with tiledbsoma.Experiment.open(uri) as exp:
+        assert "obs_id_index" in exp
+        assert "var_id_index" in exp.ms["RNA"]
+        assert np.array_equal(exp.obs.lookup_ids(lookups), expected)
+        # The same as a scan of the column
+        assert np.array_equal(
+            exp.obs.lookup_ids(pa.chunked_array([lookups]), column_name="obs_id"),
+            expected,
+        )
+        assert np.array_equal(
+            exp.ms["RNA"].var.lookup_ids(adata.var_names[[5, 0]]), [5, 0]
+        )
+        assert len(exp.obs.lookup_ids([])) == 0
+
+    # Appends maintain the index
+    adata2 = adata.copy()
+    adata2.obs.index = adata2.obs.index + "_2"
+    rd = tiledbsoma.io.register_anndatas(
+        uri,
+        [adata2],
+        measurement_name="RNA",
+        obs_field_name="obs_id",
+        var_field_name="var_id",
+    )
+    tiledbsoma.io.from_anndata(
+        uri, adata2, measurement_name="RNA", registration_mapping=rd
+    )
+    with tiledbsoma.Experiment.open(uri) as exp:
+        assert np.array_equal(
+            exp.obs.lookup_ids([obs_ids[1], obs_ids[1] + "_2"]),
+            [1, len(obs_ids) + 1],
+        )
+
+    # Updates renaming IDs drop the index
+    with tiledbsoma.Experiment.open(uri) as exp:
+        obs = exp.obs.read().concat().to_pandas().drop(columns="soma_joinid")
+    obs["obs_id"] = obs["obs_id"] + "_renamed"
+    with tiledbsoma.Experiment.open(uri, "w") as exp:
+        tiledbsoma.io.update_obs(exp, obs)
+    with tiledbsoma.Experiment.open(uri) as exp:
+        with pytest.raises(ValueError):
+            exp.obs.lookup_ids(obs_ids)
+        assert exp.obs.lookup_ids([obs_ids[0]], column_name="obs_id")[0] == -1
@@ -563,3 +563,39 @@ def test_collection_reopen(tmp_path):
                 assert col1.tiledb_timestamp <= now
                 assert col2.tiledb_timestamp <= now
                 assert col2.tiledb_timestamp <= now
+
+
+def test_collection_prefetch(tmp_path: pathlib.Path):
+    uri = tmp_path.as_uri()
+    with soma.Collection.create(uri) as outer:
+        dog = outer.add_new_collection("dog")
+        dog.add_new_dense_ndarray("hachiko", type=pa.float64(), shape=(1, 2, 3))
+        shiba = dog.add_new_collection("shiba")
+        shiba.add_new_sparse_ndarray("kabosu", type=pa.uint8(), shape=(10,))
+        outer.add_new_collection("bird")
+        create_and_populate_dataframe((tmp_path / "louis").as_posix())
+        with soma.DataFrame.open((tmp_path / "louis").as_posix()) as louis:
+            outer["louis"] = louis
+
+    with soma.Collection.open(uri) as outer:
+        with pytest.raises(KeyError):
+            outer.prefetch(["dog", "cat"])
+        assert all(entry.soma is None for entry in outer._contents.values())
+
+        assert outer.prefetch(["dog", "louis"]) is outer
+        assert outer._contents["dog"].soma is not None
+        assert outer._contents["louis"].soma is not None
+        assert outer._contents["bird"].soma is None
+        dog = outer["dog"]
+        assert dog._contents["shiba"].soma is None
+        assert outer["louis"].read().concat()["foo"].to_pylist() == [10, 20, 30, 40, 50]
+
+        outer.prefetch(recursive=True)
+        assert "(unopened)" not in repr(outer)
+        shiba = dog["shiba"]
+        assert shiba["kabosu"].mode == "r"
+        assert outer["dog"] is dog
+
+    # Prefetched children are owned, and closed with their collection
+    for elem in (dog, shiba, shiba["kabosu"], dog["hachiko"]):
+        assert elem.closed
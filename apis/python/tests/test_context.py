@@ -2,8 +2,10 @@ import datetime
 import time
 from unittest import mock
 
+import pyarrow as pa
 import pytest
 
+import tiledbsoma as soma
 import tiledbsoma.options._soma_tiledb_context as stc
 import tiledb
 
@@ -131,3 +133,62 @@ def test_replace_config_after_construction():
             new_tdb_ctx = new_soma_ctx.tiledb_ctx
         mock_ctx.assert_called_once()
         assert new_tdb_ctx.config()["vfs.s3.region"] == "us-west-2"
+
+
+def test_buffer_pool_stats(tmp_path):
+    """Verifies that reads sharing a context reuse pooled buffers."""
+    uri = tmp_path.as_posix()
+    context = stc.SOMATileDBContext()
+    schema = pa.schema([("soma_joinid", pa.int64()), ("label", pa.large_string())])
+    with soma.DataFrame.create(uri, schema=schema, context=context) as sdf:
+        sdf.write(
+            pa.Table.from_pydict(
+                {
+                    "soma_joinid": list(range(100)),
+                    "label": [str(i) for i in range(100)],
+                }
+            )
+        )
+
+    assert context.buffer_pool_stats()["hits"] == 0
+    for _ in range(2):
+        with soma.DataFrame.open(uri, context=context) as sdf:
+            assert len(sdf.read().concat()) == 100
+    stats = context.buffer_pool_stats()
+    assert stats["hits"] > 0
+    assert stats["bytes_held"] > 0
+
+    new_context = context.replace(tiledb_config={"soma.buffer_pool_bytes": 0})
+    with soma.DataFrame.open(uri, context=new_context) as sdf:
+        assert len(sdf.read().concat()) == 100
+    assert new_context.buffer_pool_stats()["bytes_held"] == 0
+
+
+def test_array_cache_stats(tmp_path):
+    """Verifies that opens at the same timestamp share a cached array."""
+    uri = tmp_path.as_posix()
+    context = stc.SOMATileDBContext(tiledb_config={"soma.array_cache_entries": 4})
+    schema = pa.schema([("soma_joinid", pa.int64()), ("label", pa.large_string())])
+    data = pa.Table.from_pydict({"soma_joinid": [0, 1], "label": ["a", "b"]})
+    with soma.DataFrame.create(
+        uri, schema=schema, context=context, tiledb_timestamp=1
+    ) as sdf:
+        sdf.write(data)
+
+    for _ in range(3):
+        with soma.DataFrame.open(uri, context=context, tiledb_timestamp=2) as sdf:
+            assert len(sdf.read().concat()) == 2
+    stats = context.array_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] >= 2
+    assert stats["entries"] == 1
+
+    # Closing a write through the context drops the cached array
+    with soma.DataFrame.open(uri, "w", context=context, tiledb_timestamp=2) as sdf:
+        sdf.write(pa.Table.from_pydict({"soma_joinid": [2], "label": ["c"]}))
+    assert context.array_cache_stats()["invalidations"] == 1
+    with soma.DataFrame.open(uri, context=context, tiledb_timestamp=2) as sdf:
+        assert len(sdf.read().concat()) == 3
+    assert context.array_cache_stats()["misses"] == 2
+
+    assert stc.SOMATileDBContext().array_cache_stats()["entries"] == 0
@@ -1,7 +1,9 @@
+import asyncio
 import contextlib
 import datetime
 import os
 from typing import Dict, List
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -11,6 +13,7 @@ import somacore
 from pandas.api.types import union_categoricals
 
 import tiledbsoma as soma
+from tiledbsoma import _soma_array
 import tiledb
 
 from tests._util import raises_no_typeguard
@@ -675,10 +678,34 @@ def make_multiply_indexed_dataframe(tmp_path, index_column_names: List[str]):
             "throws": None,
         },
         {
-            "name": "partitioned reads unimplemented",
+            "name": "1D indexing second of two partitions",
             "index_column_names": ["0_thru_5"],
             "coords": [],
             "partitions": somacore.IOfN(1, 2),
+            "A": [13, 14, 15],
+            "throws": None,
+        },
+        {
+            "name": "1D indexing partitioned slice",
+            "index_column_names": ["0_thru_5"],
+            "coords": [slice(1, None)],
+            "partitions": somacore.IOfN(0, 2),
+            "A": [11, 12],
+            "throws": None,
+        },
+        {
+            "name": "1D indexing partitioned points",
+            "index_column_names": ["0_thru_5"],
+            "coords": [[0, 1, 2, 4, 5]],
+            "partitions": somacore.IOfN(2, 3),
+            "A": [14, 15],
+            "throws": None,
+        },
+        {
+            "name": "partitioned reads require an integer first dimension",
+            "index_column_names": ["strings_aaa", "zero_one"],
+            "coords": [],
+            "partitions": somacore.IOfN(1, 2),
             "A": None,
             "throws": ValueError,
         },
@@ -1618,3 +1645,185 @@ def test_only_evolve_schema_when_enmr_is_extended(tmp_path):
     # subtract 1 for the __schema/__enumerations directory;
     # only looking at fragment files
     assert len(vfs.ls(os.path.join(uri, "__schema"))) - 1 == 3
+
+
+@pytest.mark.parametrize("count", [1, 3, 4, 100])
+def test_read_batch_size(simple_data_frame, count):
+    _, sdf, n_data, _ = simple_data_frame
+    tables = list(sdf.read(batch_size=somacore.BatchSize(count=count)))
+    assert all(len(t) <= count for t in tables)
+    assert len(tables) == -(-n_data // count)
+    assert pa.concat_tables(tables)["index"].to_pylist() == [0, 1, 2, 3]
+
+    # Column selection and value filters keep the batch size
+    tables = list(
+        sdf.read(
+            column_names=["A"],
+            value_filter="A > 10",
+            batch_size=somacore.BatchSize(count=count),
+        )
+    )
+    assert all(len(t) <= count for t in tables)
+    assert pa.concat_tables(tables)["A"].to_pylist() == [11, 12, 13]
+
+    sdf.close()
+
+
+def test_read_batch_size_long_strings(tmp_path):
+    # Cells longer than the initial variable-length buffer of a count batch
+    schema = pa.schema([("soma_joinid", pa.int64()), ("s", pa.large_string())])
+    values = ["a" * 200_000, "b", "c" * 300_000]
+    with soma.DataFrame.create(tmp_path.as_posix(), schema=schema) as sdf:
+        sdf.write(pa.Table.from_pydict({"soma_joinid": [0, 1, 2], "s": values}))
+
+    with soma.DataFrame.open(tmp_path.as_posix()) as sdf:
+        tables = list(sdf.read(batch_size=somacore.BatchSize(count=1)))
+    assert all(len(t) <= 1 for t in tables)
+    assert pa.concat_tables(tables)["s"].to_pylist() == values
+
+
+def test_read_batch_size_invalid(simple_data_frame):
+    _, sdf, _, _ = simple_data_frame
+    with pytest.raises(ValueError):
+        sdf.read(batch_size=somacore.BatchSize(count=0))
+    sdf.close()
+
+
+@pytest.mark.parametrize("result_order", ["auto", "row-major"])
+def test_read_split_points(tmp_path, result_order):
+    """Reads of many scattered points are split into concurrent sub-queries."""
+    uri = tmp_path.as_posix()
+    schema = pa.schema([("soma_joinid", pa.int64()), ("A", pa.int64())])
+    with soma.DataFrame.create(uri, schema=schema) as sdf:
+        sdf.write(
+            pa.Table.from_pydict(
+                {"soma_joinid": np.arange(1000), "A": np.arange(1000) % 7}
+            )
+        )
+
+    points = np.random.default_rng(0).choice(1000, size=200, replace=False)
+    with soma.DataFrame.open(uri) as sdf:
+        expected = sdf.read([points], result_order=result_order).concat()
+        with mock.patch.object(_soma_array, "_SPLIT_READ_RANGES", 16):
+            actual = sdf.read([points], result_order=result_order).concat()
+            filtered = sdf.read(
+                [points],
+                column_names=["A"],
+                value_filter="A == 3",
+                result_order=result_order,
+            ).concat()
+            # Reads with too few points to split are passed on unsorted
+            assert sdf._split_point_coords(None, [points[:16]]) is None
+            # Points sorted to count their ranges are passed on sorted
+            (coords,), sort_keys = sdf._split_point_coords(None, [np.arange(17)[::-1]])
+            assert coords[0].tolist() == list(range(17))
+            assert sort_keys is None
+
+    assert len(expected) == 200
+    assert actual.sort_by("soma_joinid").equals(expected.sort_by("soma_joinid"))
+    if result_order == "row-major":
+        assert actual.equals(expected)
+    assert filtered.column_names == ["A"]
+    assert filtered["A"].to_pylist() == [3] * int(np.sum(points % 7 == 3))
+
+
+def test_read_reuse_handle(tmp_path):
+    """Reads opted into handle reuse share the object's open array."""
+    uri = tmp_path.as_posix()
+    schema = pa.schema([("soma_joinid", pa.int64()), ("A", pa.int64())])
+    with soma.DataFrame.create(uri, schema=schema) as sdf:
+        sdf.write(pa.Table.from_pydict({"soma_joinid": range(10), "A": range(10)}))
+
+    context = soma.SOMATileDBContext(tiledb_config={"soma.read_reuse_handle": True})
+    with soma.DataFrame.open(uri, context=context) as sdf:
+        assert sdf._handle.reuse_handle
+        for i in range(3):
+            tbl = sdf.read([[i, i + 5]]).concat()
+            assert sorted(tbl["A"].to_pylist()) == [i, i + 5]
+        tbl = sdf.read(column_names=["A"], value_filter="A > 6").concat()
+        assert tbl.column_names == ["A"]
+        assert sorted(tbl["A"].to_pylist()) == [7, 8, 9]
+
+    with soma.DataFrame.open(uri) as sdf:
+        assert not sdf._handle.reuse_handle
+        assert len(sdf.read().concat()) == 10
+
+
+def test_read_is_zero_copy(tmp_path):
+    """Read batches are handed to Arrow without copying the column data."""
+    n = 100_000
+    schema = pa.schema(
+        [
+            ("soma_joinid", pa.int64()),
+            ("i", pa.int64()),
+            ("f", pa.float64()),
+            ("s", pa.large_string()),
+        ]
+    )
+    with soma.DataFrame.create(tmp_path.as_posix(), schema=schema) as sdf:
+        sdf.write(
+            pa.Table.from_pydict(
+                {
+                    "soma_joinid": np.arange(n, dtype=np.int64),
+                    "i": np.arange(n, dtype=np.int64),
+                    "f": np.arange(n, dtype=np.float64),
+                    "s": [f"value-{i}" for i in range(n)],
+                },
+                schema=schema,
+            )
+        )
+
+    with soma.DataFrame.open(tmp_path.as_posix()) as sdf:
+        before = pa.total_allocated_bytes()
+        tables = list(sdf.read())
+        copied = pa.total_allocated_bytes() - before
+
+    assert sum(len(t) for t in tables) == n
+    assert tables[0]["s"][1].as_py() == "value-1"
+    # Nothing from the Arrow memory pool backs the imported columns
+    assert copied < sum(t.nbytes for t in tables) // 100
+
+
+def test_read_async(simple_data_frame):
+    _, sdf, n_data, _ = simple_data_frame
+
+    async def read_all():
+        batched = [
+            tbl async for tbl in sdf.read_async(batch_size=somacore.BatchSize(count=1))
+        ]
+        concurrent = await asyncio.gather(
+            *(
+                sdf.read_async(coords=[[i]], column_names=["A"]).concat()
+                for i in range(n_data)
+            ),
+            sdf.read_async(value_filter="A > 11").concat(),
+            sdf.read_async(coords=[[]]).concat(),
+        )
+        return batched, concurrent
+
+    batched, concurrent = asyncio.run(read_all())
+    assert len(batched) == n_data
+    assert pa.concat_tables(batched).equals(sdf.read().concat())
+    assert [tbl["A"].to_pylist() for tbl in concurrent[:n_data]] == [
+        [10],
+        [11],
+        [12],
+        [13],
+    ]
+    assert concurrent[n_data]["A"].to_pylist() == [12, 13]
+    assert len(concurrent[n_data + 1]) == 0
+
+    # A cancelled read finishes in the background; later reads are unaffected
+    async def cancel_read():
+        tables = sdf.read_async(batch_size=somacore.BatchSize(count=1))
+        task = asyncio.ensure_future(tables.__anext__())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        del tables, task
+        return await sdf.read_async().concat()
+
+    assert asyncio.run(cancel_read()).equals(sdf.read().concat())
+
+    sdf.close()
@@ -246,3 +246,34 @@ def test_experiment_reopen(tmp_path):
                 assert exp1.tiledb_timestamp <= now
                 assert exp2.tiledb_timestamp <= now
                 assert exp2.tiledb_timestamp <= now
+
+
+def test_experiment_open_prefetch(tmp_path):
+    basedir = tmp_path.as_uri()
+    with soma.Experiment.create(basedir) as experiment:
+        experiment["obs"] = create_and_populate_obs(urljoin(basedir, "obs"))
+        ms = experiment.add_new_collection("ms")
+        measurement = ms.add_new_collection("RNA", soma.Measurement)
+        measurement["var"] = create_and_populate_var(urljoin(measurement.uri, "var"))
+        x = measurement.add_new_collection("X")
+        x["data"] = create_and_populate_sparse_nd_array(urljoin(x.uri, "data"))
+
+    with raises_no_typeguard(ValueError):
+        soma.Experiment.open(basedir, prefetch="everything")
+
+    with soma.Experiment.open(basedir) as exp:
+        assert exp._contents["ms"].soma is None
+
+    with soma.Experiment.open(basedir, prefetch="structure") as exp:
+        # Collections are opened, arrays are left to be opened on access
+        rna = exp._contents["ms"].soma._contents["RNA"].soma
+        assert rna._contents["X"].soma is not None
+        assert rna._contents["var"].soma is None
+        assert exp._contents["obs"].soma is None
+        assert rna["X"]._contents["data"].soma is None
+        data = exp.ms["RNA"].X["data"]
+        assert data is exp._contents["ms"].soma["RNA"]["X"]._contents["data"].soma
+        assert data.read().tables().concat()["soma_data"].to_pylist() == [7, 8, 9]
+        assert exp.obs.count == 5
+
+    assert data.closed
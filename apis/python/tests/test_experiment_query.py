@@ -9,10 +9,10 @@ import pyarrow as pa
 import pytest
 from pyarrow import ArrowInvalid
 from scipy import sparse
-from somacore import AxisQuery, options
+from somacore import AxisQuery, ExperimentAxisQuery, options
 
 import tiledbsoma as soma
-from tiledbsoma import SOMATileDBContext, _factory
+from tiledbsoma import SOMATileDBContext, _factory, _joinid_cache
 from tiledbsoma._collection import CollectionBase
 from tiledbsoma.experiment_query import X_as_series
 import tiledb
@@ -299,31 +299,43 @@ def test_experiment_query_combo(soma_experiment):
 
 @pytest.mark.parametrize("n_obs,n_vars", [(1001, 99)])
 def test_experiment_query_batch_size(soma_experiment):
-    """
-    batch_size is currently not supported by this implementation of SOMA.
-    This test merely verifies that the batch_size parameter is accepted
-    but as a no-op.
-    """
     with soma.ExperimentAxisQuery(soma_experiment, "RNA") as query:
-        tbls = query.obs(batch_size=options.BatchSize(count=100))
-        assert len(list(tbls)) == 1  # batch_size currently not implemented
+        tbls = list(query.obs(batch_size=options.BatchSize(count=100)))
+        assert len(tbls) > 1
+        assert all(len(t) <= 100 for t in tbls)
+        assert sum(len(t) for t in tbls) == 1001
+
+        tbls = list(query.X("raw", batch_size=options.BatchSize(count=100)).tables())
+        assert all(len(t) <= 100 for t in tbls)
+        assert sum(len(t) for t in tbls) == query.X("raw").tables().concat().num_rows
 
 
 @pytest.mark.parametrize("n_obs,n_vars", [(10, 10)])
 def test_experiment_query_partitions(soma_experiment):
-    """
-    partitions is currently not supported by this implementation of SOMA.
-    This test checks if a ValueError is raised if a partitioning is requested.
-    """
     with soma.ExperimentAxisQuery(soma_experiment, "RNA") as query:
-        with pytest.raises(ValueError):
-            query.obs(partitions=options.IOfN(i=0, n=3)).concat()
-
-        with pytest.raises(ValueError):
-            query.var(partitions=options.IOfN(i=0, n=3)).concat()
-
-        with pytest.raises(ValueError):
-            query.X("raw", partitions=options.IOfN(i=0, n=3)).concat()
+        for axis in ("obs", "var"):
+            whole = getattr(query, axis)().concat()
+            parts = [
+                getattr(query, axis)(partitions=options.IOfN(i=i, n=3)).concat()
+                for i in range(3)
+            ]
+            assert all(len(p) > 0 for p in parts)
+            assert (
+                pa.concat_tables(parts)
+                .sort_by("soma_joinid")
+                .equals(whole.sort_by("soma_joinid"))
+            )
+
+        whole = query.X("raw").tables().concat()
+        parts = [
+            query.X("raw", partitions=options.IOfN(i=i, n=3)).tables().concat()
+            for i in range(3)
+        ]
+        assert sum(len(p) for p in parts) == len(whole)
+        joinids = pa.concat_arrays(
+            [p["soma_dim_0"].combine_chunks() for p in parts]
+        ).to_numpy()
+        assert np.array_equal(np.sort(joinids), np.sort(whole["soma_dim_0"].to_numpy()))
 
 
 @pytest.mark.parametrize("n_obs,n_vars", [(10, 10)])
@@ -436,6 +448,70 @@ def test_joinid_caching(soma_experiment):
     assert ad.n_vars == len(var)
 
 
+@pytest.mark.parametrize("n_obs,n_vars,X_layer_names", [(1001, 99, ["A"])])
+def test_shared_joinid_cache(soma_experiment):
+    context = SOMATileDBContext(tiledb_config={"soma.joinid_cache_bytes": 1 << 20})
+    exp = get_soma_experiment_with_context(soma_experiment, context)
+    obs_query = soma.AxisQuery(value_filter="label in ['17', '19', '21']")
+    var_query = soma.AxisQuery(coords=(np.arange(0, 50, 3),))
+
+    with exp.axis_query("RNA", obs_query=obs_query, var_query=var_query) as query:
+        expected_obs = query.obs_joinids()
+        expected_var = query.var_joinids()
+    assert context.joinid_cache.stats()["entries"] == 2
+
+    with mock.patch.object(
+        soma.DataFrame, "read", side_effect=AssertionError("not cached")
+    ):
+        with exp.axis_query(
+            "RNA",
+            obs_query=soma.AxisQuery(value_filter="label in ['17', '19', '21']"),
+            var_query=soma.AxisQuery(coords=(np.arange(0, 50, 3),)),
+        ) as query:
+            assert query.obs_joinids().equals(expected_obs)
+            assert query.var_joinids().equals(expected_var)
+            assert query.n_obs == 3
+            query.X("A").coos().concat()
+    assert context.joinid_cache.stats()["hits"] == 2
+
+    # Other filters, coords and measurements are distinct entries
+    with exp.axis_query(
+        "RNA", obs_query=soma.AxisQuery(coords=(slice(0, 9),))
+    ) as query:
+        assert query.n_obs == 10
+        assert query.n_vars == 99
+    assert context.joinid_cache.stats()["entries"] == 4
+
+    # Joinids read along with other columns are cached too
+    context.joinid_cache.clear()
+    with exp.axis_query("RNA", obs_query=obs_query) as query:
+        query.obs(column_names=["label"]).concat()
+    assert context.joinid_cache.stats()["entries"] == 1
+
+    # The cache is disabled by default
+    assert SOMATileDBContext().joinid_cache.max_bytes == 0
+
+
+@pytest.mark.parametrize("n_obs,n_vars,X_layer_names", [(101, 11, ["A"])])
+def test_shared_joinid_cache_somacore_internals(soma_experiment):
+    """The shared joinid cache replaces private parts of somacore's axis
+    query. Fail loudly if a somacore upgrade changes them."""
+    context = SOMATileDBContext(tiledb_config={"soma.joinid_cache_bytes": 1 << 20})
+    exp = get_soma_experiment_with_context(soma_experiment, context)
+    with exp.axis_query("RNA") as query:
+        assert isinstance(query._joinids, _joinid_cache._SharedJoinIDs)
+        assert query.obs_joinids() is query._joinids._cached_obs
+
+        plain = ExperimentAxisQuery(exp, "RNA")
+        assert _joinid_cache._somacore_supports_sharing(plain)
+
+        plain._joinids = object()
+        with pytest.warns(RuntimeWarning):
+            _joinid_cache._share_query_joinids(
+                plain, context.joinid_cache, scope=(), measurement_name="RNA"
+            )
+
+
 @pytest.mark.parametrize("n_obs,n_vars,X_layer_names", [(1001, 99, ["A", "B", "C"])])
 def test_X_layers(soma_experiment):
     """Verify multi-layer-X handling"""
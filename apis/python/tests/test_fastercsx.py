@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+import tiledbsoma as soma
+import tiledbsoma.pytiledbsoma as clib
+from tiledbsoma import IntIndexer, SOMATileDBContext
+
+
+@pytest.mark.parametrize(
+    "dtype", [np.float32, np.float64, np.int8, np.int32, np.uint64, np.bool_]
+)
+@pytest.mark.parametrize("reindex_minor", [True, False])
+def test_compress_coo(dtype: np.dtype, reindex_minor: bool) -> None:
+    context = SOMATileDBContext()
+    rng = np.random.default_rng(0)
+    major_joinids = np.array([907, 12, 33, 5001, 2])
+    minor_joinids = np.array([60, 3, 17, 41, 8, 99, 0])
+
+    dense = rng.integers(0, 3, size=(len(major_joinids), len(minor_joinids)))
+    i, j = np.nonzero(dense)
+    # Unordered input, as from an unordered read
+    order = rng.permutation(len(i))
+    i, j = i[order], j[order]
+    data = dense[i, j].astype(dtype)
+
+    major_indexer = IntIndexer(major_joinids, context=context)
+    minor_indexer = IntIndexer(minor_joinids, context=context)
+    n_minor = len(minor_joinids) if reindex_minor else 100
+    indptr, indices, values = clib.compress_coo(
+        major_indexer._reindexer,
+        minor_indexer._reindexer if reindex_minor else None,
+        (len(major_joinids), n_minor),
+        major_joinids[i],
+        minor_joinids[j],
+        data,
+    )
+    assert indptr.dtype == indices.dtype == np.int32
+    assert values.dtype == dtype
+
+    csr = sparse.csr_matrix(
+        (values, indices, indptr), shape=(len(major_joinids), n_minor), copy=False
+    )
+    assert np.shares_memory(csr.indices, indices)
+    assert csr.has_canonical_format
+    csr.check_format(full_check=True)
+
+    expected = sparse.coo_matrix(
+        (data, (i, j if reindex_minor else minor_joinids[j])),
+        shape=(len(major_joinids), n_minor),
+    )
+    assert (csr != expected.tocsr()).nnz == 0
+
+
+def test_compress_coo_out_of_range() -> None:
+    indexer = IntIndexer(np.array([10, 11]))
+    with pytest.raises(soma.SOMAError):
+        # 12 is not a key of the indexer
+        clib.compress_coo(
+            indexer._reindexer,
+            None,
+            (2, 2),
+            np.array([10, 12]),
+            np.array([0, 1]),
+            np.array([1.0, 2.0]),
+        )
+    with pytest.raises(soma.SOMAError):
+        clib.compress_coo(
+            indexer._reindexer,
+            None,
+            (2, 2),
+            np.array([10, 11]),
+            np.array([0, 2]),
+            np.array([1.0, 2.0]),
+        )
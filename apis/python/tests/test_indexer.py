@@ -6,9 +6,18 @@ import pandas as pd
 import pyarrow as pa
 import pytest
 
-from tiledbsoma._indexer import IntIndexer
+import tiledbsoma as soma
+from tiledbsoma._indexer import (
+    _INDEXER_BYTES_PER_KEY,
+    IntIndexer,
+    IntIndexerCache,
+    _cached_int_indexer,
+)
 from tiledbsoma.options import SOMATileDBContext
-from tiledbsoma.options._soma_tiledb_context import _validate_soma_tiledb_context
+from tiledbsoma.options._soma_tiledb_context import (
+    INDEXER_CACHE_BYTES,
+    _validate_soma_tiledb_context,
+)
 
 
 @pytest.mark.parametrize(
@@ -67,6 +76,12 @@ def test_duplicate_key_indexer_error(
             ],
         ),
         (list(range(1, 10000)), list(range(1, 10000))),
+        # Sorted keys forming runs, looked up in and around the runs
+        (list(range(1, 10000)), [-1, 0, 1, 9999, 10000, 2**62]),
+        (
+            list(range(0, 100)) + list(range(500, 600)) + list(range(1000, 1100)),
+            [-1, 0, 99, 100, 499, 500, 599, 600, 1000, 1099, 1100],
+        ),
         (np.array(range(1, 10000)), np.array(range(1, 10000))),
         (pa.array(range(1, 10000)), pa.array(range(1, 10000))),
         (pd.array(range(1, 10000)), pd.array(range(1, 10000))),
@@ -113,3 +128,104 @@ def test_indexer(contextual: bool, keys: np.array, lookups: np.array):
     panda_results = panda_indexer.get_indexer(lookups)
     for i in range(num_threads):
         np.testing.assert_equal(all_results[i].all(), panda_results.all())
+
+
+def test_indexer_cache():
+    context = SOMATileDBContext()
+    built = []
+
+    def build(keys):
+        built.append(keys)
+        return IntIndexer(keys, context=context)
+
+    # Room for two indexers of 100 keys
+    cache = IntIndexerCache(2 * 100 * _INDEXER_BYTES_PER_KEY)
+    keys = [np.arange(100) + 1000 * i for i in range(3)]
+
+    first = cache.get(keys[0], scope="a", build=build)
+    assert cache.get(keys[0].copy(), scope="a", build=build) is first
+    assert cache.get(pa.array(keys[0]), scope="a", build=build) is first
+    assert len(built) == 1
+    assert np.array_equal(first.get_indexer(keys[0]), np.arange(100))
+
+    # A different scope or different keys miss
+    assert cache.get(keys[0], scope="b", build=build) is not first
+    assert cache.get(keys[0][::-1], scope="a", build=build) is not first
+    assert len(built) == 3
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 3,
+        "entries": 2,
+        "bytes": 2 * 100 * _INDEXER_BYTES_PER_KEY,
+    }
+
+    # The least recently used indexer is evicted
+    cache.get(keys[1], scope="a", build=build)
+    cache.get(keys[2], scope="a", build=build)
+    cache.get(keys[1], scope="a", build=build)
+    assert len(built) == 5
+    cache.get(keys[0][::-1], scope="a", build=build)
+    assert len(built) == 6
+    cache.get(keys[1], scope="a", build=build)
+    assert len(built) == 6
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_indexer_cache_disabled():
+    assert SOMATileDBContext().indexer_cache.max_bytes == 0
+    context = SOMATileDBContext(tiledb_config={INDEXER_CACHE_BYTES: 0})
+    keys = np.arange(10)
+    first = _cached_int_indexer(keys, context=context, scope=None)
+    assert _cached_int_indexer(keys, context=context, scope=None) is not first
+    assert context.indexer_cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_indexer_cache_enabled():
+    context = SOMATileDBContext(tiledb_config={INDEXER_CACHE_BYTES: 1024**2})
+    keys = np.arange(10)
+    first = _cached_int_indexer(keys, context=context, scope=None)
+    assert _cached_int_indexer(keys, context=context, scope=None) is first
+    assert context.indexer_cache.stats()["hits"] == 1
+
+
+def test_get_indexer_out():
+    context = SOMATileDBContext()
+    keys = np.array([7, 3, 11, 5, 2], dtype=np.int64)
+    indexer = IntIndexer(keys, context=context)
+    lookups = np.array([2, 7, 4, 11, 5, 3], dtype=np.int64)
+    expected = pd.Index(keys).get_indexer(lookups)
+
+    out = np.full(len(lookups), -2, dtype=np.int64)
+    assert indexer.get_indexer(lookups, out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+    # Chunks, including sliced ones, are looked up in place
+    chunked = pa.chunked_array(
+        [pa.array([0, 2, 7], type=pa.int64()).slice(1), pa.array([], pa.int64())]
+        + [pa.array([9, 4, 11, 5, 3]).slice(1)]
+    )
+    out = np.empty(len(chunked), dtype=np.int64)
+    indexer.get_indexer(chunked, out=out)
+    np.testing.assert_array_equal(out, expected)
+    # Result converts to Arrow without a copy
+    result = indexer.get_indexer(chunked)
+    assert pa.array(result).buffers()[1].address == result.ctypes.data
+
+    # Other integer types are cast
+    np.testing.assert_array_equal(
+        indexer.get_indexer(pa.array(lookups, type=pa.int32())), expected
+    )
+
+    with pytest.raises(soma.SOMAError):
+        indexer.get_indexer(lookups, out=np.empty(3, dtype=np.int64))
+    with pytest.raises(TypeError):
+        indexer.get_indexer(lookups, out=np.empty(len(lookups), dtype=np.int32))
+    with pytest.raises(TypeError):
+        indexer.get_indexer(lookups, out=np.empty(2 * len(lookups), np.int64)[::2])
@@ -1,5 +1,6 @@
 import math
 from typing import Any, Dict
+from unittest import mock
 
 import numpy as np
 import pyarrow as pa
@@ -175,6 +176,91 @@ def test_set_delete_metadata(soma_object):
         assert non_soma_metadata(reader) == {}
 
 
+def test_write_open_uses_one_handle(soma_object):
+    """Write-mode opens read metadata from the write handle itself."""
+    uri = soma_object.uri
+    wrapper_type = type(soma_object._handle)
+    with soma_object:
+        soma_object.metadata["content"] = "content"
+
+    opener = wrapper_type._opener
+    with mock.patch.object(wrapper_type, "_opener", side_effect=opener) as mock_opener:
+        with type(soma_object).open(uri, "w") as writer:
+            # Nothing beyond the write handle was opened
+            mock_opener.assert_not_called()
+            assert non_soma_metadata(writer) == {"content": "content"}
+            writer.metadata["content"] = "confidence"
+
+    with type(soma_object).open(uri) as reader:
+        assert non_soma_metadata(reader) == {"content": "confidence"}
+
+
+def test_lazy_metadata(soma_object):
+    uri = soma_object.uri
+    timestamp = soma_object.tiledb_timestamp_ms
+    with soma_object:
+        soma_object.metadata.update(stay="frosty", my="friends")
+
+    with _factory.open(uri, "r", tiledb_timestamp=timestamp) as reader:
+        # Nothing is decoded until it is accessed
+        assert reader.metadata.cache == {}
+        assert "stay" in reader.metadata
+        assert len(reader.metadata) == len(list(reader.metadata))
+        assert reader.metadata["my"] == "friends"
+        assert reader.metadata.cache == {"my": "friends"}
+        with pytest.raises(KeyError):
+            reader.metadata["freeble"]
+
+    with _factory.open(uri, "w", tiledb_timestamp=timestamp + 1) as writer:
+        count = len(writer.metadata)
+        writer.metadata["new"] = "key"
+        del writer.metadata["stay"]
+        writer.metadata["my"] = "enemies"
+        writer.metadata["gone"] = "soon"
+        del writer.metadata["gone"]
+        with pytest.raises(KeyError):
+            del writer.metadata["gone"]
+        with pytest.raises(KeyError):
+            del writer.metadata["stay"]
+        assert len(writer.metadata) == count
+        assert len(list(writer.metadata)) == count
+        assert "stay" not in writer.metadata
+        assert "gone" not in writer.metadata
+        assert non_soma_metadata(writer) == {"my": "enemies", "new": "key"}
+
+    with _factory.open(uri, "r", tiledb_timestamp=timestamp + 1) as reader:
+        assert non_soma_metadata(reader) == {"my": "enemies", "new": "key"}
+
+
+def test_metadata_writes_only_changes(soma_object, tmp_path):
+    uri = soma_object.uri
+    timestamp = soma_object.tiledb_timestamp_ms
+    with soma_object:
+        soma_object.metadata.update(a=1, b="two", c=True)
+
+    meta_dir = tmp_path / "object" / "__meta"
+    num_fragments = len(list(meta_dir.iterdir()))
+
+    with _factory.open(uri, "w", tiledb_timestamp=timestamp + 1) as writer:
+        writer.metadata.update(a=1, b="two")
+        del writer.metadata["c"]
+        writer.metadata["c"] = True
+        # Nothing changed, so the handle is neither flushed nor reopened
+        handle = writer._handle._handle
+        writer._handle._flush_hack()
+        assert writer._handle._handle is handle
+    assert len(list(meta_dir.iterdir())) == num_fragments
+
+    with _factory.open(uri, "w", tiledb_timestamp=timestamp + 2) as writer:
+        writer.metadata.update(a=2, b="two", d=3.0)
+        del writer.metadata["c"]
+    # All the changes are written together
+    assert len(list(meta_dir.iterdir())) == num_fragments + 1
+
+    with _factory.open(uri, "r", tiledb_timestamp=timestamp + 2) as reader:
+        assert non_soma_metadata(reader) == {"a": 2, "b": "two", "d": 3.0}
+
+
 def non_soma_metadata(obj) -> Dict[str, Any]:
     return {k: v for (k, v) in obj.metadata.items() if not k.startswith("soma_")}
 
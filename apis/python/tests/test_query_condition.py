@@ -2,6 +2,8 @@
 
 import os
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 import tiledbsoma.pytiledbsoma as clib
@@ -258,5 +260,118 @@ def test_query_condition_syntax_handling(expression_and_message):
             obs.read(value_filter=expression).concat()
 
 
+@pytest.mark.parametrize(
+    "condition",
+    [
+        "foo == 'bb'",
+        "foo != 'bb'",
+        "'ccc' == foo",
+        "foo == 'absent'",
+        "foo != 'absent'",
+        "foo in ['a', 'ccc']",
+        "foo in ['a', 'absent']",
+        "foo not in ['a', 'absent']",
+        "foo in ['absent']",
+        "foo not in ['absent']",
+        "foo > 'a'",
+        "bar == 777",
+        "bar in [888, 999]",
+        "bar not in [777]",
+        "foo == 'bb' and bar != 777",
+        "foo == 'a' or bar == 888",
+    ],
+)
+def test_query_condition_enumeration_codes(tmp_path, condition):
+    """Predicates on enumerated columns select the same rows whether they
+    compare codes or values."""
+    uri = tmp_path.as_posix()
+    schema = pa.schema(
+        [
+            pa.field("foo", pa.dictionary(pa.int8(), pa.large_string())),
+            pa.field("bar", pa.dictionary(pa.int16(), pa.int64())),
+        ]
+    )
+    with DataFrame.create(uri, schema=schema) as sdf:
+        data = {
+            "soma_joinid": list(range(6)),
+            "foo": pd.Categorical(["a", "bb", "ccc", "bb", "a", "ccc"]),
+            "bar": pa.DictionaryArray.from_arrays(
+                pa.array([0, 1, 0, 1, 1, 0], pa.int16()), pa.array([777, 888])
+            ),
+        }
+        sdf.write(
+            pa.Table.from_pydict(
+                data, schema=schema.insert(0, pa.field("soma_joinid", pa.int64()))
+            )
+        )
+
+    def query(enumeration_codes):
+        sr = clib.SOMAArray(uri)
+        sr.set_condition(
+            QueryCondition(condition, enumeration_codes=enumeration_codes),
+            sr.schema,
+        )
+        arrow_table = sr.read_next()
+        assert sr.results_complete()
+        return arrow_table.to_pandas()
+
+    assert query(True).equals(query(False))
+
+    with DataFrame.open(uri) as sdf:
+        assert sdf._handle._handle.enumeration_values("foo") == ["a", "bb", "ccc"]
+        assert sdf._handle._handle.enumeration_values("bar") == [777, 888]
+        assert sdf._handle._handle.enumeration_values("soma_joinid") is None
+
+
+def test_query_condition_compiled_cache(tmp_path):
+    uri = tmp_path.as_posix()
+    schema = pa.schema([pa.field("foo", pa.dictionary(pa.int8(), pa.large_string()))])
+    with DataFrame.create(uri, schema=schema) as sdf:
+        sdf.write(
+            pa.Table.from_pydict(
+                {"soma_joinid": [0, 1, 2], "foo": pd.Categorical(["a", "b", "a"])}
+            )
+        )
+
+    def query(condition, column_names=None):
+        qc = QueryCondition(condition)
+        sr = clib.SOMAArray(uri, column_names=column_names or [])
+        sr.set_condition(qc, sr.schema)
+        arrow_table = sr.read_next()
+        assert sr.results_complete()
+        return qc, arrow_table
+
+    # The compiled condition is reused, and still adds its columns to the read
+    qc1, table1 = query("foo == 'c' or foo == 'a'")
+    qc2, table2 = query("foo == 'c' or foo == 'a'", column_names=["soma_joinid"])
+    assert qc2.tree is qc1.tree
+    assert qc2.c_obj is qc1.c_obj
+    assert table1["soma_joinid"].to_pylist() == [0, 2]
+    assert table2.column_names == ["soma_joinid", "foo"]
+    assert table2["soma_joinid"].to_pylist() == [0, 2]
+
+    # Extending the enumeration compiles the condition again
+    with DataFrame.open(uri, "w") as sdf:
+        sdf.write(
+            pa.Table.from_pydict({"soma_joinid": [3], "foo": pd.Categorical(["c"])})
+        )
+    qc3, table3 = query("foo == 'c' or foo == 'a'")
+    assert qc3.c_obj is not qc1.c_obj
+    assert table3["soma_joinid"].to_pylist() == [0, 2, 3]
+
+    # So does a different schema
+    qc4 = QueryCondition("foo == 'c' or foo == 'a'")
+    sr = clib.SOMAArray(uri)
+    sr.set_condition(qc4, pa.schema([pa.field("foo", pa.large_string())]))
+    assert qc4.c_obj is not qc3.c_obj
+
+    # Enumerations are identified by their array, name and number of values
+    sr = clib.SOMAArray(uri)
+    version = sr.enumeration_version("foo")
+    assert version[1:] == ("foo", 3)
+    assert sr.enumeration_version("soma_joinid") is None
+    assert clib.SOMAArray(uri).enumeration_version("foo") == version
+
+
 if __name__ == "__main__":
     test_query_condition_select_columns()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import datetime
 import itertools
@@ -14,9 +15,10 @@ import numpy as np
 import pyarrow as pa
 import pytest
 import scipy.sparse as sparse
+import somacore
 
 import tiledbsoma as soma
-from tiledbsoma import _factory
+from tiledbsoma import _factory, _read_iters, _soma_array
 from tiledbsoma.options import SOMATileDBContext
 import tiledb
 
@@ -1064,6 +1066,87 @@ def test_bad_coords(tmp_path, bad_coords):
             next(a.read(bad_coords).tables())
 
 
+@pytest.mark.parametrize("result_order", ["auto", "row-major", "column-major"])
+@pytest.mark.parametrize("split_dim", [0, 1])
+def test_read_split_points(tmp_path, result_order, split_dim):
+    """Reads of many scattered points are split into concurrent sub-queries,
+    with the same results, in the same order, as a single query."""
+    uri = tmp_path.as_posix()
+    shape = (100, 80)
+    with soma.SparseNDArray.create(uri, type=pa.float64(), shape=shape) as a:
+        a.write(
+            create_random_tensor(
+                format="coo", shape=shape, dtype=np.float64, density=0.3
+            )
+        )
+
+    rng = np.random.default_rng(0)
+    points = rng.choice(shape[split_dim], size=40, replace=False)
+    coords = [slice(None), slice(None)]
+    coords[split_dim] = points
+
+    with soma.SparseNDArray.open(uri) as a:
+        expected = a.read(coords, result_order=result_order).tables().concat()
+        with mock.patch.object(_soma_array, "_SPLIT_READ_RANGES", 4):
+            reader = a.read(coords, result_order=result_order)._reader()
+            assert isinstance(reader, _read_iters._SplitReader)
+            actual = _read_iters.TableReadIter(reader).concat()
+            coo = a.read(coords, result_order=result_order).coos().concat()
+            # Sub-queries returning many batches are merged as they stream
+            batches = list(
+                a.read(
+                    coords,
+                    result_order=result_order,
+                    batch_size=somacore.BatchSize(count=50),
+                ).tables()
+            )
+
+    assert len(expected) > 0
+    sort_keys = [("soma_dim_0", "ascending"), ("soma_dim_1", "ascending")]
+    if result_order == "auto":
+        assert actual.sort_by(sort_keys).equals(expected.sort_by(sort_keys))
+    else:
+        assert actual.equals(expected)
+        assert pa.concat_tables(batches).equals(expected)
+    assert len(batches) > 1
+    assert coo.non_zero_length == len(expected)
+
+
+def test_read_async(tmp_path):
+    uri = tmp_path.as_posix()
+    shape = (100, 80)
+    with soma.SparseNDArray.create(uri, type=pa.float64(), shape=shape) as a:
+        a.write(
+            create_random_tensor(
+                format="coo", shape=shape, dtype=np.float64, density=0.3
+            )
+        )
+
+    points = np.random.default_rng(0).choice(shape[0], size=40, replace=False)
+    with soma.SparseNDArray.open(uri) as a:
+
+        async def read_all():
+            return await asyncio.gather(
+                a.read_async((slice(0, 49),)).concat(),
+                a.read_async(result_order="row-major").concat(),
+            )
+
+        expected = [
+            a.read((slice(0, 49),)).tables().concat(),
+            a.read(result_order="row-major").tables().concat(),
+        ]
+        assert asyncio.run(read_all()) == expected
+
+        # Split reads run their sub-queries concurrently on the event loop
+        with mock.patch.object(_soma_array, "_SPLIT_READ_RANGES", 4):
+            actual = asyncio.run(
+                a.read_async((points,), result_order="row-major").concat()
+            )
+        assert actual.equals(
+            a.read((points,), result_order="row-major").tables().concat()
+        )
+
+
 def test_tile_extents(tmp_path):
     soma.SparseNDArray.create(
         tmp_path.as_posix(),
@@ -1778,6 +1861,65 @@ def test_blockwise_scipy_reindex_disable_major_dim(
             assert isinstance(sp, sparse.coo_matrix)
 
 
+@pytest.mark.parametrize("density,shape", [(0.05, (1_000, 300))])
+def test_blockwise_tiles(
+    a_random_sparse_nd_array: str, a_soma_context: SOMATileDBContext
+) -> None:
+    """Blockwise iteration over more than one axis yields 2-D tiles."""
+    coords = (slice(10, 899), slice(5, 250))
+    n_coords = (890, 246)
+    size = [100, 64]
+
+    with soma.open(a_random_sparse_nd_array, mode="r", context=a_soma_context) as A:
+        truth = A.read(coords).tables().concat()
+        truth_coo = sparse.coo_matrix(
+            (
+                truth.column("soma_data").to_numpy(),
+                (
+                    truth.column("soma_dim_0").to_numpy(),
+                    truth.column("soma_dim_1").to_numpy(),
+                ),
+            ),
+            shape=A.shape,
+        )
+
+        for axis in ((0, 1), (1, 0)):
+            n_blocks = [-(-n_coords[d] // size[i]) for i, d in enumerate(axis)]
+            tiles = []
+            for tbl, joinids in A.read(coords).blockwise(axis=axis, size=size).tables():
+                assert len(joinids[axis[0]]) <= size[0]
+                assert len(joinids[axis[1]]) <= size[1]
+                tiles.append(
+                    (
+                        joinids[0].to_numpy()[tbl.column("soma_dim_0").to_numpy()],
+                        joinids[1].to_numpy()[tbl.column("soma_dim_1").to_numpy()],
+                        tbl.column("soma_data").to_numpy(),
+                    )
+                )
+            assert len(tiles) == n_blocks[0] * n_blocks[1]
+            i, j, d = (np.concatenate(t) for t in zip(*tiles))
+            tiled_coo = sparse.coo_matrix((d, (i, j)), shape=A.shape)
+            assert (tiled_coo != truth_coo).nnz == 0
+
+            for compress in (True, False):
+                it = A.read(coords).blockwise(axis=axis, size=size).scipy(compress)
+                stacked = sparse.coo_matrix(A.shape, dtype=truth_coo.dtype)
+                for sp, (obs, var) in it:
+                    assert sp.shape == (len(obs), len(var))
+                    if compress:
+                        assert sp.format == ("csr" if axis[0] == 0 else "csc")
+                        assert sp.has_canonical_format
+                    coo = sp.tocoo()
+                    stacked += sparse.coo_matrix(
+                        (coo.data, (obs[coo.row], var[coo.col])), shape=A.shape
+                    )
+                assert (stacked != truth_coo).nnz == 0
+
+                # Tiles on the second axis share one indexer per block
+                assert len(it.blocks[axis[1]]) == n_blocks[1]
+                assert all(indexer is not None for _, indexer in it.blocks[axis[1]])
+
+
 @pytest.mark.parametrize("density,shape", [(0.1, (100, 100))])
 def test_blockwise_iterator_uses_thread_pool_from_context(
     a_random_sparse_nd_array: str, shape: Tuple[int, ...]
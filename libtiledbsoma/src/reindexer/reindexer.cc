@@ -31,6 +31,7 @@
  */
 
 #include "reindexer.h"
+#include <algorithm>
 #include <thread_pool/thread_pool.h>
 #include <thread>
 #include "khash.h"
@@ -45,7 +46,46 @@ KHASH_MAP_INIT_INT64(m64, int64_t)
 
 namespace tiledbsoma {
 
+/*
+ * Index of the shard of a key: the top bits of a multiplicative (Fibonacci)
+ * hash, independent of the khash bucket hash of the key within its shard.
+ */
+static inline size_t shard_of(int64_t key, unsigned shard_bits) {
+    if (shard_bits == 0) {
+        return 0;
+    }
+    return (static_cast<uint64_t>(key) * 0x9E3779B97F4A7C15ULL) >>
+           (64 - shard_bits);
+}
+
+bool IntIndexer::map_runs(const int64_t* keys, size_t size) {
+    const size_t max_runs = std::max<size_t>(1, size / MIN_RUN_LENGTH);
+    size_t num_runs = 1;
+    for (size_t i = 1; i < size; i++) {
+        if (keys[i] <= keys[i - 1]) {
+            return false;
+        }
+        if (keys[i] != keys[i - 1] + 1 && ++num_runs > max_runs) {
+            return false;
+        }
+    }
+
+    run_keys_.reserve(num_runs);
+    run_offsets_.reserve(num_runs + 1);
+    for (size_t i = 0; i < size; i++) {
+        if (i == 0 || keys[i] != keys[i - 1] + 1) {
+            run_keys_.push_back(keys[i]);
+            run_offsets_.push_back(i);
+        }
+    }
+    run_offsets_.push_back(size);
+    LOG_DEBUG(fmt::format(
+        "[Re-indexer] {} sorted keys stored as {} runs", size, num_runs));
+    return true;
+}
+
 void IntIndexer::map_locations(const int64_t* keys, size_t size) {
+    destroy_index();
     map_size_ = size;
 
     // Handling edge cases
@@ -53,54 +93,177 @@ void IntIndexer::map_locations(const int64_t* keys, size_t size) {
         return;
     }
 
-    hash_ = kh_init(m64);
-    kh_resize(m64, hash_, size * 1.25);
-    int ret;
-    khint64_t k;
-    int64_t counter = 0;
-    // Hash map construction
-    LOG_DEBUG(
-        fmt::format("[Re-indexer] Start of Map locations with {} keys", size));
-    for (size_t i = 0; i < size; i++) {
-        k = kh_put(m64, hash_, keys[i], &ret);
-        assert(k != kh_end(hash_));
-        kh_val(hash_, k) = counter;
-        counter++;
+    // Sorted keys are unique, and need no hash table if they mostly form
+    // runs of consecutive values
+    if (map_runs(keys, size)) {
+        return;
     }
-    if (kh_size(hash_) != size) {
+
+    // One shard per thread, as long as shards keep enough keys to be worth
+    // a task of their own
+    size_t concurrency = 1;
+    if (context_ != nullptr && context_->thread_pool() != nullptr) {
+        concurrency = context_->thread_pool()->concurrency_level();
+    }
+    shard_bits_ = 0;
+    while ((size_t{2} << shard_bits_) <= concurrency &&
+           (size >> (shard_bits_ + 1)) >= MIN_SHARD_KEYS) {
+        shard_bits_++;
+    }
+    const size_t num_shards = size_t{1} << shard_bits_;
+    shards_.resize(num_shards);
+    for (auto& shard : shards_) {
+        shard = kh_init(m64);
+    }
+
+    // Hash map construction. The positions of the keys are partitioned by
+    // shard once, with a counting pass and a scatter, so each shard inserts
+    // only its own keys, independently and without locking.
+    LOG_DEBUG(fmt::format(
+        "[Re-indexer] Start of Map locations with {} keys in {} shards",
+        size,
+        num_shards));
+    std::vector<size_t> shard_offsets(num_shards + 1, 0);
+    std::vector<size_t> positions;
+    if (num_shards > 1) {
+        for (size_t i = 0; i < size; i++) {
+            shard_offsets[shard_of(keys[i], shard_bits_) + 1]++;
+        }
+        for (size_t shard_idx = 0; shard_idx < num_shards; shard_idx++) {
+            shard_offsets[shard_idx + 1] += shard_offsets[shard_idx];
+        }
+        std::vector<size_t> cursors(
+            shard_offsets.begin(), shard_offsets.end() - 1);
+        positions.resize(size);
+        for (size_t i = 0; i < size; i++) {
+            positions[cursors[shard_of(keys[i], shard_bits_)]++] = i;
+        }
+    }
+    auto build_shard = [this, keys, size, &shard_offsets, &positions](
+                           size_t shard_idx) {
+        kh_m64_t* shard = shards_[shard_idx];
+        int ret;
+        khint64_t k;
+        if (positions.empty()) {
+            kh_resize(m64, shard, size * 1.25);
+            for (size_t i = 0; i < size; i++) {
+                k = kh_put(m64, shard, keys[i], &ret);
+                assert(k != kh_end(shard));
+                kh_val(shard, k) = i;
+            }
+            return;
+        }
+        const size_t begin = shard_offsets[shard_idx];
+        const size_t end = shard_offsets[shard_idx + 1];
+        kh_resize(m64, shard, (end - begin) * 1.25);
+        for (size_t j = begin; j < end; j++) {
+            const size_t i = positions[j];
+            k = kh_put(m64, shard, keys[i], &ret);
+            assert(k != kh_end(shard));
+            kh_val(shard, k) = i;
+        }
+    };
+    if (num_shards == 1) {
+        build_shard(0);
+    } else {
+        std::vector<tiledbsoma::ThreadPool::Task> tasks;
+        for (size_t shard_idx = 0; shard_idx < num_shards; shard_idx++) {
+            tiledbsoma::ThreadPool::Task task = context_->thread_pool()->execute(
+                [&build_shard, shard_idx]() {
+                    build_shard(shard_idx);
+                    return tiledbsoma::Status::Ok();
+                });
+            assert(task.valid());
+            tasks.emplace_back(std::move(task));
+        }
+        context_->thread_pool()->wait_all(tasks);
+    }
+
+    size_t hsize = 0;
+    for (auto shard : shards_) {
+        hsize += kh_size(shard);
+    }
+    if (hsize != size) {
         throw std::runtime_error("There are duplicate keys.");
     }
-    auto hsize = kh_size(hash_);
     LOG_DEBUG(fmt::format("[Re-indexer] khash size = {}", hsize));
 
     LOG_DEBUG(
         fmt::format("[Re-indexer] Thread pool started and hash table created"));
 }
 
+int64_t IntIndexer::lookup_key(int64_t key) const {
+    if (!run_keys_.empty()) {
+        // The last run starting at or before the key
+        auto run = std::upper_bound(run_keys_.begin(), run_keys_.end(), key);
+        if (run == run_keys_.begin()) {
+            return -1;
+        }
+        const size_t i = std::prev(run) - run_keys_.begin();
+        const uint64_t delta = static_cast<uint64_t>(key) -
+                               static_cast<uint64_t>(run_keys_[i]);
+        if (delta >= static_cast<uint64_t>(
+                         run_offsets_[i + 1] - run_offsets_[i])) {
+            return -1;
+        }
+        return run_offsets_[i] + static_cast<int64_t>(delta);
+    }
+    if (shards_.empty()) {
+        return -1;
+    }
+    kh_m64_t* shard = shards_[shard_of(key, shard_bits_)];
+    auto k = kh_get(m64, shard, key);
+    if (k == kh_end(shard)) {
+        // According to pandas behavior
+        return -1;
+    }
+    return kh_val(shard, k);
+}
+
+void IntIndexer::lookup_span(const LookupSpan& span) const {
+    if (run_keys_.size() == 1) {
+        // A single run of keys: a vectorizable range check and offset
+        const int64_t first = run_keys_[0];
+        const uint64_t length = map_size_;
+        for (size_t i = 0; i < span.size; i++) {
+            const uint64_t delta = static_cast<uint64_t>(span.keys[i]) -
+                                   static_cast<uint64_t>(first);
+            span.results[i] = delta < length ? static_cast<int64_t>(delta) :
+                                               -1;
+        }
+        return;
+    }
+    for (size_t i = 0; i < span.size; i++) {
+        span.results[i] = lookup_key(span.keys[i]);
+    }
+}
+
 void IntIndexer::lookup(const int64_t* keys, int64_t* results, size_t size) {
+    lookup(std::vector<LookupSpan>{{keys, results, size}});
+}
+
+void IntIndexer::lookup(const std::vector<LookupSpan>& spans) {
+    size_t size = 0;
+    for (const auto& span : spans) {
+        size += span.size;
+    }
     if (size == 0) {
         return;
     }
     // Single thread checks
     if (context_ == nullptr || context_->thread_pool() == nullptr ||
-        context_->thread_pool()->concurrency_level() == 1) {
-        for (size_t i = 0; i < size; i++) {
-            auto k = kh_get(m64, hash_, keys[i]);
-            if (k == kh_end(hash_)) {
-                // According to pandas behavior
-                results[i] = -1;
-            } else {
-                results[i] = kh_val(hash_, k);
-            }
+        context_->thread_pool()->concurrency_level() == 1 ||
+        run_keys_.size() == 1) {
+        for (const auto& span : spans) {
+            lookup_span(span);
         }
         return;
     }
     LOG_DEBUG(fmt::format(
-        "Lookup with thread concurrency {} on data size {}",
+        "Lookup with thread concurrency {} on data size {} in {} spans",
         context_->thread_pool()->concurrency_level(),
-        size));
-
-    std::vector<tiledbsoma::ThreadPool::Task> tasks;
+        size,
+        spans.size()));
 
     size_t thread_chunk_size = size /
                                context_->thread_pool()->concurrency_level();
@@ -108,41 +271,56 @@ void IntIndexer::lookup(const int64_t* keys, int64_t* results, size_t size) {
         thread_chunk_size = 1;
     }
 
-    for (size_t i = 0; i < size; i += thread_chunk_size) {
-        size_t start = i;
-        size_t end = i + thread_chunk_size;
-        if (end > size) {
-            end = size;
+    // Group the spans into tasks of thread_chunk_size keys, splitting large
+    // spans and combining small ones
+    std::vector<std::vector<LookupSpan>> groups(1);
+    size_t group_size = 0;
+    for (const auto& span : spans) {
+        for (size_t offset = 0; offset < span.size;) {
+            size_t n = std::min(
+                span.size - offset, thread_chunk_size - group_size);
+            groups.back().push_back(
+                {span.keys + offset, span.results + offset, n});
+            offset += n;
+            group_size += n;
+            if (group_size == thread_chunk_size) {
+                groups.emplace_back();
+                group_size = 0;
+            }
+        }
+    }
+
+    std::vector<tiledbsoma::ThreadPool::Task> tasks;
+    for (const auto& group : groups) {
+        if (group.empty()) {
+            continue;
         }
-        LOG_DEBUG(fmt::format(
-            "Creating tileDB task for the range from {} to {} ", start, end));
         tiledbsoma::ThreadPool::Task task = context_->thread_pool()->execute(
-            [this, start, end, &results, &keys]() {
-                for (size_t i = start; i < end; i++) {
-                    auto k = kh_get(m64, hash_, keys[i]);
-                    if (k == kh_end(hash_)) {
-                        // According to pandas behavior
-                        results[i] = -1;
-                    } else {
-                        results[i] = kh_val(hash_, k);
-                    }
+            [this, &group]() {
+                for (const auto& span : group) {
+                    lookup_span(span);
                 }
                 return tiledbsoma::Status::Ok();
             });
         assert(task.valid());
         tasks.emplace_back(std::move(task));
-        LOG_DEBUG(fmt::format(
-            "Task for the range from {} to {} inserted in the queue",
-            start,
-            end));
     }
+    LOG_DEBUG(fmt::format("Lookup split into {} tasks", tasks.size()));
     context_->thread_pool()->wait_all(tasks);
 }
 
-IntIndexer::~IntIndexer() {
-    if (map_size_ > 0) {
-        kh_destroy(m64, this->hash_);
+void IntIndexer::destroy_index() {
+    for (auto shard : shards_) {
+        kh_destroy(m64, shard);
     }
+    shards_.clear();
+    shard_bits_ = 0;
+    run_keys_.clear();
+    run_offsets_.clear();
+}
+
+IntIndexer::~IntIndexer() {
+    destroy_index();
 }
 
 }  // namespace tiledbsoma
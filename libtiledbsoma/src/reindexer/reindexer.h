@@ -46,11 +46,26 @@ class SOMAContext;
 
 class IntIndexer {
    public:
+    /**
+     * An array of keys to lookup, and the array for their results
+     */
+    struct LookupSpan {
+        const int64_t* keys;
+        int64_t* results;
+        size_t size;
+    };
+
     /**
      * Perform intitalization of hash and threadpool
+     *
+     * Sorted keys forming few contiguous runs are stored as those runs,
+     * and looked up arithmetically (one run) or by binary search. Other
+     * keys are hashed. Large key sets are split by hash into shards, each a
+     * separate khash table built by its own task on the context's thread
+     * pool.
+     *
      * @param keys pointer to key array of 64bit integers
      * @param size yhr number of keys in the put
-     * @param threads number of threads in the thread pool
      */
     void map_locations(const int64_t* keys, size_t size);
     void map_locations(const std::vector<int64_t>& keys) {
@@ -72,17 +87,71 @@ class IntIndexer {
 
         lookup(keys.data(), results.data(), keys.size());
     }
+    /**
+     * Used for parallel lookup of several arrays of keys (e.g., the chunks of
+     * an Arrow chunked array), split into tasks by their total size
+     * @param spans arrays of keys, and of their results
+     */
+    void lookup(const std::vector<LookupSpan>& spans);
     IntIndexer(){};
     IntIndexer(std::shared_ptr<tiledbsoma::SOMAContext> context)
         : context_(context) {
     }
     virtual ~IntIndexer();
 
+    /**
+     * Whether the keys are stored as runs of consecutive values rather than
+     * hashed
+     */
+    bool run_length_encoded() const {
+        return !run_keys_.empty();
+    }
+
+    /*
+     * Minimum number of keys per shard of the hash table
+     */
+    inline static const size_t MIN_SHARD_KEYS = size_t(1) << 18;
+
+    /*
+     * Minimum average run length of sorted keys to store them as runs
+     */
+    inline static const size_t MIN_RUN_LENGTH = 16;
+
    private:
     /*
-     * The created 64bit hash table
+     * Lookup of a single key, -1 if absent
+     */
+    int64_t lookup_key(int64_t key) const;
+
+    /*
+     * Serial lookup of an array of keys
+     */
+    void lookup_span(const LookupSpan& span) const;
+
+    /*
+     * Store sorted keys as runs of consecutive values, if there are few
+     * enough of them. Returns false, storing nothing, otherwise.
+     */
+    bool map_runs(const int64_t* keys, size_t size);
+
+    /*
+     * First key of each run of consecutive keys, and the position of that
+     * key. run_offsets_ has a final entry for the total number of keys.
+     */
+    std::vector<int64_t> run_keys_;
+    std::vector<int64_t> run_offsets_;
+
+    /*
+     * Free the hash table shards, or runs
+     */
+    void destroy_index();
+
+    /*
+     * The created 64bit hash table, split into 2^shard_bits_ shards by the
+     * top bits of a hash of the key
      */
-    kh_m64_s* hash_;
+    std::vector<kh_m64_s*> shards_;
+    unsigned shard_bits_ = 0;
 
     std::shared_ptr<SOMAContext> context_ = nullptr;
     /*
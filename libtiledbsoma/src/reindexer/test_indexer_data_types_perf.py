@@ -1,99 +1,114 @@
+"""
+Performance test evaluating the reindexer performance compared to pandas.Index,
+for different key counts, thread counts and data types.
+
+Reports the time to build the index over ``n`` unique keys (shuffled), and to
+look up ``lookup-ratio * n`` keys in it. The reindexer's build is sharded
+across the context's thread pool once each shard gets enough keys.
+
+    python test_indexer_data_types_perf.py --sizes 1000000 50000000 --threads 1 4 16
+"""
+
+import argparse
 from time import perf_counter
+from typing import Any, Callable, Dict
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 
-from tiledbsoma._indexer import tiledbsoma_build_index
+from tiledbsoma._indexer import IntIndexer
 from tiledbsoma.options import SOMATileDBContext
-from tiledbsoma.options._soma_tiledb_context import _validate_soma_tiledb_context
 
-"""
-Performance test evaluating the reindexer performance compared to pandas.Index for different data types
-"""
+# Converters from the int64 ndarray of keys or lookups to each input data type
+DATA_TYPES: Dict[str, Callable[[np.ndarray], Any]] = {
+    "np.array": lambda a: a,
+    "pa.array": pa.array,
+    "pa.chunked_array": lambda a: pa.chunked_array(np.array_split(a, 10)),
+    "pd.Series": pd.Series,
+    "pd.array": pd.array,
+}
 
 
-def build(keys, pandas):
-    context = _validate_soma_tiledb_context(SOMATileDBContext())
-    if pandas:
-        indexer = pd.Index(keys)
-        indexer.get_indexer([1])
-    else:
-        perf_counter()
-        indexer = tiledbsoma_build_index(keys, context=context.native_context)
-    return indexer
-
-
-def lookup(indexer, lookups):
-    results = indexer.get_indexer(lookups)
-    return results
+def make_context(threads: int) -> SOMATileDBContext:
+    # The native thread pool gets half of the compute concurrency level
+    return SOMATileDBContext(
+        tiledb_config={"sm.compute_concurrency_level": 2 * threads}
+    )
 
 
-def run(data_type, keys, lookups, pandas):
+def run(
+    name: str, data_type: str, build: Callable[[Any], Any], keys: Any, lookups: Any
+) -> None:
     start_time = perf_counter()
-    indexer = build(keys, pandas)
+    indexer = build(keys)
     build_time = perf_counter()
-    lookup(indexer, lookups)
+    indexer.get_indexer(lookups)
     lookup_time = perf_counter()
-    if pandas:
-        name = "pandas"
-    else:
-        name = "reindexer"
     print(
-        f"{data_type}: Setup time: {name}: {build_time - start_time}: Lookup time: {lookup_time - build_time}"
+        f"{name:<16} {data_type:<16} {len(keys):>12} "
+        f"build={build_time - start_time:>8.3f}s "
+        f"lookup={lookup_time - build_time:>8.3f}s"
     )
 
 
-def indexer_test_build(data_type, keys, lookups):
-    run(data_type, keys, lookups, False)
-    run(data_type, keys, lookups, True)
-
-
-def main():
-    # Creating keys and lookup values of different types (np.array, pa.array, pa.chunked_array, pa.array, pd.Series,
-    # pd.array and python list)  and try the re-indexer and pandas.Index
-    keys = np.array(list(range(1, 100000000)), dtype=np.int64)
-    lookups = np.random.randint(0, 1000, 1000000000)
-    indexer_test_build("np.array", keys, lookups)
-
-    keys = pa.array(list(range(1, 100000000)))
-    lookups = pa.array(np.random.randint(0, 1000, 1000000000).astype(np.int64))
-    indexer_test_build("pa.array", keys, lookups)
-
-    keys = pa.chunked_array(
-        [
-            list(range(1, 10000000)),
-            list(range(10000000, 20000000)),
-            list(range(20000000, 30000000)),
-            list(range(30000000, 40000000)),
-            list(range(40000000, 50000000)),
-            list(range(50000000, 6000000)),
-            list(range(60000000, 70000000)),
-            list(range(70000000, 80000000)),
-            list(range(80000000, 90000000)),
-            list(range(90000000, 100000000)),
-        ]
+def main() -> None:
+    p = argparse.ArgumentParser()
+    p.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000_000, 10_000_000, 100_000_000],
+        help="Numbers of keys to index",
     )
-    lookups = []
-    for x in range(10):
-        lookups.append(list(np.random.randint(0, 1000, 100000000, dtype=np.int64)))
-    lookups = pa.chunked_array(lookups)
-    indexer_test_build("pa.chunked_array", keys, lookups)
-
-    keys = pd.Series(list(range(1, 100000000)))
-    lookups = pd.Series(np.random.randint(0, 1000, 1000000000))
-    indexer_test_build("pd.Series", keys, lookups)
-
-    keys = pd.array(list(range(1, 100000000)))
-    lookups = pd.array(np.random.randint(0, 1000, 1000000000, dtype=np.int64))
-    indexer_test_build("pd.array", keys, lookups)
-
-    keys = list(range(1, 100000000))
-    lookups = list(np.random.randint(0, 1000, 1000000000))
-
-
-#   Commented out as it takes a very long time for pandas
-#   indexer_test_build("python list", keys, lookups)
-
-
-main()
+    p.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Reindexer thread counts",
+    )
+    p.add_argument(
+        "--lookup-ratio",
+        type=float,
+        default=1.0,
+        help="Number of lookups per key",
+    )
+    p.add_argument(
+        "--data-types",
+        nargs="+",
+        choices=list(DATA_TYPES),
+        default=["np.array"],
+        help="Input data types of keys and lookups",
+    )
+    p.add_argument(
+        "--pandas",
+        action="store_true",
+        help="Also time pandas.Index, as a baseline",
+    )
+    args = p.parse_args()
+
+    rng = np.random.default_rng(0)
+    for size in args.sizes:
+        keys = rng.permutation(size).astype(np.int64)
+        lookups = rng.integers(0, size, int(size * args.lookup_ratio), dtype=np.int64)
+        for data_type in args.data_types:
+            convert = DATA_TYPES[data_type]
+            typed_keys, typed_lookups = convert(keys), convert(lookups)
+            for threads in args.threads:
+                context = make_context(threads)
+                # Start the thread pool outside of the measurement
+                IntIndexer(np.array([0]), context=context)
+                run(
+                    f"reindexer[{threads}]",
+                    data_type,
+                    lambda k, context=context: IntIndexer(k, context=context),
+                    typed_keys,
+                    typed_lookups,
+                )
+            if args.pandas:
+                run("pandas", data_type, pd.Index, typed_keys, typed_lookups)
+
+
+if __name__ == "__main__":
+    main()
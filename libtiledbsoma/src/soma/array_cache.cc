@@ -0,0 +1,100 @@
+/**
+ * @file   array_cache.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ *   This file defines the ArrayCache class.
+ */
+#include "array_cache.h"
+
+namespace tiledbsoma {
+
+//===================================================================
+//= public non-static
+//===================================================================
+
+std::shared_ptr<Array> ArrayCache::get(
+    const std::string& uri, const TimestampRange& timestamp) {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    auto it = entries_.find({uri, timestamp.first, timestamp.second});
+    if (it == entries_.end()) {
+        stats_.misses++;
+        return nullptr;
+    }
+    lru_.splice(lru_.begin(), lru_, it->second.lru_pos);
+    stats_.hits++;
+    return it->second.array;
+}
+
+void ArrayCache::put(
+    const std::string& uri,
+    const TimestampRange& timestamp,
+    std::shared_ptr<Array> array) {
+    if (!enabled()) {
+        return;
+    }
+
+    const std::lock_guard<std::mutex> lock(mutex_);
+    Key key{uri, timestamp.first, timestamp.second};
+    auto it = entries_.find(key);
+    if (it != entries_.end()) {
+        // Another thread opened the same array concurrently; keep the first
+        return;
+    }
+    lru_.push_front(key);
+    entries_.emplace(key, Entry{array, lru_.begin()});
+    while (entries_.size() > max_entries_) {
+        entries_.erase(lru_.back());
+        lru_.pop_back();
+    }
+    stats_.entries = entries_.size();
+}
+
+void ArrayCache::invalidate(const std::string& uri) {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    auto it = entries_.lower_bound({uri, 0, 0});
+    while (it != entries_.end() && std::get<0>(it->first) == uri) {
+        lru_.erase(it->second.lru_pos);
+        it = entries_.erase(it);
+        stats_.invalidations++;
+    }
+    stats_.entries = entries_.size();
+}
+
+ArrayCacheStats ArrayCache::stats() const {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    return stats_;
+}
+
+void ArrayCache::clear() {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    entries_.clear();
+    lru_.clear();
+    stats_ = ArrayCacheStats();
+}
+
+}  // namespace tiledbsoma
@@ -0,0 +1,187 @@
+/**
+ * @file   array_cache.h
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file defines the ArrayCache class.
+ */
+
+#ifndef ARRAY_CACHE_H
+#define ARRAY_CACHE_H
+
+#include <cstdint>
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <tuple>
+
+#include <tiledb/tiledb>
+#include "../utils/common.h"
+
+namespace tiledbsoma {
+
+using namespace tiledb;
+
+/**
+ * @brief Counters describing the use of an ArrayCache.
+ */
+struct ArrayCacheStats {
+    // Number of opens served by a cached array
+    uint64_t hits = 0;
+
+    // Number of cacheable opens that had to open the array
+    uint64_t misses = 0;
+
+    // Number of cached arrays dropped because their array was written
+    uint64_t invalidations = 0;
+
+    // Number of arrays currently held by the cache
+    uint64_t entries = 0;
+};
+
+/**
+ * @brief A least-recently-used cache of arrays opened for reading at a fixed
+ * timestamp range.
+ *
+ * An opened TileDB array holds its loaded schema, enumerations and fragment
+ * metadata, none of which change for a given URI and timestamp range until
+ * the array is written again. Reads of an array that is opened repeatedly at
+ * the same timestamp range can therefore share one opened array instead of
+ * loading all of these from storage again.
+ *
+ * Cached arrays are shared by the SOMAArrays that use them, and stay open
+ * while any of them does, even once evicted. Writes through the context
+ * invalidate the cached arrays of their URI when they are closed.
+ */
+class ArrayCache {
+   public:
+    //===================================================================
+    //= public static
+    //===================================================================
+
+    // Default maximum number of arrays held by the cache: disabled
+    inline static const size_t DEFAULT_MAX_ENTRIES = 0;
+
+    //===================================================================
+    //= public non-static
+    //===================================================================
+
+    /**
+     * @brief Construct a new ArrayCache object
+     *
+     * @param max_entries Maximum number of arrays held by the cache
+     */
+    ArrayCache(size_t max_entries = DEFAULT_MAX_ENTRIES)
+        : max_entries_(max_entries) {
+    }
+
+    ArrayCache(const ArrayCache&) = delete;
+    ArrayCache& operator=(const ArrayCache&) = delete;
+
+    /**
+     * @brief Whether the cache holds any arrays at all.
+     */
+    bool enabled() const {
+        return max_entries_ > 0;
+    }
+
+    /**
+     * @brief Return the array cached for the URI and timestamp range, or
+     * nullptr if there is none.
+     *
+     * @param uri Array URI
+     * @param timestamp Timestamp range the array was opened at
+     * @return std::shared_ptr<Array>
+     */
+    std::shared_ptr<Array> get(
+        const std::string& uri, const TimestampRange& timestamp);
+
+    /**
+     * @brief Cache an array opened for reading at the timestamp range,
+     * evicting the least recently used arrays beyond the maximum.
+     *
+     * @param uri Array URI
+     * @param timestamp Timestamp range the array was opened at
+     * @param array Opened array
+     */
+    void put(
+        const std::string& uri,
+        const TimestampRange& timestamp,
+        std::shared_ptr<Array> array);
+
+    /**
+     * @brief Drop all cached arrays of the URI, at any timestamp range.
+     *
+     * @param uri Array URI
+     */
+    void invalidate(const std::string& uri);
+
+    /**
+     * @brief Return the cache counters.
+     *
+     * @return ArrayCacheStats
+     */
+    ArrayCacheStats stats() const;
+
+    /**
+     * @brief Drop all cached arrays and reset the counters.
+     */
+    void clear();
+
+   private:
+    //===================================================================
+    //= private non-static
+    //===================================================================
+
+    using Key = std::tuple<std::string, uint64_t, uint64_t>;
+
+    struct Entry {
+        std::shared_ptr<Array> array;
+        std::list<Key>::iterator lru_pos;
+    };
+
+    // Maximum number of arrays held by the cache
+    size_t max_entries_;
+
+    // Cached arrays by URI and timestamp range
+    std::map<Key, Entry> entries_;
+
+    // Keys of the cached arrays, most recently used first
+    std::list<Key> lru_;
+
+    // Cache counters
+    ArrayCacheStats stats_;
+
+    // Mutex protecting the cached arrays and counters
+    mutable std::mutex mutex_;
+};
+
+}  // namespace tiledbsoma
+
+#endif  // ARRAY_CACHE_H
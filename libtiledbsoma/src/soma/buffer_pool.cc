@@ -0,0 +1,73 @@
+/**
+ * @file   buffer_pool.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ *   This file defines the BufferPool class.
+ */
+#include "buffer_pool.h"
+
+namespace tiledbsoma {
+
+//===================================================================
+//= public non-static
+//===================================================================
+
+BufferPoolStats BufferPool::stats() const {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    return stats_;
+}
+
+void BufferPool::clear() {
+    const std::lock_guard<std::mutex> lock(mutex_);
+    data_buffers_.clear();
+    offsets_buffers_.clear();
+    validity_buffers_.clear();
+    stats_ = BufferPoolStats();
+}
+
+//===================================================================
+//= private static
+//===================================================================
+
+size_t BufferPool::class_at_least(size_t num_bytes) {
+    size_t size_class = MIN_CLASS_BYTES;
+    while (size_class < num_bytes) {
+        size_class <<= 1;
+    }
+    return size_class;
+}
+
+size_t BufferPool::class_at_most(size_t num_bytes) {
+    size_t size_class = MIN_CLASS_BYTES;
+    while (size_class <= num_bytes / 2) {
+        size_class <<= 1;
+    }
+    return size_class;
+}
+
+}  // namespace tiledbsoma
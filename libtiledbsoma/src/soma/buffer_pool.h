@@ -0,0 +1,223 @@
+/**
+ * @file   buffer_pool.h
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file defines the BufferPool class.
+ */
+
+#ifndef BUFFER_POOL_H
+#define BUFFER_POOL_H
+
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <type_traits>
+#include <vector>
+
+namespace tiledbsoma {
+
+/**
+ * @brief Counters describing the use of a BufferPool.
+ */
+struct BufferPoolStats {
+    // Number of acquired buffers that were reused from the pool
+    uint64_t hits = 0;
+
+    // Number of acquired buffers that had to be allocated
+    uint64_t misses = 0;
+
+    // Number of buffers currently held by the pool
+    uint64_t buffers_held = 0;
+
+    // Number of bytes currently held by the pool
+    uint64_t bytes_held = 0;
+};
+
+/**
+ * @brief A size-classed pool of the vectors backing ColumnBuffers.
+ *
+ * Buffers are grouped into power-of-two size classes. A released buffer is
+ * kept, up to a total of `max_bytes`, and handed out again to the next
+ * acquire of the same size class, so repeated queries reuse memory that is
+ * already allocated and paged in instead of allocating it again.
+ *
+ * The pool is thread-safe: ColumnBuffers may be released from any thread,
+ * e.g. when Python drops the Arrow arrays backed by them.
+ */
+class BufferPool {
+   public:
+    //===================================================================
+    //= public static
+    //===================================================================
+
+    // Default maximum number of bytes held by the pool
+    inline static const size_t DEFAULT_MAX_BYTES = size_t(256) << 20;
+
+    // Smallest size class; smaller buffers are not pooled
+    inline static const size_t MIN_CLASS_BYTES = size_t(4) << 10;
+
+    //===================================================================
+    //= public non-static
+    //===================================================================
+
+    /**
+     * @brief Construct a new BufferPool object
+     *
+     * @param max_bytes Maximum number of bytes held by the pool
+     */
+    BufferPool(size_t max_bytes = DEFAULT_MAX_BYTES)
+        : max_bytes_(max_bytes) {
+    }
+
+    BufferPool(const BufferPool&) = delete;
+    BufferPool& operator=(const BufferPool&) = delete;
+
+    /**
+     * @brief Return an empty vector with capacity for at least `num_elems`
+     * elements, reusing a pooled vector when one is available.
+     *
+     * @tparam T Element type: std::byte, uint64_t or uint8_t
+     * @param num_elems Number of elements
+     * @return std::vector<T>
+     */
+    template <typename T>
+    std::vector<T> acquire(size_t num_elems) {
+        auto num_bytes = num_elems * sizeof(T);
+        auto size_class = class_at_least(num_bytes);
+
+        // Buffers that the pool would not keep are allocated at their exact
+        // size: small ones, and those of a class beyond the pool's capacity
+        if (num_bytes < MIN_CLASS_BYTES || size_class > max_bytes_) {
+            std::vector<T> buffer;
+            buffer.reserve(num_elems);
+            return buffer;
+        }
+
+        {
+            const std::lock_guard<std::mutex> lock(mutex_);
+            auto& buffers = shelf<T>()[size_class];
+            if (!buffers.empty()) {
+                auto buffer = std::move(buffers.back());
+                buffers.pop_back();
+                stats_.hits++;
+                stats_.buffers_held--;
+                stats_.bytes_held -= buffer.capacity() * sizeof(T);
+                return buffer;
+            }
+            stats_.misses++;
+        }
+
+        // Allocate the whole size class so the buffer can be reused by any
+        // request in the same class
+        std::vector<T> buffer;
+        buffer.reserve(size_class / sizeof(T));
+        return buffer;
+    }
+
+    /**
+     * @brief Return a vector to the pool. The vector is moved from if it is
+     * kept, and left untouched otherwise.
+     *
+     * @tparam T Element type: std::byte, uint64_t or uint8_t
+     * @param buffer Vector to return
+     */
+    template <typename T>
+    void release(std::vector<T>&& buffer) {
+        auto num_bytes = buffer.capacity() * sizeof(T);
+        if (num_bytes < MIN_CLASS_BYTES) {
+            return;
+        }
+
+        const std::lock_guard<std::mutex> lock(mutex_);
+        if (stats_.bytes_held + num_bytes > max_bytes_) {
+            return;
+        }
+        buffer.clear();
+        shelf<T>()[class_at_most(num_bytes)].push_back(std::move(buffer));
+        stats_.buffers_held++;
+        stats_.bytes_held += num_bytes;
+    }
+
+    /**
+     * @brief Return the pool counters.
+     *
+     * @return BufferPoolStats
+     */
+    BufferPoolStats stats() const;
+
+    /**
+     * @brief Free all buffers held by the pool and reset its counters.
+     */
+    void clear();
+
+   private:
+    //===================================================================
+    //= private static
+    //===================================================================
+
+    // Smallest size class holding `num_bytes`
+    static size_t class_at_least(size_t num_bytes);
+
+    // Largest size class that fits in `num_bytes`
+    static size_t class_at_most(size_t num_bytes);
+
+    //===================================================================
+    //= private non-static
+    //===================================================================
+
+    template <typename T>
+    std::map<size_t, std::vector<std::vector<T>>>& shelf() {
+        if constexpr (std::is_same_v<T, std::byte>) {
+            return data_buffers_;
+        } else if constexpr (std::is_same_v<T, uint64_t>) {
+            return offsets_buffers_;
+        } else {
+            static_assert(std::is_same_v<T, uint8_t>);
+            return validity_buffers_;
+        }
+    }
+
+    // Maximum number of bytes held by the pool
+    size_t max_bytes_;
+
+    // Pooled data, offsets and validity buffers by size class
+    std::map<size_t, std::vector<std::vector<std::byte>>> data_buffers_;
+    std::map<size_t, std::vector<std::vector<uint64_t>>> offsets_buffers_;
+    std::map<size_t, std::vector<std::vector<uint8_t>>> validity_buffers_;
+
+    // Pool counters
+    BufferPoolStats stats_;
+
+    // Mutex protecting the pooled buffers and counters
+    mutable std::mutex mutex_;
+};
+
+}  // namespace tiledbsoma
+
+#endif  // BUFFER_POOL_H
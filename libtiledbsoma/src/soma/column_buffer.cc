@@ -32,6 +32,7 @@
 
 #include "column_buffer.h"
 #include "../utils/logger.h"
+#include "buffer_pool.h"
 
 namespace tiledbsoma {
 
@@ -42,7 +43,11 @@ using namespace tiledb;
 //===================================================================
 
 std::shared_ptr<ColumnBuffer> ColumnBuffer::create(
-    std::shared_ptr<Array> array, std::string_view name) {
+    std::shared_ptr<Array> array,
+    std::string_view name,
+    std::optional<size_t> max_cells,
+    std::optional<size_t> max_bytes,
+    std::shared_ptr<BufferPool> pool) {
     auto schema = array->schema();
     auto name_str = std::string(name);  // string for TileDB API
 
@@ -75,7 +80,10 @@ std::shared_ptr<ColumnBuffer> ColumnBuffer::create(
             is_var,
             is_nullable,
             enumeration,
-            is_ordered);
+            is_ordered,
+            max_cells,
+            max_bytes,
+            pool);
 
     } else if (schema.domain().has_dimension(name_str)) {
         auto dim = schema.domain().dimension(name_str);
@@ -97,7 +105,10 @@ std::shared_ptr<ColumnBuffer> ColumnBuffer::create(
             is_var,
             false,
             std::nullopt,
-            false);
+            false,
+            max_cells,
+            max_bytes,
+            pool);
     }
 
     throw TileDBSOMAError("[ColumnBuffer] Column name not found: " + name_str);
@@ -132,7 +143,8 @@ ColumnBuffer::ColumnBuffer(
     bool is_var,
     bool is_nullable,
     std::optional<Enumeration> enumeration,
-    bool is_ordered)
+    bool is_ordered,
+    std::shared_ptr<BufferPool> pool)
     : name_(name)
     , type_(type)
     , type_size_(tiledb::impl::type_size(type))
@@ -140,6 +152,9 @@ ColumnBuffer::ColumnBuffer(
     , is_var_(is_var)
     , is_nullable_(is_nullable)
     , enumeration_(enumeration)
+    , alloc_cells_(num_cells)
+    , alloc_bytes_(num_bytes)
+    , pool_(pool)
     , is_ordered_(is_ordered) {
     LOG_DEBUG(fmt::format(
         "[ColumnBuffer] '{}' {} bytes is_var={} is_nullable={}",
@@ -149,36 +164,52 @@ ColumnBuffer::ColumnBuffer(
         is_nullable_));
     // Call reserve() to allocate memory without initializing the contents.
     // This reduce the time to allocate the buffer and reduces the
-    // resident memory footprint of the buffer.
-    data_.reserve(num_bytes);
-    if (is_var_) {
-        offsets_.reserve(num_cells + 1);  // extra offset for arrow
-    }
-    if (is_nullable_) {
-        validity_.reserve(num_cells);
+    // resident memory footprint of the buffer. A pooled buffer is reused
+    // as-is, so its pages are already resident.
+    if (pool_ != nullptr) {
+        data_ = pool_->acquire<std::byte>(num_bytes);
+        if (is_var_) {
+            offsets_ = pool_->acquire<uint64_t>(num_cells + 1);
+        }
+        if (is_nullable_) {
+            validity_ = pool_->acquire<uint8_t>(num_cells);
+        }
+    } else {
+        data_.reserve(num_bytes);
+        if (is_var_) {
+            offsets_.reserve(num_cells + 1);  // extra offset for arrow
+        }
+        if (is_nullable_) {
+            validity_.reserve(num_cells);
+        }
     }
 }
 
 ColumnBuffer::~ColumnBuffer() {
     LOG_TRACE(fmt::format("[ColumnBuffer] release '{}'", name_));
+    if (pool_ != nullptr) {
+        pool_->release(std::move(data_));
+        pool_->release(std::move(offsets_));
+        pool_->release(std::move(validity_));
+    }
 }
 
 void ColumnBuffer::attach(Query& query) {
     // We cannot use:
     // `set_data_buffer(const std::string& name, std::vector<T>& buf)`
     // because data_ is allocated with reserve() and data_.size()
-    // does not represent the actual size of the buffer.
+    // does not represent the actual size of the buffer. The requested
+    // sizes are used rather than the capacities, which may be larger for
+    // pooled buffers, so that the batch size is honored.
     query.set_data_buffer(
-        name_, (void*)data_.data(), data_.capacity() / type_size_);
+        name_, (void*)data_.data(), alloc_bytes_ / type_size_);
     if (is_var_) {
-        // Remove one offset for TileDB, which checks that the
-        // offsets and validity buffers are the same size
-        query.set_offsets_buffer(
-            name_, offsets_.data(), offsets_.capacity() - 1);
+        // The extra offset for arrow is not given to TileDB, which checks
+        // that the offsets and validity buffers are the same size
+        query.set_offsets_buffer(name_, offsets_.data(), alloc_cells_);
     }
     if (is_nullable_) {
-        query.set_validity_buffer(
-            name_, validity_.data(), validity_.capacity());
+        query.set_validity_buffer(name_, validity_.data(), alloc_cells_);
     }
 }
 
@@ -223,11 +254,16 @@ std::shared_ptr<ColumnBuffer> ColumnBuffer::alloc(
     bool is_var,
     bool is_nullable,
     std::optional<Enumeration> enumeration,
-    bool is_ordered) {
+    bool is_ordered,
+    std::optional<size_t> max_cells,
+    std::optional<size_t> max_bytes,
+    std::shared_ptr<BufferPool> pool) {
     // Set number of bytes for the data buffer. Override with a value from
-    // the config if present.
+    // the config if present, or with the caller's batch byte budget.
     auto num_bytes = DEFAULT_ALLOC_BYTES;
-    if (config.contains(CONFIG_KEY_INIT_BYTES)) {
+    if (max_bytes.has_value()) {
+        num_bytes = *max_bytes;
+    } else if (config.contains(CONFIG_KEY_INIT_BYTES)) {
         auto value_str = config.get(CONFIG_KEY_INIT_BYTES);
         try {
             num_bytes = std::stoull(value_str);
@@ -253,6 +289,16 @@ std::shared_ptr<ColumnBuffer> ColumnBuffer::alloc(
     size_t num_cells = is_var ? num_bytes / sizeof(uint64_t) :
                                 num_bytes / tiledb::impl::type_size(type);
 
+    // A cell-count batch size bounds the number of cells directly. The data
+    // buffer of variable length columns keeps its byte size since the cell
+    // lengths are not known up front.
+    if (max_cells.has_value()) {
+        num_cells = std::max<size_t>(*max_cells, 1);
+        if (!is_var) {
+            num_bytes = num_cells * tiledb::impl::type_size(type);
+        }
+    }
+
     return std::make_shared<ColumnBuffer>(
         name,
         type,
@@ -261,7 +307,8 @@ std::shared_ptr<ColumnBuffer> ColumnBuffer::alloc(
         is_var,
         is_nullable,
         enumeration,
-        is_ordered);
+        is_ordered,
+        pool);
 }
 
 }  // namespace tiledbsoma
@@ -45,6 +45,8 @@
 
 namespace tiledbsoma {
 
+class BufferPool;
+
 using namespace tiledb;
 
 /**
@@ -58,23 +60,39 @@ class ColumnBuffer {
     // hardware including modern laptops and a broad range of EC2 instances. CI
     // can ask for smaller; power-server users can ask for larger.
     inline static const size_t DEFAULT_ALLOC_BYTES = 1 << 30;
-    inline static const std::string
-        CONFIG_KEY_INIT_BYTES = "soma.init_buffer_bytes";
 
    public:
     //===================================================================
     //= public static
     //===================================================================
 
+    // Config key fixing the number of bytes allocated for each column
+    inline static const std::string
+        CONFIG_KEY_INIT_BYTES = "soma.init_buffer_bytes";
+
     /**
      * @brief Create a ColumnBuffer from an array and column name.
      *
+     * If `max_cells` is set, the offsets and validity buffers (and the data
+     * buffer of fixed-length columns) are sized to hold exactly that many
+     * cells, bounding the number of rows returned by one read. If `max_bytes`
+     * is set, it replaces the `soma.init_buffer_bytes` allocation size.
+     *
+     * If `pool` is set, the buffers are taken from and returned to it.
+     *
      * @param array TileDB array
      * @param name TileDB dimension or attribute name
+     * @param max_cells Optional maximum number of cells to hold
+     * @param max_bytes Optional number of bytes to allocate for data
+     * @param pool Optional pool to allocate the buffers from
      * @return ColumnBuffer
      */
     static std::shared_ptr<ColumnBuffer> create(
-        std::shared_ptr<Array> array, std::string_view name);
+        std::shared_ptr<Array> array,
+        std::string_view name,
+        std::optional<size_t> max_cells = std::nullopt,
+        std::optional<size_t> max_bytes = std::nullopt,
+        std::shared_ptr<BufferPool> pool = nullptr);
 
     /**
      * @brief Convert a bytemap to a bitmap in place.
@@ -97,6 +115,7 @@ class ColumnBuffer {
      * @param is_nullable Column can contain null values
      * @param enumeration Optional Enumeration associated with column
      * @param is_ordered Optional Enumeration is ordered
+     * @param pool Optional pool to allocate the buffers from
      */
     ColumnBuffer(
         std::string_view name,
@@ -106,7 +125,8 @@ class ColumnBuffer {
         bool is_var = false,
         bool is_nullable = false,
         std::optional<Enumeration> enumeration = std::nullopt,
-        bool is_ordered = false);
+        bool is_ordered = false,
+        std::shared_ptr<BufferPool> pool = nullptr);
 
     ColumnBuffer() = delete;
     ColumnBuffer(const ColumnBuffer&) = delete;
@@ -428,6 +448,9 @@ class ColumnBuffer {
      * @param is_nullable True if nullable data
      * @param enumeration Optional Enumeration associated with column
      * @param is_ordered Optional Enumeration is ordered
+     * @param max_cells Optional maximum number of cells to hold
+     * @param max_bytes Optional number of bytes to allocate for data
+     * @param pool Optional pool to allocate the buffers from
      * @return ColumnBuffer
      */
     static std::shared_ptr<ColumnBuffer> alloc(
@@ -437,7 +460,10 @@ class ColumnBuffer {
         bool is_var,
         bool is_nullable,
         std::optional<Enumeration> enumeration,
-        bool is_ordered);
+        bool is_ordered,
+        std::optional<size_t> max_cells = std::nullopt,
+        std::optional<size_t> max_bytes = std::nullopt,
+        std::shared_ptr<BufferPool> pool = nullptr);
 
     //===================================================================
     //= private non-static
@@ -476,6 +502,14 @@ class ColumnBuffer {
     // Validity buffer (optional).
     std::vector<uint8_t> validity_;
 
+    // Number of cells and data bytes attached to a read query. Pooled
+    // buffers may have a larger capacity than requested.
+    size_t alloc_cells_;
+    size_t alloc_bytes_;
+
+    // Pool the buffers are returned to on destruction (optional).
+    std::shared_ptr<BufferPool> pool_;
+
     // True if the array has at least one enumerations
     bool has_enumeration_ = false;
 
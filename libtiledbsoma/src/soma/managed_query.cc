@@ -55,10 +55,19 @@ ManagedQuery::ManagedQuery(
 }
 
 void ManagedQuery::close() {
+    if (query_future_.valid()) {
+        query_future_.wait();
+    }
     array_->close();
 }
 
 void ManagedQuery::reset() {
+    // Wait for any read still running on the query being replaced
+    if (query_future_.valid()) {
+        query_future_.wait();
+        query_future_ = {};
+    }
+
     query_ = std::make_unique<Query>(*ctx_, *array_);
     subarray_ = std::make_unique<Subarray>(*ctx_, *array_);
 
@@ -69,6 +78,9 @@ void ManagedQuery::reset() {
     total_num_cells_ = 0;
     buffers_.reset();
     query_submitted_ = false;
+    read_cells_ = 0;
+    read_cell_bytes_ = 0;
+    read_var_cell_bytes_.clear();
 }
 
 void ManagedQuery::select_columns(
@@ -215,6 +227,44 @@ void ManagedQuery::set_column_data(
     }
 }
 
+void ManagedQuery::set_batch_size(std::string_view batch_size) {
+    batch_cells_.reset();
+    batch_bytes_.reset();
+    batch_var_cell_bytes_ = BATCH_VAR_CELL_BYTES;
+
+    if (batch_size.empty() || batch_size == "auto") {
+        return;
+    }
+
+    auto sep = batch_size.find('=');
+    auto kind = batch_size.substr(0, sep);
+    std::string value_str(
+        sep == std::string_view::npos ? "" : batch_size.substr(sep + 1));
+
+    size_t value;
+    try {
+        value = std::stoull(value_str);
+    } catch (const std::exception& e) {
+        throw TileDBSOMAError(fmt::format(
+            "[ManagedQuery] [{}] Invalid batch size '{}'", name_, batch_size));
+    }
+    if (value == 0) {
+        throw TileDBSOMAError(fmt::format(
+            "[ManagedQuery] [{}] Batch size must be positive: '{}'",
+            name_,
+            batch_size));
+    }
+
+    if (kind == "count") {
+        batch_cells_ = value;
+    } else if (kind == "bytes") {
+        batch_bytes_ = value;
+    } else {
+        throw TileDBSOMAError(fmt::format(
+            "[ManagedQuery] [{}] Invalid batch size '{}'", name_, batch_size));
+    }
+}
+
 void ManagedQuery::setup_read() {
     // If the query is complete, return so we do not submit it again
     auto status = query_->query_status();
@@ -258,13 +308,54 @@ void ManagedQuery::setup_read() {
         }
     }
 
+    bool adaptive = adaptive_sizing();
+    if (adaptive && read_cells_ == 0) {
+        estimate_read_sizes();
+    }
+
+    // A byte batch size is split evenly across the selected columns. A cell
+    // count batch size sizes the data of variable-length columns from the
+    // count, as their cell lengths are not known up front; fixed-length
+    // columns are sized from the count alone.
+    std::optional<size_t> column_bytes;
+    if (batch_bytes_.has_value()) {
+        column_bytes = std::max<size_t>(
+            *batch_bytes_ / columns_.size(), MIN_COLUMN_BYTES);
+    } else if (batch_cells_.has_value()) {
+        column_bytes = std::clamp<size_t>(
+            *batch_cells_ * batch_var_cell_bytes_,
+            MIN_COLUMN_BYTES,
+            ColumnBuffer::DEFAULT_ALLOC_BYTES);
+    }
+
     // Allocate and attach buffers
     LOG_TRACE("[ManagedQuery] allocate new buffers");
     buffers_ = std::make_shared<ArrayBuffers>();
     for (auto& name : columns_) {
         LOG_DEBUG(fmt::format(
             "[ManagedQuery] [{}] Adding buffer for column '{}'", name_, name));
-        buffers_->emplace(name, ColumnBuffer::create(array_, name));
+        if (adaptive) {
+            // Fixed-length data is sized from the number of cells, while
+            // variable-length data is sized from its bytes per cell
+            std::optional<size_t> var_bytes;
+            if (read_var_cell_bytes_.count(name)) {
+                var_bytes = std::max<size_t>(
+                    read_cells_ * read_var_cell_bytes_[name], MIN_COLUMN_BYTES);
+            }
+            buffers_->emplace(
+                name,
+                ColumnBuffer::create(
+                    array_, name, read_cells_, var_bytes, buffer_pool_));
+        } else {
+            buffers_->emplace(
+                name,
+                ColumnBuffer::create(
+                    array_,
+                    name,
+                    batch_cells_,
+                    column_bytes,
+                    buffer_pool_));
+        }
         buffers_->at(name)->attach(*query_);
     }
 }
@@ -285,20 +376,49 @@ void ManagedQuery::submit_write(bool sort_coords) {
     }
 }
 
-void ManagedQuery::submit_read() {
+void ManagedQuery::submit_read(bool setup) {
     query_submitted_ = true;
-    query_future_ = std::async(std::launch::async, [&]() {
+    {
+        const std::lock_guard<std::mutex> lock(read_done_mutex_);
+        read_done_ = false;
+    }
+    query_future_ = std::async(std::launch::async, [&, setup]() {
         LOG_DEBUG("[ManagedQuery] submit thread start");
+        StatusAndException status(true, "success");
         try {
+            if (setup) {
+                setup_read();
+            }
             query_->submit();
         } catch (const std::exception& e) {
-            return StatusAndException(false, e.what());
+            status = StatusAndException(false, e.what());
         }
         LOG_DEBUG("[ManagedQuery] submit thread done");
-        return StatusAndException(true, "success");
+
+        std::vector<std::function<void()>> callbacks;
+        {
+            const std::lock_guard<std::mutex> lock(read_done_mutex_);
+            read_done_ = true;
+            std::swap(callbacks, read_done_callbacks_);
+        }
+        for (auto& callback : callbacks) {
+            callback();
+        }
+        return status;
     });
 }
 
+void ManagedQuery::on_read_done(std::function<void()> callback) {
+    {
+        const std::lock_guard<std::mutex> lock(read_done_mutex_);
+        if (!read_done_) {
+            read_done_callbacks_.push_back(std::move(callback));
+            return;
+        }
+    }
+    callback();
+}
+
 std::shared_ptr<ArrayBuffers> ManagedQuery::results() {
     if (is_empty_query()) {
         return buffers_;
@@ -347,10 +467,20 @@ std::shared_ptr<ArrayBuffers> ManagedQuery::results() {
     }
     total_num_cells_ += num_cells;
 
-    // TODO: retry the query with larger buffers
+    // Grow adaptively sized buffers so the rest of the query needs fewer
+    // reads, and retry a read that did not fit a single cell
+    bool grown = status == Query::Status::INCOMPLETE && adaptive_sizing() &&
+                 grow_read_sizes();
     if (status == Query::Status::INCOMPLETE && !num_cells) {
-        throw TileDBSOMAError(
-            fmt::format("[ManagedQuery] [{}] Buffers are too small.", name_));
+        if (!grown && !grow_batch_var_cell_bytes()) {
+            throw TileDBSOMAError(fmt::format(
+                "[ManagedQuery] [{}] Buffers are too small.", name_));
+        }
+        LOG_DEBUG(fmt::format(
+            "[ManagedQuery] [{}] Retrying read with larger buffers", name_));
+        setup_read();
+        submit_read();
+        return results();
     }
 
     // Visit all attributes and retrieve enumeration vectors
@@ -386,4 +516,144 @@ void ManagedQuery::check_column_name(const std::string& name) {
             name));
     }
 }
+
+bool ManagedQuery::adaptive_sizing() const {
+    return !batch_cells_.has_value() && !batch_bytes_.has_value() &&
+           !ctx_->config().contains(ColumnBuffer::CONFIG_KEY_INIT_BYTES);
+}
+
+size_t ManagedQuery::read_memory_budget() const {
+    auto config = ctx_->config();
+    if (!config.contains(CONFIG_KEY_READ_MEMORY_BUDGET)) {
+        return DEFAULT_READ_MEMORY_BUDGET;
+    }
+    auto value_str = config.get(CONFIG_KEY_READ_MEMORY_BUDGET);
+    try {
+        return std::stoull(value_str);
+    } catch (const std::exception& e) {
+        throw TileDBSOMAError(fmt::format(
+            "[ManagedQuery] Error parsing {}: '{}' ({})",
+            CONFIG_KEY_READ_MEMORY_BUDGET,
+            value_str,
+            e.what()));
+    }
+}
+
+void ManagedQuery::estimate_read_sizes() {
+    size_t est_cells = 0;
+    read_cell_bytes_ = 0;
+    read_var_cell_bytes_.clear();
+
+    // Estimated data bytes of each variable-length column
+    std::map<std::string, uint64_t> var_data_bytes;
+
+    for (auto& name : columns_) {
+        tiledb_datatype_t type;
+        bool is_var, is_nullable;
+        if (schema_->has_attribute(name)) {
+            auto attr = schema_->attribute(name);
+            type = attr.type();
+            is_var = attr.cell_val_num() == TILEDB_VAR_NUM;
+            is_nullable = attr.nullable();
+        } else {
+            auto dim = schema_->domain().dimension(name);
+            type = dim.type();
+            is_var = dim.cell_val_num() == TILEDB_VAR_NUM ||
+                     type == TILEDB_STRING_ASCII || type == TILEDB_STRING_UTF8;
+            is_nullable = false;
+        }
+
+        size_t cells;
+        if (is_var) {
+            uint64_t offsets_bytes, data_bytes;
+            if (is_nullable) {
+                auto est = query_->est_result_size_var_nullable(name);
+                offsets_bytes = est[0];
+                data_bytes = est[1];
+            } else {
+                auto est = query_->est_result_size_var(name);
+                offsets_bytes = est[0];
+                data_bytes = est[1];
+            }
+            cells = offsets_bytes / sizeof(uint64_t);
+            var_data_bytes[name] = data_bytes;
+            read_cell_bytes_ += sizeof(uint64_t);
+        } else {
+            auto type_size = tiledb::impl::type_size(type);
+            uint64_t data_bytes;
+            if (is_nullable) {
+                data_bytes = query_->est_result_size_nullable(name)[0];
+            } else {
+                data_bytes = query_->est_result_size(name);
+            }
+            cells = data_bytes / type_size;
+            read_cell_bytes_ += type_size;
+        }
+        if (is_nullable) {
+            read_cell_bytes_ += sizeof(uint8_t);
+        }
+        est_cells = std::max(est_cells, cells);
+    }
+
+    // Average data bytes per cell of each variable-length column
+    size_t var_cell_bytes = 0;
+    for (auto& [name, data_bytes] : var_data_bytes) {
+        size_t bytes = est_cells ? (data_bytes + est_cells - 1) / est_cells : 1;
+        read_var_cell_bytes_[name] = std::max<size_t>(bytes, 1);
+        var_cell_bytes += read_var_cell_bytes_[name];
+    }
+
+    auto max_cells = std::max<size_t>(
+        read_memory_budget() / (read_cell_bytes_ + var_cell_bytes), 1);
+    read_cells_ = std::min(std::max(est_cells, MIN_READ_CELLS), max_cells);
+
+    LOG_DEBUG(fmt::format(
+        "[ManagedQuery] [{}] Estimated {} result cells, allocating {} cells",
+        name_,
+        est_cells,
+        read_cells_));
+}
+
+bool ManagedQuery::grow_read_sizes() {
+    size_t var_cell_bytes = 0;
+    for (auto& [name, bytes] : read_var_cell_bytes_) {
+        var_cell_bytes += bytes;
+    }
+    auto max_cells = std::max<size_t>(
+        read_memory_budget() / (read_cell_bytes_ + var_cell_bytes), 1);
+
+    if (read_cells_ < max_cells) {
+        read_cells_ = std::min(read_cells_ * 2, max_cells);
+    } else if (!read_var_cell_bytes_.empty() && read_cells_ > 1) {
+        // At the budget, trade cells for room to hold longer values
+        read_cells_ /= 2;
+        for (auto& [name, bytes] : read_var_cell_bytes_) {
+            bytes *= 2;
+        }
+    } else {
+        return false;
+    }
+
+    LOG_DEBUG(fmt::format(
+        "[ManagedQuery] [{}] Growing read buffers to {} cells",
+        name_,
+        read_cells_));
+    return true;
+}
+
+bool ManagedQuery::grow_batch_var_cell_bytes() {
+    if (!batch_cells_.has_value() ||
+        *batch_cells_ * batch_var_cell_bytes_ >=
+            ColumnBuffer::DEFAULT_ALLOC_BYTES) {
+        return false;
+    }
+    batch_var_cell_bytes_ *= 2;
+
+    LOG_DEBUG(fmt::format(
+        "[ManagedQuery] [{}] Growing variable-length buffers to {} bytes per "
+        "cell",
+        name_,
+        batch_var_cell_bytes_));
+    return true;
+}
 };  // namespace tiledbsoma
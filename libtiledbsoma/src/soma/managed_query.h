@@ -33,7 +33,10 @@
 #ifndef MANAGED_QUERY_H
 #define MANAGED_QUERY_H
 
+#include <algorithm>
+#include <functional>
 #include <future>
+#include <mutex>
 #include <stdexcept>  // for windows: error C2039: 'runtime_error': is not a member of 'std'
 #include <unordered_set>
 
@@ -101,7 +104,11 @@ class ManagedQuery {
         , results_complete_(other.results_complete_)
         , total_num_cells_(other.total_num_cells_)
         , buffers_(other.buffers_)
-        , query_submitted_(other.query_submitted_) {
+        , query_submitted_(other.query_submitted_)
+        , batch_cells_(other.batch_cells_)
+        , batch_bytes_(other.batch_bytes_)
+        , batch_var_cell_bytes_(other.batch_var_cell_bytes_)
+        , buffer_pool_(other.buffer_pool_) {
     }
 
     ~ManagedQuery() = default;
@@ -168,12 +175,7 @@ class ManagedQuery {
      */
     template <typename T>
     void select_points(const std::string& dim, const std::vector<T>& points) {
-        subarray_range_set_ = true;
-        subarray_range_empty_[dim] = true;
-        for (auto& point : points) {
-            subarray_->add_range(dim, point, point);
-            subarray_range_empty_[dim] = false;
-        }
+        add_points<T>(dim, points.begin(), points.end());
     }
 
     /**
@@ -185,12 +187,7 @@ class ManagedQuery {
      */
     template <typename T>
     void select_points(const std::string& dim, const tcb::span<T> points) {
-        subarray_range_set_ = true;
-        subarray_range_empty_[dim] = true;
-        for (auto& point : points) {
-            subarray_->add_range(dim, point, point);
-            subarray_range_empty_[dim] = false;
-        }
+        add_points<std::remove_cv_t<T>>(dim, points.begin(), points.end());
     }
 
     /**
@@ -234,6 +231,28 @@ class ManagedQuery {
      */
     void set_column_data(std::shared_ptr<ColumnBuffer> buffer);
 
+    /**
+     * @brief Set the size of the batches returned by each read. Accepted
+     * values are "auto" (size buffers from `soma.init_buffer_bytes`),
+     * "count=N" (at most N cells per batch) and "bytes=N" (buffers totalling
+     * about N bytes per batch). With "count=N", variable-length data
+     * buffers start at N * BATCH_VAR_CELL_BYTES bytes and double while a
+     * single cell does not fit.
+     *
+     * @param batch_size Batch size specification
+     */
+    void set_batch_size(std::string_view batch_size);
+
+    /**
+     * @brief Allocate read buffers from the given pool, which reuses the
+     * buffers released by earlier reads.
+     *
+     * @param pool Buffer pool, or nullptr to allocate new buffers
+     */
+    void set_buffer_pool(std::shared_ptr<BufferPool> pool) {
+        buffer_pool_ = pool;
+    }
+
     /**
      * @brief Configure query and allocate result buffers for reads.
      *
@@ -329,8 +348,11 @@ class ManagedQuery {
     /**
      * @brief Submit the query.
      *
+     * @param setup Also configure the query and allocate its buffers, as
+     * `setup_read` does, on the thread running the read rather than on the
+     * caller's. Errors of either step are then raised by `results`.
      */
-    void submit_read();
+    void submit_read(bool setup = false);
 
     /**
      * @brief Return results from the query.
@@ -339,6 +361,26 @@ class ManagedQuery {
      */
     std::shared_ptr<ArrayBuffers> results();
 
+    /**
+     * @brief Return true if a read was submitted and its results have not
+     * been collected with `results()` yet.
+     *
+     * @return bool
+     */
+    bool has_pending_read() const {
+        return query_future_.valid();
+    }
+
+    /**
+     * @brief Call `callback` once the submitted read has completed, from the
+     * thread that ran it, or right away if no read is running. Callbacks
+     * added for the same read are all called. The callback must not block:
+     * it may run while other threads wait for the read.
+     *
+     * @param callback Function to call
+     */
+    void on_read_done(std::function<void()> callback);
+
     /**
      * @brief Submit the write query.
      *
@@ -380,10 +422,77 @@ class ManagedQuery {
     }
 
    private:
+    //===================================================================
+    //= private static
+    //===================================================================
+
+    // Config key for the total buffer memory of an adaptively sized read
+    inline static const std::string
+        CONFIG_KEY_READ_MEMORY_BUDGET = "soma.read_memory_budget";
+
+    // Default total buffer memory of an adaptively sized read. This matches
+    // the memory of two columns under the previous fixed 1 GiB per column
+    // allocation.
+    inline static const size_t DEFAULT_READ_MEMORY_BUDGET = size_t(1) << 31;
+
+    // Smallest per-column data buffer allocated for a read
+    static const size_t MIN_COLUMN_BYTES = 1 << 16;
+
+    // Smallest number of cells allocated for an adaptively sized read
+    static const size_t MIN_READ_CELLS = 1 << 10;
+
+    // Initial data bytes per cell allocated for variable-length columns in
+    // reads batched by cell count
+    static const size_t BATCH_VAR_CELL_BYTES = 64;
+
     //===================================================================
     //= private non-static
     //===================================================================
 
+    /**
+     * @brief Add the given points as ranges of the subarray.
+     *
+     * On sparse arrays, integer points are sorted, deduplicated and
+     * coalesced into ranges of consecutive values, as the order of the
+     * ranges does not affect the result and TileDB's cost grows with the
+     * number of ranges. Points are added one range each otherwise.
+     *
+     * @tparam T Dimension type
+     * @param dim Dimension name
+     * @param begin Iterator to the first point
+     * @param end Iterator past the last point
+     */
+    template <typename T, typename Iter>
+    void add_points(const std::string& dim, Iter begin, Iter end) {
+        subarray_range_set_ = true;
+        subarray_range_empty_[dim] = begin == end;
+
+        if constexpr (std::is_integral_v<T> && !std::is_same_v<T, bool>) {
+            if (schema_->array_type() == TILEDB_SPARSE) {
+                // Points are often given sorted, e.g. by split reads
+                std::vector<T> points(begin, end);
+                if (!std::is_sorted(points.begin(), points.end())) {
+                    std::sort(points.begin(), points.end());
+                }
+                points.erase(
+                    std::unique(points.begin(), points.end()), points.end());
+
+                for (size_t i = 0, j = 1; i < points.size(); i = j++) {
+                    while (j < points.size() &&
+                           points[j - 1] + 1 == points[j]) {
+                        j++;
+                    }
+                    subarray_->add_range(dim, points[i], points[j - 1]);
+                }
+                return;
+            }
+        }
+
+        for (auto it = begin; it != end; ++it) {
+            subarray_->add_range(dim, *it, *it);
+        }
+    }
+
     /**
      * @brief Check if column name is contained in the query results.
      *
@@ -391,6 +500,43 @@ class ManagedQuery {
      */
     void check_column_name(const std::string& name);
 
+    /**
+     * @brief Return true if read buffers are sized from the estimated result
+     * size. This is the case unless a batch size was set or the
+     * `soma.init_buffer_bytes` config key fixes the per-column allocation.
+     */
+    bool adaptive_sizing() const;
+
+    /**
+     * @brief Return the total buffer memory budget of a read, from the
+     * `soma.read_memory_budget` config key or DEFAULT_READ_MEMORY_BUDGET.
+     */
+    size_t read_memory_budget() const;
+
+    /**
+     * @brief Size the read buffers from TileDB's estimated result size of
+     * each selected column, capped to fit the read memory budget.
+     */
+    void estimate_read_sizes();
+
+    /**
+     * @brief Grow the read buffers after an incomplete read. The number of
+     * cells is doubled until the read memory budget is reached; after that,
+     * cells are traded for variable-length data bytes so that longer values
+     * fit.
+     *
+     * @return true if the buffer sizes changed
+     */
+    bool grow_read_sizes();
+
+    /**
+     * @brief Double the variable-length data bytes per cell of a read batched
+     * by cell count, after a read that did not fit a single cell.
+     *
+     * @return true if the buffer sizes changed
+     */
+    bool grow_batch_var_cell_bytes();
+
     // TileDB array being queried.
     std::shared_ptr<Array> array_;
 
@@ -432,6 +578,39 @@ class ManagedQuery {
 
     // Future for asyncronous query
     std::future<StatusAndException> query_future_;
+
+    // True unless a submitted read is still running
+    bool read_done_ = true;
+
+    // Functions to call when the running read completes, added by
+    // `on_read_done`
+    std::vector<std::function<void()>> read_done_callbacks_;
+
+    // Mutex protecting read_done_ and read_done_callbacks_
+    std::mutex read_done_mutex_;
+
+    // Maximum number of cells per read batch, if set by `set_batch_size`
+    std::optional<size_t> batch_cells_;
+
+    // Buffer byte budget per read batch, if set by `set_batch_size`
+    std::optional<size_t> batch_bytes_;
+
+    // Data bytes per cell allocated for variable-length columns when
+    // `batch_cells_` is set
+    size_t batch_var_cell_bytes_ = BATCH_VAR_CELL_BYTES;
+
+    // Number of cells allocated in adaptively sized read buffers, zero until
+    // estimated
+    size_t read_cells_ = 0;
+
+    // Buffer bytes per cell for fixed-length data, offsets and validity
+    size_t read_cell_bytes_ = 0;
+
+    // Data bytes per cell allocated for each variable-length column
+    std::map<std::string, size_t> read_var_cell_bytes_;
+
+    // Pool to allocate read buffers from (optional)
+    std::shared_ptr<BufferPool> buffer_pool_;
 };
 };  // namespace tiledbsoma
 
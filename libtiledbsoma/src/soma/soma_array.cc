@@ -31,6 +31,7 @@
  */
 
 #include "soma_array.h"
+#include "array_cache.h"
 #include <tiledb/array_experimental.h>
 #include "../utils/logger.h"
 #include "../utils/util.h"
@@ -172,6 +173,7 @@ SOMAArray::SOMAArray(
     , timestamp_(timestamp)
     , mq_(std::make_unique<ManagedQuery>(arr, ctx_->tiledb_ctx(), name_))
     , arr_(arr) {
+    mq_->set_buffer_pool(ctx_->buffer_pool());
     reset({}, batch_size_, result_order_);
     fill_metadata_cache();
 }
@@ -236,10 +238,20 @@ void SOMAArray::close() {
     if (arr_->query_type() == TILEDB_WRITE)
         meta_cache_arr_->close();
 
-    // Close the array through the managed query to ensure any pending queries
-    // are completed.
-    mq_->close();
+    if (cached_arr_) {
+        // Wait for any pending query, but leave the shared array open.
+        mq_->reset();
+    } else {
+        // Close the array through the managed query to ensure any pending
+        // queries are completed.
+        mq_->close();
+    }
     metadata_.clear();
+
+    // Reads cached at timestamps covering this write would miss it
+    if (arr_->query_type() == TILEDB_WRITE) {
+        ctx_->array_cache()->invalidate(uri_);
+    }
 }
 
 void SOMAArray::reset(
@@ -248,6 +260,7 @@ void SOMAArray::reset(
     ResultOrder result_order) {
     // Reset managed query
     mq_->reset();
+    mq_->set_batch_size(batch_size);
 
     if (!column_names.empty()) {
         mq_->select_columns(column_names);
@@ -278,7 +291,21 @@ void SOMAArray::reset(
     submitted_ = false;
 }
 
+bool SOMAArray::prefetch() const {
+    if (prefetch_.has_value()) {
+        return *prefetch_;
+    }
+    auto cfg = ctx_->tiledb_config();
+    auto it = cfg.find(CONFIG_KEY_PREFETCH);
+    return it != cfg.end() && (it->second == "true" || it->second == "1");
+}
+
 std::optional<std::shared_ptr<ArrayBuffers>> SOMAArray::read_next() {
+    // Return the batch submitted ahead of time by the previous call
+    if (mq_->has_pending_read()) {
+        return _results_and_prefetch();
+    }
+
     // If the query is complete, return `std::nullopt`
     if (mq_->is_complete(true)) {
         return std::nullopt;
@@ -302,7 +329,41 @@ std::optional<std::shared_ptr<ArrayBuffers>> SOMAArray::read_next() {
     mq_->submit_read();
 
     // Return the results, possibly incomplete
-    return mq_->results();
+    return _results_and_prefetch();
+}
+
+bool SOMAArray::submit_next() {
+    if (mq_->has_pending_read()) {
+        return true;
+    }
+
+    // Leave complete and empty queries to `read_next`, which does not submit
+    // them
+    if (mq_->is_complete(true) || mq_->is_empty_query()) {
+        return false;
+    }
+
+    // Buffers are sized and allocated by the read's own thread, as sizing
+    // may itself read from storage
+    first_read_next_ = false;
+    mq_->submit_read(true);
+    return true;
+}
+
+std::shared_ptr<ArrayBuffers> SOMAArray::_results_and_prefetch() {
+    auto results = mq_->results();
+
+    // When prefetching, submit the next batch into a fresh set of buffers
+    // before handing this batch to the caller. `results` keeps its own
+    // buffers alive, so the two sets alternate between TileDB and the caller.
+    if (prefetch() && !mq_->is_complete(true)) {
+        LOG_DEBUG(
+            fmt::format("[SOMAArray] [{}] prefetching next batch", name_));
+        mq_->setup_read();
+        mq_->submit_read();
+    }
+
+    return results;
 }
 
 bool SOMAArray::_extend_enumeration(
@@ -1269,6 +1330,16 @@ std::optional<std::string> SOMAArray::get_enum_label_on_attr(
         *ctx_->tiledb_ctx(), attr);
 }
 
+std::optional<Enumeration> SOMAArray::get_enumeration_on_attr(
+    const std::string& attr_name) {
+    auto enmr_label = get_enum_label_on_attr(attr_name);
+    if (!enmr_label.has_value()) {
+        return std::nullopt;
+    }
+    return ArrayExperimental::get_enumeration(
+        *ctx_->tiledb_ctx(), *arr_, *enmr_label);
+}
+
 bool SOMAArray::attr_has_enum(std::string attr_name) {
     return get_enum_label_on_attr(attr_name).has_value();
 }
@@ -1332,22 +1403,39 @@ void SOMAArray::validate(
     // Validate parameters
     auto tdb_mode = mode == OpenMode::read ? TILEDB_READ : TILEDB_WRITE;
 
+    // Reads at a fixed timestamp range may share an array opened earlier
+    // in this context, with its schema and fragment metadata already loaded
+    auto& cache = ctx_->array_cache();
+    cached_arr_ = tdb_mode == TILEDB_READ && timestamp && cache->enabled();
+
     try {
-        LOG_DEBUG(fmt::format("[SOMAArray] opening array '{}'", uri_));
-        if (timestamp) {
-            arr_ = std::make_shared<Array>(
-                *ctx_->tiledb_ctx(),
-                uri_,
-                tdb_mode,
-                TemporalPolicy(
-                    TimestampStartEnd, timestamp->first, timestamp->second));
+        arr_ = cached_arr_ ? cache->get(uri_, *timestamp) : nullptr;
+        if (arr_ != nullptr) {
+            LOG_DEBUG(fmt::format("[SOMAArray] reusing array '{}'", uri_));
         } else {
-            arr_ = std::make_shared<Array>(*ctx_->tiledb_ctx(), uri_, tdb_mode);
+            LOG_DEBUG(fmt::format("[SOMAArray] opening array '{}'", uri_));
+            if (timestamp) {
+                arr_ = std::make_shared<Array>(
+                    *ctx_->tiledb_ctx(),
+                    uri_,
+                    tdb_mode,
+                    TemporalPolicy(
+                        TimestampStartEnd,
+                        timestamp->first,
+                        timestamp->second));
+            } else {
+                arr_ = std::make_shared<Array>(
+                    *ctx_->tiledb_ctx(), uri_, tdb_mode);
+            }
+            LOG_TRACE(fmt::format("[SOMAArray] loading enumerations"));
+            ArrayExperimental::load_all_enumerations(
+                *ctx_->tiledb_ctx(), *(arr_.get()));
+            if (cached_arr_) {
+                cache->put(uri_, *timestamp, arr_);
+            }
         }
-        LOG_TRACE(fmt::format("[SOMAArray] loading enumerations"));
-        ArrayExperimental::load_all_enumerations(
-            *ctx_->tiledb_ctx(), *(arr_.get()));
         mq_ = std::make_unique<ManagedQuery>(arr_, ctx_->tiledb_ctx(), name);
+        mq_->set_buffer_pool(ctx_->buffer_pool());
     } catch (const std::exception& e) {
         throw TileDBSOMAError(
             fmt::format("Error opening array: '{}'\n  {}", uri_, e.what()));
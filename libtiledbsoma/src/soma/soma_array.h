@@ -54,6 +54,9 @@ class SOMAArray : public SOMAObject {
     //= public static
     //===================================================================
 
+    // Config key enabling prefetching reads, see `set_prefetch`
+    inline static const std::string CONFIG_KEY_PREFETCH = "soma.read_prefetch";
+
     /**
      * @brief Create a SOMAArray object at the given URI.
      *
@@ -179,9 +182,12 @@ class SOMAArray : public SOMAObject {
               other.arr_, other.ctx_->tiledb_ctx(), other.name_))
         , arr_(other.arr_)
         , meta_cache_arr_(other.meta_cache_arr_)
+        , cached_arr_(other.cached_arr_)
         , first_read_next_(other.first_read_next_)
         , submitted_(other.submitted_)
+        , prefetch_(other.prefetch_)
         , array_buffer_(other.array_buffer_) {
+        mq_->set_buffer_pool(ctx_->buffer_pool());
         fill_metadata_cache();
     }
 
@@ -402,6 +408,15 @@ class SOMAArray : public SOMAObject {
         return mq_->column_names();
     }
 
+    /**
+     * @brief Returns the batch size set by the query.
+     *
+     * @return std::string
+     */
+    std::string batch_size() const {
+        return batch_size_;
+    }
+
     /**
      * @brief Returns the result order set by the query.
      *
@@ -411,6 +426,28 @@ class SOMAArray : public SOMAObject {
         return result_order_;
     }
 
+    /**
+     * @brief Enable or disable prefetching reads. When enabled, `read_next`
+     * submits the query for the next batch into a second set of buffers
+     * before returning the current batch, so TileDB reads and decodes the
+     * next batch while the caller is converting the current one. This holds
+     * up to two batches of buffers in memory at once.
+     *
+     * Defaults to the value of the `soma.read_prefetch` config key, or false.
+     *
+     * @param prefetch Enable prefetching reads
+     */
+    void set_prefetch(bool prefetch) {
+        prefetch_ = prefetch;
+    }
+
+    /**
+     * @brief Returns true if prefetching reads are enabled.
+     *
+     * @return bool
+     */
+    bool prefetch() const;
+
     /**
      * @brief Read the next chunk of results from the query. If all results
      * have already been read, std::nullopt is returned.
@@ -426,6 +463,31 @@ class SOMAArray : public SOMAObject {
      */
     std::optional<std::shared_ptr<ArrayBuffers>> read_next();
 
+    /**
+     * @brief Submit the read of the next chunk of results without waiting
+     * for it, unless one is already running. The chunk is then returned by
+     * the next call to `read_next`, which waits for the read to complete.
+     *
+     * Callers that should not block, such as event loops, submit the read,
+     * call `read_next` once `on_read_done` has called back, and so do not
+     * wait at all.
+     *
+     * @return True if a read is running; false if `read_next` can return
+     * without reading, because the query is complete or empty.
+     */
+    bool submit_next();
+
+    /**
+     * @brief Call `callback` once the read submitted by `submit_next` has
+     * completed, or right away if no read is running. The callback runs on
+     * the thread of the read, and must not block.
+     *
+     * @param callback Function to call
+     */
+    void on_read_done(std::function<void()> callback) {
+        mq_->on_read_done(std::move(callback));
+    }
+
     /**
      * @brief Set the write buffers for a single column.
      *
@@ -644,6 +706,14 @@ class SOMAArray : public SOMAObject {
      */
     std::optional<std::string> get_enum_label_on_attr(std::string attr_name);
 
+    /**
+     * @brief Get the Enumeration associated with the given Attr.
+     *
+     * @return std::optional<Enumeration> The enumeration if one exists.
+     */
+    std::optional<Enumeration> get_enumeration_on_attr(
+        const std::string& attr_name);
+
     /**
      * @brief Check if the given attribute has an associated enumeration.
      *
@@ -1203,6 +1273,10 @@ class SOMAArray : public SOMAObject {
     // Helper function for set_column_data
     std::shared_ptr<ColumnBuffer> _setup_column_data(std::string_view name);
 
+    // Helper function for read_next: collects the submitted batch and, when
+    // prefetching, submits the next one
+    std::shared_ptr<ArrayBuffers> _results_and_prefetch();
+
     // Fills the metadata cache upon opening the array.
     void fill_metadata_cache();
 
@@ -1244,12 +1318,19 @@ class SOMAArray : public SOMAObject {
     // be accessible
     std::shared_ptr<Array> meta_cache_arr_;
 
+    // True if arr_ is shared through the context's array cache, in which
+    // case closing this object leaves it open for the other users
+    bool cached_arr_ = false;
+
     // True if this is the first call to read_next()
     bool first_read_next_ = true;
 
     // True if the query was submitted
     bool submitted_ = false;
 
+    // Prefetch reads, if set by `set_prefetch`; otherwise read from config
+    std::optional<bool> prefetch_;
+
     // Unoptimized method for computing nnz() (issue `count_cells` query)
     uint64_t nnz_slow();
 
@@ -30,6 +30,10 @@
  *   This file defines the SOMAContext class.
  */
 #include "soma_context.h"
+#include "array_cache.h"
+#include "buffer_pool.h"
+#include "../utils/common.h"
+#include "../utils/logger.h"
 #include <thread_pool/thread_pool.h>
 
 namespace tiledbsoma {
@@ -50,4 +54,52 @@ std::shared_ptr<ThreadPool>& SOMAContext::thread_pool() {
     }
     return thread_pool_;
 }
+
+size_t SOMAContext::config_size(
+    const std::string& key, size_t default_value) const {
+    auto cfg = tiledb_config();
+    auto it = cfg.find(key);
+    if (it == cfg.end()) {
+        return default_value;
+    }
+
+    const auto& value_str = it->second;
+    size_t pos = 0;
+    size_t value = 0;
+    try {
+        value = std::stoull(value_str, &pos);
+    } catch (const std::exception&) {
+        pos = 0;
+    }
+    // std::stoull accepts, and wraps around, negative values
+    if (pos == 0 || pos != value_str.size() ||
+        value_str.find('-') != std::string::npos) {
+        throw TileDBSOMAError(fmt::format(
+            "[SOMAContext] Error parsing {}: '{}' is not a non-negative "
+            "integer",
+            key,
+            value_str));
+    }
+    return value;
+}
+
+std::shared_ptr<BufferPool>& SOMAContext::buffer_pool() {
+    const std::lock_guard<std::mutex> lock(buffer_pool_mutex_);
+    // The first thread that gets here will create the context buffer pool
+    if (buffer_pool_ == nullptr) {
+        buffer_pool_ = std::make_shared<BufferPool>(config_size(
+            CONFIG_KEY_BUFFER_POOL_BYTES, BufferPool::DEFAULT_MAX_BYTES));
+    }
+    return buffer_pool_;
+}
+
+std::shared_ptr<ArrayCache>& SOMAContext::array_cache() {
+    const std::lock_guard<std::mutex> lock(array_cache_mutex_);
+    // The first thread that gets here will create the context array cache
+    if (array_cache_ == nullptr) {
+        array_cache_ = std::make_shared<ArrayCache>(config_size(
+            CONFIG_KEY_ARRAY_CACHE_ENTRIES, ArrayCache::DEFAULT_MAX_ENTRIES));
+    }
+    return array_cache_;
+}
 }  // namespace tiledbsoma
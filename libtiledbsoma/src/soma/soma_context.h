@@ -39,6 +39,8 @@
 #include <tiledb/tiledb>
 
 namespace tiledbsoma {
+class ArrayCache;
+class BufferPool;
 class ThreadPool;
 
 using namespace tiledb;
@@ -73,11 +75,41 @@ class SOMAContext {
 
     std::shared_ptr<ThreadPool>& thread_pool();
 
+    /**
+     * @brief Return the pool of read buffers shared by all queries in this
+     * context. The pool holds at most `soma.buffer_pool_bytes` bytes; set it
+     * to 0 to disable pooling.
+     */
+    std::shared_ptr<BufferPool>& buffer_pool();
+
+    /**
+     * @brief Return the cache of arrays opened for reading at a fixed
+     * timestamp range in this context. The cache holds at most
+     * `soma.array_cache_entries` arrays; it is disabled by default.
+     */
+    std::shared_ptr<ArrayCache>& array_cache();
+
+    // Config key to set the maximum number of bytes held by the buffer pool
+    inline static const std::string CONFIG_KEY_BUFFER_POOL_BYTES =
+        "soma.buffer_pool_bytes";
+
+    // Config key to set the maximum number of arrays held by the array cache
+    inline static const std::string CONFIG_KEY_ARRAY_CACHE_ENTRIES =
+        "soma.array_cache_entries";
+
    private:
     //===================================================================
     //= private non-static
     //===================================================================
 
+    /**
+     * @brief Return the non-negative integer value of a config key, or
+     * `default_value` if it is not set.
+     *
+     * @throws TileDBSOMAError if the value is not a non-negative integer
+     */
+    size_t config_size(const std::string& key, size_t default_value) const;
+
     // TileDB context
     std::shared_ptr<Context> ctx_;
 
@@ -86,6 +118,18 @@ class SOMAContext {
 
     // Semaphore to create and use the thread_pool
     std::mutex thread_pool_mutex_;
+
+    // Pool of read buffers
+    std::shared_ptr<BufferPool> buffer_pool_ = nullptr;
+
+    // Semaphore to create the buffer_pool
+    std::mutex buffer_pool_mutex_;
+
+    // Cache of opened arrays
+    std::shared_ptr<ArrayCache> array_cache_ = nullptr;
+
+    // Semaphore to create the array_cache
+    std::mutex array_cache_mutex_;
 };
 }  // namespace tiledbsoma
 
@@ -121,8 +121,13 @@ SOMAGroup::SOMAGroup(
 
 void SOMAGroup::fill_caches() {
     if (group_->query_type() == TILEDB_WRITE) {
+        // Read at the timestamp of the write handle, as a reader opened
+        // separately would
         cache_group_ = std::make_shared<Group>(
-            *ctx_->tiledb_ctx(), uri_, TILEDB_READ);
+            *ctx_->tiledb_ctx(),
+            uri_,
+            TILEDB_READ,
+            _set_timestamp(ctx_, timestamp_));
     } else {
         cache_group_ = group_;
     }
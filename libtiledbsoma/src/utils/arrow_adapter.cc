@@ -777,19 +777,16 @@ ArrowAdapter::to_arrow(std::shared_ptr<ColumnBuffer> column) {
     if (column->type() == TILEDB_DATETIME_DAY) {
         free((void*)schema->format);  // free the 'storage' format
         schema->format = strdup(to_arrow_format(column->type()).data());
-        // TODO: Put in ColumnBuffer
-        size_t n = array->length;
-        std::vector<int64_t> indata(n);
-        std::memcpy(
-            indata.data(), column->data<double>().data(), sizeof(int64_t) * n);
-        std::vector<int32_t> vec(n);
-        for (size_t i = 0; i < n; i++) {
-            vec[i] = static_cast<int32_t>(indata[i]);
+        // Narrow the int64 TileDB days to Arrow's int32 date32 in place. Each
+        // int32 is written at or before the int64 it is read from, so the
+        // values are converted without a temporary copy of the column.
+        auto bytes = (std::byte*)array->buffers[n_buffers - 1];
+        for (int64_t i = 0; i < array->length; i++) {
+            int64_t days;
+            std::memcpy(&days, bytes + i * sizeof(int64_t), sizeof(int64_t));
+            auto days32 = static_cast<int32_t>(days);
+            std::memcpy(bytes + i * sizeof(int32_t), &days32, sizeof(int32_t));
         }
-        std::memcpy(
-            (void*)array->buffers[n_buffers - 1],
-            vec.data(),
-            sizeof(int32_t) * n);
     }
 
     if (column->has_enumeration()) {
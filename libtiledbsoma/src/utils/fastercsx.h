@@ -0,0 +1,142 @@
+/**
+ * @file   fastercsx.h
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file defines conversion of sparse coordinate (COO) data to compressed
+ * sparse row/column (CSR/CSC) form.
+ */
+
+#ifndef TILEDBSOMA_FASTERCSX_H
+#define TILEDBSOMA_FASTERCSX_H
+
+#include <algorithm>
+#include <cstddef>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "common.h"
+
+namespace tiledbsoma::fastercsx {
+
+/**
+ * @brief Sort the minor indices (and their values) of each major-axis slice
+ * of a compressed sparse matrix. Slices already in order are left untouched.
+ *
+ * @param n_major Number of major-axis slices.
+ * @param Bp Offsets of each slice, length n_major + 1.
+ * @param Bj Minor indices, length Bp[n_major].
+ * @param Bd Values, length Bp[n_major].
+ */
+template <typename CSX_INDEX, typename VALUE>
+void sort_csx_indices(
+    size_t n_major, const CSX_INDEX* Bp, CSX_INDEX* Bj, VALUE* Bd) {
+    std::vector<std::pair<CSX_INDEX, VALUE>> scratch;
+    for (size_t i = 0; i < n_major; ++i) {
+        const auto lo = Bp[i];
+        const auto hi = Bp[i + 1];
+        if (std::is_sorted(Bj + lo, Bj + hi))
+            continue;
+
+        scratch.clear();
+        for (auto k = lo; k < hi; ++k)
+            scratch.emplace_back(Bj[k], Bd[k]);
+        std::sort(
+            scratch.begin(), scratch.end(), [](const auto& a, const auto& b) {
+                return a.first < b.first;
+            });
+        for (auto k = lo; k < hi; ++k) {
+            Bj[k] = scratch[k - lo].first;
+            Bd[k] = scratch[k - lo].second;
+        }
+    }
+}
+
+/**
+ * @brief Compress COO data into CSR (or, with the axes swapped, CSC) form
+ * with a counting sort: one pass to size each major-axis slice, one to
+ * scatter the minor indices and values into place. Minor indices are then
+ * sorted within each slice, so the result is in canonical form whatever the
+ * order of the input.
+ *
+ * The caller allocates the output: Bp of length n_major + 1, Bj and Bd of
+ * length nnz.
+ *
+ * @param n_major Size of the major axis.
+ * @param n_minor Size of the minor axis.
+ * @param nnz Number of coordinates.
+ * @param Ai Major-axis coordinates, in [0, n_major).
+ * @param Aj Minor-axis coordinates, in [0, n_minor).
+ * @param Ad Values.
+ * @param Bp Output slice offsets.
+ * @param Bj Output minor indices.
+ * @param Bd Output values.
+ */
+template <typename COO_INDEX, typename CSX_INDEX, typename VALUE>
+void compress_coo(
+    size_t n_major,
+    size_t n_minor,
+    size_t nnz,
+    const COO_INDEX* Ai,
+    const COO_INDEX* Aj,
+    const VALUE* Ad,
+    CSX_INDEX* Bp,
+    CSX_INDEX* Bj,
+    VALUE* Bd) {
+    std::fill(Bp, Bp + n_major + 1, 0);
+    for (size_t k = 0; k < nnz; ++k) {
+        if (Ai[k] < 0 || static_cast<size_t>(Ai[k]) >= n_major)
+            throw TileDBSOMAError(
+                "[compress_coo] major index " + std::to_string(Ai[k]) +
+                " out of range [0, " + std::to_string(n_major) + ")");
+        if (Aj[k] < 0 || static_cast<size_t>(Aj[k]) >= n_minor)
+            throw TileDBSOMAError(
+                "[compress_coo] minor index " + std::to_string(Aj[k]) +
+                " out of range [0, " + std::to_string(n_minor) + ")");
+        Bp[Ai[k] + 1]++;
+    }
+    for (size_t i = 0; i < n_major; ++i)
+        Bp[i + 1] += Bp[i];
+
+    // Bp[i] serves as the write cursor of slice i, leaving each offset at the
+    // end of its slice, i.e. shifted by one slice.
+    for (size_t k = 0; k < nnz; ++k) {
+        const auto dest = Bp[Ai[k]]++;
+        Bj[dest] = static_cast<CSX_INDEX>(Aj[k]);
+        Bd[dest] = Ad[k];
+    }
+    for (size_t i = n_major; i > 0; --i)
+        Bp[i] = Bp[i - 1];
+    Bp[0] = 0;
+
+    sort_csx_indices(n_major, Bp, Bj, Bd);
+}
+
+}  // namespace tiledbsoma::fastercsx
+
+#endif  // TILEDBSOMA_FASTERCSX_H
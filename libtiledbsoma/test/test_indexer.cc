@@ -31,8 +31,12 @@
  */
 
 #include <reindexer/reindexer.h>
+#include <soma/soma_context.h>
+#include <algorithm>
 #include <catch2/catch_test_macros.hpp>
 #include <cstdint>
+#include <numeric>
+#include <random>
 #include <string>
 #include <tiledb/tiledb>
 #include <unordered_map>
@@ -142,4 +146,96 @@ TEST_CASE("C++ re-indexer") {
         }
     }
 }
+
+TEST_CASE("C++ re-indexer: sharded build") {
+    // Enough keys, and threads, to split the hash table into shards
+    auto ctx = std::make_shared<tiledbsoma::SOMAContext>(
+        std::map<std::string, std::string>{
+            {"sm.compute_concurrency_level", "16"}});
+    std::vector<int64_t> keys(8 * tiledbsoma::IntIndexer::MIN_SHARD_KEYS);
+    std::iota(keys.begin(), keys.end(), -1000);
+    std::shuffle(keys.begin(), keys.end(), std::mt19937_64(1));
+
+    tiledbsoma::IntIndexer indexer(ctx);
+    indexer.map_locations(keys);
+
+    std::vector<int64_t> lookups(keys);
+    lookups.push_back(-1001);
+    std::vector<int64_t> results(lookups.size());
+    indexer.lookup(lookups, results);
+    for (size_t i = 0; i < keys.size(); i++) {
+        REQUIRE(results[i] == static_cast<int64_t>(i));
+    }
+    REQUIRE(results.back() == -1);
+
+    keys.back() = keys.front();
+    tiledbsoma::IntIndexer duplicates(ctx);
+    REQUIRE_THROWS_AS(duplicates.map_locations(keys), std::runtime_error);
+}
+
+TEST_CASE("C++ re-indexer: runs of sorted keys") {
+    // Three runs of 100 consecutive keys
+    std::vector<int64_t> keys;
+    for (int64_t start : {0, 500, 1000}) {
+        for (int64_t key = start; key < start + 100; key++) {
+            keys.push_back(key);
+        }
+    }
+    std::vector<int64_t> lookups{
+        -1, 0, 99, 100, 499, 500, 599, 600, 1000, 1099, 1100, INT64_MIN};
+    std::vector<int64_t> expected{
+        -1, 0, 99, -1, -1, 100, 199, -1, 200, 299, -1, -1};
+
+    tiledbsoma::IntIndexer indexer;
+    indexer.map_locations(keys);
+    REQUIRE(indexer.run_length_encoded());
+    std::vector<int64_t> results(lookups.size());
+    indexer.lookup(lookups, results);
+    REQUIRE(results == expected);
+
+    // A single run is looked up arithmetically
+    std::vector<int64_t> run(keys.begin() + 100, keys.begin() + 200);
+    indexer.map_locations(run);
+    REQUIRE(indexer.run_length_encoded());
+    indexer.lookup(lookups, results);
+    REQUIRE(
+        results ==
+        std::vector<int64_t>{-1, -1, -1, -1, -1, 0, 99, -1, -1, -1, -1, -1});
+
+    // Scattered or unsorted keys are hashed
+    std::vector<int64_t> scattered{0, 2, 4, 6, 8, 10};
+    indexer.map_locations(scattered);
+    REQUIRE(!indexer.run_length_encoded());
+    std::vector<int64_t> unsorted{2, 1, 0};
+    indexer.map_locations(unsorted);
+    REQUIRE(!indexer.run_length_encoded());
+    indexer.lookup(lookups, results);
+    REQUIRE(results[1] == 2);
+}
+
+TEST_CASE("C++ re-indexer: lookup of several spans") {
+    auto ctx = std::make_shared<tiledbsoma::SOMAContext>(
+        std::map<std::string, std::string>{
+            {"sm.compute_concurrency_level", "8"}});
+    std::vector<int64_t> keys(10000);
+    std::iota(keys.begin(), keys.end(), 0);
+    std::shuffle(keys.begin(), keys.end(), std::mt19937_64(2));
+
+    tiledbsoma::IntIndexer indexer(ctx);
+    indexer.map_locations(keys);
+
+    // Spans of varied sizes, including empty ones, smaller than and
+    // straddling the size of a task
+    std::vector<int64_t> results(keys.size(), -2);
+    std::vector<tiledbsoma::IntIndexer::LookupSpan> spans;
+    size_t offset = 0;
+    for (size_t size : {1, 0, 3, 5000, 17, 4979}) {
+        spans.push_back({keys.data() + offset, results.data() + offset, size});
+        offset += size;
+    }
+    indexer.lookup(spans);
+    for (size_t i = 0; i < keys.size(); i++) {
+        REQUIRE(results[i] == static_cast<int64_t>(i));
+    }
+}
 }  // namespace
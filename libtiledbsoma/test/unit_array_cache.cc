@@ -0,0 +1,132 @@
+/**
+ * @file   unit_array_cache.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file manages unit tests for the array cache
+ */
+
+#include <catch2/catch_test_macros.hpp>
+#include <tiledbsoma/tiledbsoma>
+
+using namespace tiledbsoma;
+
+namespace {
+
+std::string create_array(
+    const std::string& uri, std::shared_ptr<SOMAContext> ctx) {
+    ArraySchema schema(*ctx->tiledb_ctx(), TILEDB_SPARSE);
+    Domain domain(*ctx->tiledb_ctx());
+    domain.add_dimension(
+        Dimension::create<int64_t>(*ctx->tiledb_ctx(), "d0", {0, 1000}));
+    schema.set_domain(domain);
+    schema.add_attribute(Attribute::create<int>(*ctx->tiledb_ctx(), "a0"));
+    SOMAArray::create(ctx, uri, std::move(schema), "NONE", TimestampRange(0, 2))
+        ->close();
+    return uri;
+}
+
+std::unique_ptr<SOMAArray> open_array(
+    const std::string& uri,
+    std::shared_ptr<SOMAContext> ctx,
+    OpenMode mode,
+    TimestampRange timestamp) {
+    return SOMAArray::open(
+        mode,
+        uri,
+        ctx,
+        "unnamed",
+        {},
+        "auto",
+        ResultOrder::automatic,
+        timestamp);
+}
+
+}  // namespace
+
+TEST_CASE("ArrayCache: Share arrays opened at the same timestamp") {
+    auto ctx = std::make_shared<SOMAContext>(
+        std::map<std::string, std::string>{
+            {SOMAContext::CONFIG_KEY_ARRAY_CACHE_ENTRIES, "2"}});
+    auto uri = create_array("mem://unit-test-array-cache", ctx);
+    auto& cache = ctx->array_cache();
+    REQUIRE(cache->enabled());
+
+    auto first = open_array(uri, ctx, OpenMode::read, {0, 2});
+    REQUIRE(cache->stats().misses == 1);
+    REQUIRE(cache->stats().entries == 1);
+    first->close();
+
+    // The cached array stays open once its first user is closed
+    auto second = open_array(uri, ctx, OpenMode::read, {0, 2});
+    REQUIRE(cache->stats().hits == 1);
+    REQUIRE(second->nnz() == 0);
+
+    // Other timestamp ranges are cached separately
+    auto third = open_array(uri, ctx, OpenMode::read, {0, 3});
+    REQUIRE(cache->stats().misses == 2);
+    REQUIRE(cache->stats().entries == 2);
+
+    // Closing a write drops the cached arrays of its URI
+    open_array(uri, ctx, OpenMode::write, {0, 4})->close();
+    REQUIRE(cache->stats().invalidations == 2);
+    REQUIRE(cache->stats().entries == 0);
+    REQUIRE(second->nnz() == 0);
+    second->close();
+    third->close();
+
+    cache->clear();
+    REQUIRE(cache->stats().hits == 0);
+}
+
+TEST_CASE("ArrayCache: Evict least recently used arrays") {
+    auto ctx = std::make_shared<SOMAContext>(
+        std::map<std::string, std::string>{
+            {SOMAContext::CONFIG_KEY_ARRAY_CACHE_ENTRIES, "1"}});
+    auto uri = create_array("mem://unit-test-array-cache-lru", ctx);
+    auto& cache = ctx->array_cache();
+
+    open_array(uri, ctx, OpenMode::read, {0, 2})->close();
+    open_array(uri, ctx, OpenMode::read, {0, 3})->close();
+    REQUIRE(cache->stats().entries == 1);
+    open_array(uri, ctx, OpenMode::read, {0, 2})->close();
+    REQUIRE(cache->stats().hits == 0);
+    REQUIRE(cache->stats().misses == 3);
+
+    // A cache of size zero holds nothing
+    auto disabled_ctx = std::make_shared<SOMAContext>();
+    REQUIRE(!disabled_ctx->array_cache()->enabled());
+    open_array(uri, disabled_ctx, OpenMode::read, {0, 2})->close();
+    REQUIRE(disabled_ctx->array_cache()->stats().misses == 0);
+}
+
+TEST_CASE("ArrayCache: Invalid size in the context config") {
+    auto ctx = std::make_shared<SOMAContext>(
+        std::map<std::string, std::string>{
+            {SOMAContext::CONFIG_KEY_ARRAY_CACHE_ENTRIES, "some"}});
+    REQUIRE_THROWS_AS(ctx->array_cache(), TileDBSOMAError);
+}
@@ -0,0 +1,115 @@
+/**
+ * @file   unit_buffer_pool.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file manages unit tests for the buffer pool
+ */
+
+#include <catch2/catch_test_macros.hpp>
+#include <tiledbsoma/tiledbsoma>
+
+using namespace tiledbsoma;
+
+TEST_CASE("BufferPool: Reuse released buffers") {
+    BufferPool pool;
+
+    auto buffer = pool.acquire<std::byte>(100000);
+    REQUIRE(buffer.empty());
+    REQUIRE(buffer.capacity() >= 100000);
+    auto data = buffer.data();
+    REQUIRE(pool.stats().misses == 1);
+
+    pool.release(std::move(buffer));
+    REQUIRE(pool.stats().buffers_held == 1);
+    REQUIRE(pool.stats().bytes_held >= 100000);
+
+    // A request in the same size class reuses the buffer
+    auto reused = pool.acquire<std::byte>(80000);
+    REQUIRE(reused.data() == data);
+    REQUIRE(pool.stats().hits == 1);
+    REQUIRE(pool.stats().buffers_held == 0);
+    REQUIRE(pool.stats().bytes_held == 0);
+
+    // A larger request does not
+    pool.release(std::move(reused));
+    auto larger = pool.acquire<std::byte>(200000);
+    REQUIRE(larger.capacity() >= 200000);
+    REQUIRE(pool.stats().hits == 1);
+    REQUIRE(pool.stats().misses == 2);
+
+    // Buffers of each element type are pooled separately
+    auto offsets = pool.acquire<uint64_t>(1000);
+    REQUIRE(pool.stats().misses == 3);
+    pool.release(std::move(offsets));
+    REQUIRE(pool.stats().buffers_held == 2);
+
+    pool.clear();
+    REQUIRE(pool.stats().buffers_held == 0);
+    REQUIRE(pool.stats().bytes_held == 0);
+    REQUIRE(pool.stats().hits == 0);
+}
+
+TEST_CASE("BufferPool: Limit held bytes") {
+    BufferPool pool(1 << 20);
+
+    auto first = pool.acquire<std::byte>(600000);
+    auto second = pool.acquire<std::byte>(600000);
+    pool.release(std::move(first));
+    pool.release(std::move(second));
+    REQUIRE(pool.stats().buffers_held == 1);
+    REQUIRE(pool.stats().bytes_held <= 1 << 20);
+
+    // Small buffers are not pooled
+    auto small = pool.acquire<uint8_t>(16);
+    REQUIRE(small.capacity() >= 16);
+    pool.release(std::move(small));
+    REQUIRE(pool.stats().buffers_held == 1);
+
+    // A pool of size zero holds nothing
+    BufferPool disabled(0);
+    auto buffer = disabled.acquire<std::byte>(600000);
+    REQUIRE(buffer.capacity() < 1 << 20);
+    disabled.release(std::move(buffer));
+    REQUIRE(disabled.stats().buffers_held == 0);
+}
+
+TEST_CASE("BufferPool: Size from the context config") {
+    auto ctx = std::make_shared<SOMAContext>(
+        std::map<std::string, std::string>{
+            {SOMAContext::CONFIG_KEY_BUFFER_POOL_BYTES, "0"}});
+    auto buffer = ctx->buffer_pool()->acquire<std::byte>(600000);
+    ctx->buffer_pool()->release(std::move(buffer));
+    REQUIRE(ctx->buffer_pool()->stats().buffers_held == 0);
+
+    for (std::string value : {"lots", "-1", "12kb"}) {
+        auto bad_ctx = std::make_shared<SOMAContext>(
+            std::map<std::string, std::string>{
+                {SOMAContext::CONFIG_KEY_BUFFER_POOL_BYTES, value}});
+        REQUIRE_THROWS_AS(bad_ctx->buffer_pool(), TileDBSOMAError);
+    }
+}
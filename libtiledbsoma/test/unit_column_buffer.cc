@@ -98,4 +98,23 @@ TEST_CASE("ColumnBuffer: Create from array") {
         REQUIRE(buffers->is_var() == true);
         REQUIRE(buffers->is_nullable() == true);
     }
-}
\ No newline at end of file
+}
+TEST_CASE("ColumnBuffer: Allocate from buffer pool") {
+    std::string uri = "mem://unit-test-array";
+    auto ctx = Context();
+    auto array = create_array(uri, ctx);
+    auto pool = std::make_shared<BufferPool>();
+
+    {
+        auto buffers = ColumnBuffer::create(array, "a1", 1000, 1 << 16, pool);
+        REQUIRE(buffers->name() == "a1");
+        REQUIRE(pool->stats().misses == 2);
+    }
+    REQUIRE(pool->stats().buffers_held == 2);
+
+    {
+        auto buffers = ColumnBuffer::create(array, "a1", 1000, 1 << 16, pool);
+        REQUIRE(pool->stats().hits == 2);
+        REQUIRE(pool->stats().buffers_held == 0);
+    }
+}
@@ -0,0 +1,117 @@
+/**
+ * @file   unit_fastercsx.cc
+ *
+ * @section LICENSE
+ *
+ * The MIT License
+ *
+ * @copyright Copyright (c) 2024 TileDB, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ *
+ * @section DESCRIPTION
+ *
+ * This file manages unit tests for COO to CSR/CSC compression
+ */
+
+#include <catch2/catch_test_macros.hpp>
+#include <tiledbsoma/tiledbsoma>
+
+using namespace tiledbsoma;
+
+TEST_CASE("fastercsx: Compress unordered COO") {
+    // 3 x 4 matrix
+    //   [[5, 0, 0, 2],
+    //    [0, 0, 4, 0],
+    //    [3, 1, 0, 0]]
+    std::vector<int64_t> Ai{2, 0, 2, 1, 0};
+    std::vector<int64_t> Aj{1, 3, 0, 2, 0};
+    std::vector<float> Ad{1, 2, 3, 4, 5};
+
+    std::vector<int32_t> Bp(4);
+    std::vector<int32_t> Bj(5);
+    std::vector<float> Bd(5);
+    fastercsx::compress_coo(
+        3,
+        4,
+        Ad.size(),
+        Ai.data(),
+        Aj.data(),
+        Ad.data(),
+        Bp.data(),
+        Bj.data(),
+        Bd.data());
+
+    REQUIRE(Bp == std::vector<int32_t>{0, 2, 3, 5});
+    REQUIRE(Bj == std::vector<int32_t>{0, 3, 2, 0, 1});
+    REQUIRE(Bd == std::vector<float>{5, 2, 4, 3, 1});
+}
+
+TEST_CASE("fastercsx: Empty major slices") {
+    std::vector<int64_t> Ai{3, 1};
+    std::vector<int64_t> Aj{0, 0};
+    std::vector<int64_t> Ad{7, 8};
+
+    std::vector<int64_t> Bp(6);
+    std::vector<int64_t> Bj(2);
+    std::vector<int64_t> Bd(2);
+    fastercsx::compress_coo(
+        5,
+        1,
+        Ad.size(),
+        Ai.data(),
+        Aj.data(),
+        Ad.data(),
+        Bp.data(),
+        Bj.data(),
+        Bd.data());
+
+    REQUIRE(Bp == std::vector<int64_t>{0, 0, 1, 1, 2, 2});
+    REQUIRE(Bd == std::vector<int64_t>{8, 7});
+}
+
+TEST_CASE("fastercsx: Out of range coordinates") {
+    std::vector<int64_t> Ai{0, -1};
+    std::vector<int64_t> Aj{0, 1};
+    std::vector<double> Ad{1, 2};
+
+    std::vector<int32_t> Bp(3);
+    std::vector<int32_t> Bj(2);
+    std::vector<double> Bd(2);
+    auto compress = [&]() {
+        fastercsx::compress_coo(
+            2,
+            2,
+            Ad.size(),
+            Ai.data(),
+            Aj.data(),
+            Ad.data(),
+            Bp.data(),
+            Bj.data(),
+            Bd.data());
+    };
+
+    // An unknown joinid is reindexed to -1
+    REQUIRE_THROWS_AS(compress(), TileDBSOMAError);
+    Ai[1] = 1;
+    Aj[1] = 2;
+    REQUIRE_THROWS_AS(compress(), TileDBSOMAError);
+    Aj[1] = 1;
+    REQUIRE_NOTHROW(compress());
+}
@@ -184,3 +184,31 @@ TEST_CASE("ManagedQuery: Validity test") {
     REQUIRE_THAT(a0, Equals(mq.strings("a0")));
     REQUIRE_THAT(a0_valids, Equals(a0_valids_actual));
 }
+
+TEST_CASE("ManagedQuery: Read memory budget test") {
+    // A budget smaller than two cells of buffers reads one cell at a time
+    std::string uri = "mem://unit-test-array";
+    auto ctx = std::make_shared<Context>(
+        Config({{"soma.read_memory_budget", "32"}}));
+    auto [array, d0, a0, _] = create_array(uri, *ctx);
+
+    auto mq = ManagedQuery(array, ctx);
+    std::vector<std::string> d0_actual, a0_actual;
+    size_t batches = 0;
+    while (!mq.is_complete(true)) {
+        mq.setup_read();
+        mq.submit_read();
+        auto results = mq.results();
+        REQUIRE(results->num_rows() == 1);
+        auto d0_batch = mq.strings("d0");
+        auto a0_batch = mq.strings("a0");
+        d0_actual.insert(d0_actual.end(), d0_batch.begin(), d0_batch.end());
+        a0_actual.insert(a0_actual.end(), a0_batch.begin(), a0_batch.end());
+        ++batches;
+    }
+
+    REQUIRE(batches == d0.size());
+    REQUIRE(mq.total_num_cells() == d0.size());
+    REQUIRE_THAT(d0, Equals(d0_actual));
+    REQUIRE_THAT(a0, Equals(a0_actual));
+}
@@ -443,6 +443,105 @@ TEST_CASE("SOMAArray: Test buffer size") {
     soma_array->close();
 }
 
+TEST_CASE("SOMAArray: Prefetch") {
+    // Read one cell per batch so that each read_next call after the first
+    // returns a batch that was submitted by the previous call
+    std::map<std::string, std::string> cfg;
+    cfg["soma.init_buffer_bytes"] = "8";
+    cfg["soma.read_prefetch"] = "true";
+    auto ctx = std::make_shared<SOMAContext>(cfg);
+
+    std::string base_uri = "mem://unit-test-array-prefetch";
+    auto [uri, expected_nnz] = create_array(base_uri, ctx);
+    auto [expected_d0, expected_a0] = write_array(uri, ctx);
+    auto soma_array = SOMAArray::open(OpenMode::read, uri, ctx);
+    REQUIRE(soma_array->prefetch());
+
+    auto prefetch = GENERATE(true, false);
+    soma_array->set_prefetch(prefetch);
+    REQUIRE(soma_array->prefetch() == prefetch);
+
+    std::vector<int64_t> d0col;
+    std::vector<int> a0col;
+    size_t loops = 0;
+    while (auto batch = soma_array->read_next()) {
+        auto arrbuf = batch.value();
+        REQUIRE(arrbuf->num_rows() == 1);
+        auto d0span = arrbuf->at("d0")->data<int64_t>();
+        auto a0span = arrbuf->at("a0")->data<int>();
+        d0col.insert(d0col.end(), d0span.begin(), d0span.end());
+        a0col.insert(a0col.end(), a0span.begin(), a0span.end());
+        ++loops;
+    }
+    REQUIRE(loops == expected_nnz);
+    REQUIRE(d0col == expected_d0);
+    REQUIRE(a0col == expected_a0);
+
+    // Resetting with a batch in flight starts a new query
+    soma_array->reset();
+    soma_array->read_next();
+    soma_array->reset();
+    REQUIRE(soma_array->read_next().value()->num_rows() == 1);
+    soma_array->close();
+}
+
+TEST_CASE("SOMAArray: Submit next") {
+    std::map<std::string, std::string> cfg;
+    cfg["soma.init_buffer_bytes"] = "8";
+    auto ctx = std::make_shared<SOMAContext>(cfg);
+
+    std::string base_uri = "mem://unit-test-array-submit-next";
+    auto [uri, expected_nnz] = create_array(base_uri, ctx);
+    auto [expected_d0, expected_a0] = write_array(uri, ctx);
+    auto soma_array = SOMAArray::open(OpenMode::read, uri, ctx);
+    soma_array->set_prefetch(GENERATE(true, false));
+
+    std::vector<int64_t> d0col;
+    while (soma_array->submit_next()) {
+        // A read is running; wait for its callbacks before collecting it. A
+        // second submit of the same read adds a callback to it.
+        std::promise<void> done, done_again;
+        soma_array->on_read_done([&done]() { done.set_value(); });
+        REQUIRE(soma_array->submit_next());
+        soma_array->on_read_done([&done_again]() { done_again.set_value(); });
+        done.get_future().wait();
+        done_again.get_future().wait();
+
+        auto arrbuf = soma_array->read_next().value();
+        auto d0span = arrbuf->at("d0")->data<int64_t>();
+        d0col.insert(d0col.end(), d0span.begin(), d0span.end());
+    }
+    REQUIRE(d0col == expected_d0);
+    REQUIRE(!soma_array->read_next().has_value());
+
+    // With no read running, the callback is called right away
+    bool called = false;
+    soma_array->on_read_done([&called]() { called = true; });
+    REQUIRE(called);
+    soma_array->close();
+}
+
+TEST_CASE("SOMAArray: Select points") {
+    auto ctx = std::make_shared<SOMAContext>();
+    std::string base_uri = "mem://unit-test-array-points";
+    auto [uri, expected_nnz] = create_array(base_uri, ctx);
+    write_array(uri, ctx);
+    auto soma_array = SOMAArray::open(
+        OpenMode::read, uri, ctx, "", {}, "auto", ResultOrder::rowmajor);
+
+    // Unsorted and duplicated points are coalesced into ranges
+    std::vector<int64_t> points = {7, 2, 3, 9, 2, 8, 0, 42};
+    soma_array->set_dim_points<int64_t>("d0", points);
+
+    std::vector<int64_t> d0col;
+    while (auto batch = soma_array->read_next()) {
+        auto d0span = batch.value()->at("d0")->data<int64_t>();
+        d0col.insert(d0col.end(), d0span.begin(), d0span.end());
+    }
+    REQUIRE(d0col == std::vector<int64_t>{0, 2, 3, 7, 8, 9});
+    soma_array->close();
+}
+
 TEST_CASE("SOMAArray: Enumeration") {
     std::string uri = "mem://unit-test-array-enmr";
     auto ctx = std::make_shared<SOMAContext>();